@@ -0,0 +1,10 @@
+\connect ads;
+
+-- ------------------------
+-- Индексы keyset-пагинации ленты объявлений (GET /api/ads с cursor).
+-- Ключ сортировки замыкается id, поэтому условие (key, id) > (:key, :id)
+-- и ORDER BY key, id идут по одному индексу в обе стороны.
+-- CONCURRENTLY не блокирует запись при накате на рабочую базу.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ads_created_at_id_idx ON "Ads" (created_at, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ads_price_id_idx ON "Ads" (price, id);
@@ -0,0 +1,71 @@
+\connect ads;
+
+-- ------------------------
+-- Счётчики просмотров и комментариев выносятся из широкой строки "Ads"
+-- (description не ограничен по длине) в узкую таблицу. fillfactor 50
+-- оставляет на странице место под новую версию строки, а счётчики не входят
+-- ни в один индекс, поэтому их обновление остаётся HOT-обновлением и не
+-- раздувает таблицу и индексы "Ads".
+--
+-- Миграция выполняется одной транзакцией и может быть запущена повторно.
+-- Триггер создаётся до переноса счётчиков: CREATE TRIGGER блокирует вставку
+-- в "Ads" до конца транзакции, поэтому объявлений без строки счётчиков не
+-- остаётся.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS "AdsStats"
+(
+    ads_id              uuid            PRIMARY KEY REFERENCES "Ads" (id) ON DELETE CASCADE,
+    count_views         INT             NOT NULL DEFAULT 0,
+    count_comments      INT             NOT NULL DEFAULT 0
+) WITH (fillfactor = 50);
+--
+COMMENT ON TABLE "AdsStats" is 'Таблица счётчиков объявления';
+COMMENT ON COLUMN "AdsStats".ads_id is 'ID объявления';
+COMMENT ON COLUMN "AdsStats".count_views is 'Количество просмотров объявления';
+COMMENT ON COLUMN "AdsStats".count_comments is 'Количество комментариев';
+
+-- ------------------------
+-- Строка счётчиков создаётся вместе с объявлением при любом способе вставки.
+
+CREATE OR REPLACE FUNCTION ads_stats_create() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO "AdsStats" (ads_id) VALUES (NEW.id) ON CONFLICT (ads_id) DO NOTHING;
+    RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS ads_stats_create ON "Ads";
+CREATE TRIGGER ads_stats_create
+    AFTER INSERT ON "Ads"
+    FOR EACH ROW EXECUTE FUNCTION ads_stats_create();
+
+-- ------------------------
+-- Перенос счётчиков из "Ads", пока колонки ещё есть (при повторном запуске их
+-- уже нет), затем строки для объявлений, у которых их по какой-то причине нет.
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'Ads' AND column_name = 'count_views'
+    ) THEN
+        INSERT INTO "AdsStats" (ads_id, count_views, count_comments)
+        SELECT id, count_views, count_comments FROM "Ads"
+        ON CONFLICT (ads_id) DO NOTHING;
+
+        ALTER TABLE "Ads" DROP COLUMN count_views, DROP COLUMN count_comments;
+    END IF;
+END;
+$$;
+
+INSERT INTO "AdsStats" (ads_id)
+SELECT id FROM "Ads"
+ON CONFLICT (ads_id) DO NOTHING;
+
+-- ------------------------
+
+GRANT SELECT, INSERT, UPDATE, DELETE, TRUNCATE ON "AdsStats" TO ads;
+
+COMMIT;
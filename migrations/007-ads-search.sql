@@ -0,0 +1,20 @@
+\connect ads;
+
+-- ------------------------
+-- Полнотекстовый поиск по объявлениям (GET /api/ads/search).
+-- search_vector — генерируемая колонка: Postgres сам пересчитывает её при
+-- вставке и изменении title/description, поэтому отдельного обновления в
+-- create_ads/update_ads не нужно. Заголовок весит больше описания (A > B).
+-- Конфигурация russian стеммит и кириллицу, и латиницу (english_stem).
+-- Добавление STORED-колонки переписывает таблицу: накатывать в окно
+-- обслуживания.
+
+ALTER TABLE "Ads" ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('russian', title), 'A') ||
+        setweight(to_tsvector('russian', description), 'B')
+    ) STORED;
+--
+COMMENT ON COLUMN "Ads".search_vector is 'Поисковый вектор заголовка и описания';
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ads_search_vector_idx ON "Ads" USING GIN (search_vector);
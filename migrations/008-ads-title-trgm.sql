@@ -0,0 +1,23 @@
+\connect ads;
+
+-- ------------------------
+-- Подсказки по заголовку объявления (GET /api/ads/suggest).
+-- Триграммный GIN-индекс обслуживает и префикс title ILIKE 'абв%', и
+-- нечёткое совпадение слов (оператор <%) одним сканированием индекса.
+-- Подсказки, как и лента, не показывают помеченные удалёнными объявления,
+-- поэтому индексы частичные (NOT is_deleted).
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ads_title_trgm_idx
+    ON "Ads" USING GIN (title gin_trgm_ops) WHERE NOT is_deleted;
+
+-- Из префикса в один-два символа не извлечь ни одной полной триграммы, и
+-- ILIKE 'а%' по GIN-индексу вырождается в чтение всего индекса. Короткие
+-- префиксы ищутся по B-tree: диапазонное сканирование по lower(title) сразу
+-- в нужном порядке, с остановкой на LIMIT. Правило сортировки "C" позволяет
+-- индексу обслуживать и LIKE 'а%', и ORDER BY (text_pattern_ops даёт только
+-- первое).
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ads_title_prefix_idx
+    ON "Ads" ((lower(title) COLLATE "C")) WHERE NOT is_deleted;
@@ -0,0 +1,28 @@
+\connect ads;
+
+-- ------------------------
+-- Индексы ленты объявлений (GET /api/ads) под все сочетания QFilter.
+-- Лента не показывает помеченные удалёнными объявления (NOT is_deleted),
+-- поэтому индексы частичные и не содержат таких строк.
+--
+--   сортировка \ фильтр | нет / цена               | категория (+ цена)
+--   created_at DESC      | ads_feed_created_idx     | ads_feed_category_created_idx
+--   price ASC | DESC     | ads_feed_price_idx       | ads_feed_category_price_idx
+--
+-- Ключ сортировки замыкается id (keyset-курсор). Диапазон цены без
+-- сортировки по цене идёт по ads_feed_price_idx или по индексу сортировки с
+-- фильтром, в зависимости от селективности. Подсчёт total по тем же условиям
+-- покрывается ключами индексов (index only scan).
+-- Прежние полные индексы из 005 заменяются частичными.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ads_feed_created_idx
+    ON "Ads" (created_at, id) WHERE NOT is_deleted;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ads_feed_price_idx
+    ON "Ads" (price, id) WHERE NOT is_deleted;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ads_feed_category_created_idx
+    ON "Ads" (ads_category, created_at, id) WHERE NOT is_deleted;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ads_feed_category_price_idx
+    ON "Ads" (ads_category, price, id) WHERE NOT is_deleted;
+
+DROP INDEX CONCURRENTLY IF EXISTS ads_created_at_id_idx;
+DROP INDEX CONCURRENTLY IF EXISTS ads_price_id_idx;
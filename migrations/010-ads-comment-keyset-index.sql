@@ -0,0 +1,11 @@
+\connect ads;
+
+-- ------------------------
+-- Keyset-пагинация комментариев объявления (GET /api/ads/{ads_id}/commentaries).
+-- Страница выбирается по ads_id и (created_at, id) в любом направлении одним
+-- индексом; ведущая ads_id покрывает и поиск комментариев объявления, поэтому
+-- прежний индекс только по ads_id больше не нужен.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ads_comment_ads_created_id_idx
+    ON "AdsComment" (ads_id, created_at, id);
+DROP INDEX CONCURRENTLY IF EXISTS "AdsComment_ads_id_idx";
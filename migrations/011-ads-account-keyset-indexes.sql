@@ -0,0 +1,16 @@
+\connect ads;
+
+-- ------------------------
+-- Keyset-пагинация объявлений аккаунта (GET /api/ads/author, GET /api/ads/me).
+-- Страница выбирается по account_id и ключу сортировки (created_at, id) или
+-- (price, id) в любом направлении. Список аккаунта показывает и помеченные
+-- удалёнными объявления, поэтому индексы полные, в отличие от индексов ленты.
+-- Количество объявлений аккаунта (total страницы, /api/ads/count/author и
+-- /count/authors) считается index only scan по ведущей account_id, поэтому
+-- прежний индекс только по account_id больше не нужен.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ads_account_created_id_idx
+    ON "Ads" (account_id, created_at, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ads_account_price_id_idx
+    ON "Ads" (account_id, price, id);
+DROP INDEX CONCURRENTLY IF EXISTS "Ads_account_id_idx";
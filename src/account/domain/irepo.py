@@ -1,17 +1,16 @@
 from uuid import UUID
 
 from ..domain.dto import QEmailSignupData
-from ..infra.xdao import XAccount, XAccountID
+from ..infra.xdao import XAccount, XAccountID, XCounterDrift
 
 
 class IAccRepo:
     """Интерфейс репозитория для работы с пользовательскими аккаунтами."""
 
-    async def get_account_by_id(self, count_ads: int, acc_id: UUID) -> XAccount:
+    async def get_account_by_id(self, acc_id: UUID) -> XAccount:
         """Получает аккаунт по его ID.
 
         Args:
-            count_ads (int): Количество объявлений для выборки (например, для вложенных данных).
             acc_id (UUID): Уникальный идентификатор аккаунта.
 
         Returns:
@@ -19,14 +18,11 @@ class IAccRepo:
         """
         raise NotImplementedError
 
-    async def get_account_by_email(
-        self, email: str, count_ads: int | None = None
-    ) -> XAccount:
+    async def get_account_by_email(self, email: str) -> XAccount:
         """Получает аккаунт по email.
 
         Args:
             email (str): Электронная почта пользователя.
-            count_ads (int | None): Количество объявлений для выборки (необязательно).
 
         Returns:
             XAccount: Объект аккаунта.
@@ -74,14 +70,36 @@ class IAccRepo:
         """
         raise NotImplementedError
 
-    async def get_current_account(self, count_ads: int, acc_id: UUID) -> XAccount:
-        """Получает текущий аккаунт по ID с учётом количества объявлений.
+    async def get_current_account(self, acc_id: UUID) -> XAccount:
+        """Получает текущий аккаунт по ID.
 
         Args:
-            count_ads (int): Количество объявлений для выборки.
             acc_id (UUID): Уникальный идентификатор аккаунта.
 
         Returns:
             XAccount: Объект текущего аккаунта.
         """
         raise NotImplementedError
+
+    async def get_account_ids(self, after: UUID, chunk_size: int) -> list[UUID]:
+        """Возвращает пачку идентификаторов аккаунтов по возрастанию.
+
+        Args:
+            after (UUID): ID, после которого начинается пачка.
+            chunk_size (int): Размер пачки.
+
+        Returns:
+            list[UUID]: Идентификаторы аккаунтов.
+        """
+        raise NotImplementedError
+
+    async def fix_count_ads(self, counts: dict[UUID, int]) -> list[XCounterDrift]:
+        """Записывает фактическое количество объявлений, если оно отличается.
+
+        Args:
+            counts (dict[UUID, int]): Количество объявлений по ID аккаунта.
+
+        Returns:
+            list[XCounterDrift]: Исправленные счётчики.
+        """
+        raise NotImplementedError
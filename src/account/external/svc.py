@@ -1,23 +1,33 @@
 from uuid import UUID
 import httpx
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from kernel.endpoints import Endpoints as Enp
 from kernel.exception import ExpError
+from kernel.metrics import observe_call
+from kernel.pg import DB_ACC, session_scope
 
-from ..domain.dto import QEmailSignupData, ZAccount
+from ..domain.dto import QEmail, QEmailSignupData, ZAccount
+from ..infra.repo import AccRepo
+from ..internal.uc import AccUseCase
 
 
 class AccService:
     """Сервис для работы с аккаунтами через внешнее API."""
 
-    def __init__(self, _base_url: str):
+    def __init__(self, _base_url: str, _client: httpx.AsyncClient, _timeout: float):
         """Инициализирует сервис аккаунтов с базовым URL API.
 
         Args:
             _base_url (str): Базовый URL API сервиса аккаунтов.
+            _client (httpx.AsyncClient): Общий HTTP-клиент процесса.
+            _timeout (float): Таймаут запросов к сервису, сек.
         """
         self.base_url = _base_url
+        self.client = _client
+        self.timeout = _timeout
 
+    @observe_call("account", "http")
     async def is_email_busy(self, email: str) -> bool:
         """Проверяет, занят ли email в системе.
 
@@ -35,14 +45,14 @@ class AccService:
             ValueError: При некорректном формате ответа API.
         """
         url = self.base_url + Enp.ACCOUNT_IS_EMAIL_BUSY.format(email=email)
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(url)
-            resp_js = resp.json()
-            if not resp_js["ok"]:
-                raise ExpError(code_msg=(resp_js["err"]["code"], resp_js["err"]["msg"]))
-            res = resp_js["payload"]
-            return res.get("is_busy", False)
-
+        resp = await self.client.post(url, timeout=self.timeout)
+        resp_js = resp.json()
+        if not resp_js["ok"]:
+            raise ExpError(code_msg=(resp_js["err"]["code"], resp_js["err"]["msg"]))
+        res = resp_js["payload"]
+        return res.get("is_busy", False)
+
+    @observe_call("account", "http")
     async def copy_account_from_signup(self, signup: QEmailSignupData) -> UUID:
         """Создает новый аккаунт на основе данных регистрации.
 
@@ -60,14 +70,16 @@ class AccService:
             ValueError: При некорректном формате ответа API.
         """
         url = self.base_url + Enp.ACCOUNT_COPY_FOR_SIGNUP
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(url, json=signup.model_dump(mode="json"))
-            resp_js = resp.json()
-            if not resp_js["ok"]:
-                raise ExpError(code_msg=(resp_js["err"]["code"], resp_js["err"]["msg"]))
-            res = resp_js["payload"]
-            return res.get("id")
-
+        resp = await self.client.post(
+            url, json=signup.model_dump(mode="json"), timeout=self.timeout
+        )
+        resp_js = resp.json()
+        if not resp_js["ok"]:
+            raise ExpError(code_msg=(resp_js["err"]["code"], resp_js["err"]["msg"]))
+        res = resp_js["payload"]
+        return res.get("id")
+
+    @observe_call("account", "http")
     async def get_account_by_email(self, email: str) -> ZAccount:
         """Получает информацию об аккаунте по email.
 
@@ -85,10 +97,65 @@ class AccService:
             ValueError: При некорректном формате ответа API.
         """
         url = self.base_url + Enp.ACCOUNT_GET_BY_EMAIL.format(email=email)
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(url)
-            resp_js = resp.json()
-            if not resp_js["ok"]:
-                raise ExpError(code_msg=(resp_js["err"]["code"], resp_js["err"]["msg"]))
-            res = resp_js["payload"]
-            return ZAccount.model_validate(res)
+        resp = await self.client.get(url, timeout=self.timeout)
+        resp_js = resp.json()
+        if not resp_js["ok"]:
+            raise ExpError(code_msg=(resp_js["err"]["code"], resp_js["err"]["msg"]))
+        res = resp_js["payload"]
+        return ZAccount.model_validate(res)
+
+
+class AccLocalService:
+    """Сервис для работы с аккаунтами внутри процесса.
+
+    Вызывает AccUseCase напрямую, без HTTP-запроса к API. Используется, когда
+    сервис аккаунтов смонтирован в том же приложении (SVC_TRANSPORT=local).
+    """
+
+    def _uc(self, session: AsyncSession) -> AccUseCase:
+        """Создаёт AccUseCase поверх сессии БД аккаунтов."""
+        return AccUseCase(AccRepo(session))
+
+    @observe_call("account", "local")
+    async def is_email_busy(self, email: str) -> bool:
+        """Проверяет, занят ли email в системе.
+
+        Args:
+            email (str): Email для проверки.
+
+        Returns:
+            bool: True если email уже занят, False если свободен.
+        """
+        async with session_scope(DB_ACC, readonly=True) as session:
+            res = await self._uc(session).is_email_busy(QEmail(email=email))
+        return res.is_busy
+
+    @observe_call("account", "local")
+    async def copy_account_from_signup(self, signup: QEmailSignupData) -> UUID:
+        """Создает новый аккаунт на основе данных регистрации.
+
+        Args:
+            signup (QEmailSignupData): Данные регистрации.
+
+        Returns:
+            UUID: Уникальный идентификатор созданного аккаунта.
+        """
+        async with session_scope(DB_ACC) as session:
+            res = await self._uc(session).copy_account_from_signup(signup)
+        return res.id
+
+    @observe_call("account", "local")
+    async def get_account_by_email(self, email: str) -> ZAccount:
+        """Получает информацию об аккаунте по email.
+
+        Args:
+            email (str): Email аккаунта для поиска.
+
+        Returns:
+            ZAccount: Объект с полной информацией об аккаунте.
+
+        Raises:
+            ExpError: Если аккаунт не найден.
+        """
+        async with session_scope(DB_ACC) as session:
+            return await self._uc(session).get_account_by_email(QEmail(email=email))
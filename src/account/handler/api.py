@@ -2,15 +2,7 @@ from uuid import UUID
 from typing import Annotated
 from fastapi import APIRouter, Depends, Path, Body, Query
 
-from kernel.depends import (
-    get_account_repo_session,
-    get_ads_serivce,
-    AdsService,
-    get_compl_serivce,
-    ComplService,
-    get_tg_bot,
-    TgClient,
-)
+from kernel.depends import get_account_repo_session, get_account_repo_read_session
 from kernel.endpoints import Endpoints as Enp
 from kernel.response import responses, SuccessResp
 from kernel.security import AJwt
@@ -56,12 +48,9 @@ tags = {"name": "account", "description": "Внутренние эндпоинт
 async def get_account_by_id(
     acc_id: Annotated[UUID, Path()],
     __repo_session: Annotated[AsyncSession, Depends(get_account_repo_session)],
-    __ads_svc: Annotated[AdsService, Depends(get_ads_serivce)],
-    __compl_svc: Annotated[ComplService, Depends(get_compl_serivce)],
-    __tg_svc: Annotated[TgClient, Depends(get_tg_bot)],
 ) -> SuccessResp[ZAccount]:
     """Обрабатывает HTTP-запрос на получение аккаунта по его ID."""
-    uc = AccUseCase(AccRepo(__repo_session), __ads_svc, __compl_svc, __tg_svc)
+    uc = AccUseCase(AccRepo(__repo_session))
     res = await uc.get_account_by_id(acc_id)
     return SuccessResp[ZAccount](payload=res)
 
@@ -75,12 +64,9 @@ async def get_account_by_id(
 async def get_account_by_email(
     req: Annotated[QEmail, Path()],
     __repo_session: Annotated[AsyncSession, Depends(get_account_repo_session)],
-    __ads_svc: Annotated[AdsService, Depends(get_ads_serivce)],
-    __compl_svc: Annotated[ComplService, Depends(get_compl_serivce)],
-    __tg_svc: Annotated[TgClient, Depends(get_tg_bot)],
 ) -> SuccessResp[ZAccount]:
     """Обрабатывает HTTP-запрос на получение аккаунта по email."""
-    uc = AccUseCase(AccRepo(__repo_session), __ads_svc, __compl_svc, __tg_svc)
+    uc = AccUseCase(AccRepo(__repo_session))
     res = await uc.get_account_by_email(req)
     return SuccessResp[ZAccount](payload=res)
 
@@ -94,12 +80,9 @@ async def get_account_by_email(
 async def copy_account_from_signup(
     req: Annotated[QEmailSignupData, Body()],
     __repo_session: Annotated[AsyncSession, Depends(get_account_repo_session)],
-    __ads_svc: Annotated[AdsService, Depends(get_ads_serivce)],
-    __compl_svc: Annotated[ComplService, Depends(get_compl_serivce)],
-    __tg_svc: Annotated[TgClient, Depends(get_tg_bot)],
 ) -> SuccessResp[ZAccountID]:
     """Обрабатывает HTTP-запрос на копирование аккаунта после регистрации."""
-    uc = AccUseCase(AccRepo(__repo_session), __ads_svc, __compl_svc, __tg_svc)
+    uc = AccUseCase(AccRepo(__repo_session))
     res = await uc.copy_account_from_signup(req)
     return SuccessResp[ZAccountID](payload=res)
 
@@ -113,12 +96,9 @@ async def copy_account_from_signup(
 async def is_email_busy(
     req: Annotated[QEmail, Path()],
     __repo_session: Annotated[AsyncSession, Depends(get_account_repo_session)],
-    __ads_svc: Annotated[AdsService, Depends(get_ads_serivce)],
-    __compl_svc: Annotated[ComplService, Depends(get_compl_serivce)],
-    __tg_svc: Annotated[TgClient, Depends(get_tg_bot)],
 ) -> SuccessResp[ZIsBusy]:
     """Обрабатывает HTTP-запрос на проверку существования email."""
-    uc = AccUseCase(AccRepo(__repo_session), __ads_svc, __compl_svc, __tg_svc)
+    uc = AccUseCase(AccRepo(__repo_session))
     res = await uc.is_email_busy(req)
     return SuccessResp[ZIsBusy](payload=res)
 
@@ -129,13 +109,10 @@ async def is_email_busy(
     status_code=200,
 )
 async def get_accounts(
-    __repo_session: Annotated[AsyncSession, Depends(get_account_repo_session)],
-    __ads_svc: Annotated[AdsService, Depends(get_ads_serivce)],
-    __compl_svc: Annotated[ComplService, Depends(get_compl_serivce)],
-    __tg_svc: Annotated[TgClient, Depends(get_tg_bot)],
+    __repo_session: Annotated[AsyncSession, Depends(get_account_repo_read_session)],
 ) -> SuccessResp[list[ZAccount]]:
     """Обрабатывает HTTP-запрос на получение списка всех аккаунтов."""
-    uc = AccUseCase(AccRepo(__repo_session), __ads_svc, __compl_svc, __tg_svc)
+    uc = AccUseCase(AccRepo(__repo_session))
     res = await uc.get_accounts()
     return SuccessResp[list[ZAccount]](payload=res)
 
@@ -148,12 +125,9 @@ async def get_accounts(
 async def get_current_account(
     jwt: AJwt,
     __repo_session: Annotated[AsyncSession, Depends(get_account_repo_session)],
-    __ads_svc: Annotated[AdsService, Depends(get_ads_serivce)],
-    __compl_svc: Annotated[ComplService, Depends(get_compl_serivce)],
-    __tg_svc: Annotated[TgClient, Depends(get_tg_bot)],
 ) -> SuccessResp[ZAccount]:
     """Обрабатывает HTTP-запрос на получение текущего аккаунта."""
-    uc = AccUseCase(AccRepo(__repo_session), __ads_svc, __compl_svc, __tg_svc)
+    uc = AccUseCase(AccRepo(__repo_session))
 
     if not jwt:
         raise ExpError(ExpCode.SYS_UNAUTHORIZE)
@@ -175,12 +149,9 @@ async def set_role_account(
     role: Annotated[AccRole, Query()],
     acc_id: Annotated[UUID, Path()],
     __repo_session: Annotated[AsyncSession, Depends(get_account_repo_session)],
-    __ads_svc: Annotated[AdsService, Depends(get_ads_serivce)],
-    __compl_svc: Annotated[ComplService, Depends(get_compl_serivce)],
-    __tg_svc: Annotated[TgClient, Depends(get_tg_bot)],
 ) -> SuccessResp:
     """Обрабатывает HTTP-запрос администратора на изменение роли аккаунта."""
-    uc = AccUseCase(AccRepo(__repo_session), __ads_svc, __compl_svc, __tg_svc)
+    uc = AccUseCase(AccRepo(__repo_session))
 
     if not jwt:
         raise ExpError(ExpCode.SYS_UNAUTHORIZE)
@@ -204,12 +175,9 @@ async def set_ban_account(
     blocked_to: Annotated[BannedTo, Query()],
     reason_blocked: Annotated[str, Body()],
     __repo_session: Annotated[AsyncSession, Depends(get_account_repo_session)],
-    __ads_svc: Annotated[AdsService, Depends(get_ads_serivce)],
-    __compl_svc: Annotated[ComplService, Depends(get_compl_serivce)],
-    __tg_svc: Annotated[TgClient, Depends(get_tg_bot)],
 ) -> SuccessResp:
     """Обрабатывает HTTP-запрос администратора на блокировку аккаунта"""
-    uc = AccUseCase(AccRepo(__repo_session), __ads_svc, __compl_svc, __tg_svc)
+    uc = AccUseCase(AccRepo(__repo_session))
 
     if not jwt:
         raise ExpError(ExpCode.SYS_UNAUTHORIZE)
@@ -231,12 +199,9 @@ async def set_unban_account(
     jwt: AJwt,
     acc_id: Annotated[UUID, Path()],
     __repo_session: Annotated[AsyncSession, Depends(get_account_repo_session)],
-    __ads_svc: Annotated[AdsService, Depends(get_ads_serivce)],
-    __compl_svc: Annotated[ComplService, Depends(get_compl_serivce)],
-    __tg_svc: Annotated[TgClient, Depends(get_tg_bot)],
 ) -> SuccessResp:
     """Обрабатывает HTTP-запрос администратора на разблокировку аккаунта."""
-    uc = AccUseCase(AccRepo(__repo_session), __ads_svc, __compl_svc, __tg_svc)
+    uc = AccUseCase(AccRepo(__repo_session))
 
     if not jwt:
         raise ExpError(ExpCode.SYS_UNAUTHORIZE)
@@ -259,12 +224,9 @@ async def send_complaint(
     acc_id: Annotated[UUID, Path()],
     msg: Annotated[str, Body()],
     __repo_session: Annotated[AsyncSession, Depends(get_account_repo_session)],
-    __ads_svc: Annotated[AdsService, Depends(get_ads_serivce)],
-    __compl_svc: Annotated[ComplService, Depends(get_compl_serivce)],
-    __tg_svc: Annotated[TgClient, Depends(get_tg_bot)],
 ) -> SuccessResp[ZCompl]:
     """Обрабатывает HTTP-запрос на создание жалобы на аккаунт."""
-    uc = AccUseCase(AccRepo(__repo_session), __ads_svc, __compl_svc, __tg_svc)
+    uc = AccUseCase(AccRepo(__repo_session))
 
     if not jwt:
         raise ExpError(ExpCode.SYS_UNAUTHORIZE)
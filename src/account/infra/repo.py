@@ -1,14 +1,49 @@
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.dialects.postgresql import insert
-from sqlalchemy import select, delete, update, text
+from sqlalchemy.dialects.postgresql import insert, ARRAY
+from sqlalchemy import select, delete, update, text, func, bindparam, Integer, Uuid
 from sqlalchemy.exc import NoResultFound
 
 from ..domain.irepo import IAccRepo
 from ..domain.models import Account, AccRole
 from ..domain.dto import QEmailSignupData, BannedTo
 
-from .xdao import XAccount, XAccountID
+from .xdao import XAccount, XAccountID, XCounterDrift
+
+ACCOUNT = Account.__table__
+
+# count_ads обновляется фоновой сверкой с БД объявлений (account.internal.
+# reconcile), чтения аккаунта берут сохранённое значение.
+SELECT_ACCOUNT_BY_ID = select(*ACCOUNT.c).where(ACCOUNT.c.id == bindparam("acc_id"))
+SELECT_ACCOUNT_IDS = (
+    select(ACCOUNT.c.id)
+    .where(ACCOUNT.c.id > bindparam("after"))
+    .order_by(ACCOUNT.c.id)
+    .limit(bindparam("chunk_size"))
+)
+_ACTUAL_COUNT_ADS = (
+    func.unnest(
+        bindparam("acc_ids", type_=ARRAY(Uuid)),
+        bindparam("counts", type_=ARRAY(Integer)),
+    )
+    .table_valued("id", "n")
+    .render_derived()
+)
+_STORED = ACCOUNT.alias("stored")
+FIX_COUNT_ADS = (
+    update(ACCOUNT)
+    .values(count_ads=_ACTUAL_COUNT_ADS.c.n)
+    .where(
+        ACCOUNT.c.id == _ACTUAL_COUNT_ADS.c.id,
+        _STORED.c.id == ACCOUNT.c.id,
+        ACCOUNT.c.count_ads != _ACTUAL_COUNT_ADS.c.n,
+    )
+    .returning(
+        ACCOUNT.c.id,
+        _STORED.c.count_ads.label("stored"),
+        _ACTUAL_COUNT_ADS.c.n.label("actual"),
+    )
+)
 
 
 class AccRepo(IAccRepo):
@@ -23,7 +58,15 @@ class AccRepo(IAccRepo):
 
         self.session: AsyncSession = _session
 
-    async def get_account_by_id(self, count_ads: int, acc_id: UUID) -> XAccount:
+    async def warmup(self) -> None:
+        """Выполняет горячие запросы чтения для прогрева кешей запросов."""
+        await self.is_email_busy("")
+        try:
+            await self.get_account_by_email("")
+        except KeyError:
+            pass
+
+    async def get_account_by_id(self, acc_id: UUID) -> XAccount:
         """Получает аккаунт по его ID.
 
         Args:
@@ -35,36 +78,13 @@ class AccRepo(IAccRepo):
         Raises:
             KeyError: Если аккаунт не найден.
         """
-        update_ads_req = (
-            update(Account).values(count_ads=count_ads).where(Account.id == acc_id)
-        )
-        await self.session.execute(update_ads_req)
-        await self.session.commit()
-
-        req = select(Account).where(Account.id == acc_id)
-        res = await self.session.execute(req)
-        await self.session.commit()
-        row = res.scalar_one_or_none()
+        res = await self.session.execute(SELECT_ACCOUNT_BY_ID, {"acc_id": acc_id})
+        row = res.mappings().one_or_none()
         if row is None:
             raise KeyError("Отсутствует запись об аккаунте")
-        return XAccount(
-            id=row.id,
-            email=row.email,
-            pwd_hash=row.pwd_hash,
-            salt=row.salt,
-            role=row.role,
-            count_ads=row.count_ads,
-            is_banned=row.is_banned,
-            created_at=row.created_at,
-            updated_at=row.updated_at,
-            blocked_at=row.blocked_at,
-            reason_blocked=row.reason_blocked,
-            blocked_to=row.blocked_to,
-        )
+        return XAccount(**row)
 
-    async def get_account_by_email(
-        self, email: str, count_ads: int | None = None
-    ) -> XAccount:
+    async def get_account_by_email(self, email: str) -> XAccount:
         """Получает аккаунт по email.
 
         Args:
@@ -76,18 +96,8 @@ class AccRepo(IAccRepo):
         Raises:
             KeyError: Если аккаунт не найден.
         """
-        if count_ads:
-            update_ads_req = (
-                update(Account)
-                .values(count_ads=count_ads)
-                .where(Account.email == email)
-            )
-            await self.session.execute(update_ads_req)
-            await self.session.commit()
-
         req = select(Account).where(Account.email == email)
         res = await self.session.execute(req)
-        await self.session.commit()
         row = res.scalar_one_or_none()
         if row is None:
             raise KeyError("Отсутствует запись об аккаунте")
@@ -126,7 +136,6 @@ class AccRepo(IAccRepo):
             .returning(Account)
         )
         res = await self.session.execute(req)
-        await self.session.commit()
         row = res.scalar_one()
         return XAccountID(id=row.id)
 
@@ -141,7 +150,6 @@ class AccRepo(IAccRepo):
         """
         req = select(Account).where(Account.email == email)
         res = await self.session.execute(req)
-        await self.session.commit()
         row = res.scalar_one_or_none()
         return row is not None
 
@@ -153,7 +161,6 @@ class AccRepo(IAccRepo):
         """
         req = select(Account).limit(10)
         xres = await self.session.execute(req)
-        await self.session.commit()
         res = []
         for row in xres.scalars().all():
             res.append(
@@ -174,16 +181,9 @@ class AccRepo(IAccRepo):
             )
         return res
 
-    async def get_current_account(self, count_ads: int, acc_id: UUID) -> XAccount:
-        update_ads_req = (
-            update(Account).values(count_ads=count_ads).where(Account.id == acc_id)
-        )
-        await self.session.execute(update_ads_req)
-        await self.session.commit()
-
+    async def get_current_account(self, acc_id: UUID) -> XAccount:
         req = select(Account).where(Account.id == acc_id)
         res = await self.session.execute(req)
-        await self.session.commit()
         row = res.scalar_one()
 
         return XAccount(
@@ -212,7 +212,6 @@ class AccRepo(IAccRepo):
         """
         req = delete(Account).where(Account.id == acc_id)
         await self.session.execute(req)
-        await self.session.commit()
 
     async def set_role_account(self, acc_id: UUID, role: AccRole) -> None:
         req = update(Account).values(role=role.value).where(Account.id == acc_id)
@@ -220,7 +219,6 @@ class AccRepo(IAccRepo):
             await self.session.execute(req)
         except NoResultFound as e:
             raise KeyError("Аккаунт в бд не найден") from e
-        await self.session.commit()
 
     async def set_ban_account(
         self, acc_id: UUID, blocked_to: BannedTo, reason_banned: str
@@ -250,7 +248,6 @@ class AccRepo(IAccRepo):
             res = await self.session.execute(req)
         except NoResultFound as e:
             raise KeyError("Аккаунт в бд не найден") from e
-        await self.session.commit()
 
         row = res.scalar_one()
         return str(row.blocked_to)
@@ -270,4 +267,33 @@ class AccRepo(IAccRepo):
             await self.session.execute(req)
         except NoResultFound as e:
             raise KeyError("Аккаунт в бд не найден") from e
-        await self.session.commit()
+
+    async def get_account_ids(self, after: UUID, chunk_size: int) -> list[UUID]:
+        """Возвращает пачку идентификаторов аккаунтов по возрастанию.
+
+        Args:
+            after (UUID): ID, после которого начинается пачка.
+            chunk_size (int): Размер пачки.
+
+        Returns:
+            list[UUID]: Идентификаторы аккаунтов.
+        """
+        res = await self.session.execute(
+            SELECT_ACCOUNT_IDS, {"after": after, "chunk_size": chunk_size}
+        )
+        return list(res.scalars().all())
+
+    async def fix_count_ads(self, counts: dict[UUID, int]) -> list[XCounterDrift]:
+        """Записывает фактическое количество объявлений, если оно отличается.
+
+        Args:
+            counts (dict[UUID, int]): Количество объявлений по ID аккаунта.
+
+        Returns:
+            list[XCounterDrift]: Исправленные счётчики.
+        """
+        res = await self.session.execute(
+            FIX_COUNT_ADS,
+            {"acc_ids": list(counts), "counts": list(counts.values())},
+        )
+        return [XCounterDrift(**row) for row in res.mappings()]
@@ -25,3 +25,11 @@ class XAccount(BaseModel):
     blocked_at: datetime | None = None
     reason_blocked: str | None = None
     blocked_to: datetime | None = None
+
+
+class XCounterDrift(BaseModel):
+    """Исправленное сверкой значение счётчика."""
+
+    id: UUID4
+    stored: int
+    actual: int
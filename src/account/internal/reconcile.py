@@ -0,0 +1,46 @@
+from uuid import UUID
+
+from kernel.container import get_container
+from kernel.pg import DB_ACC, session_scope
+from kernel.reconcile import reconcile
+from kernel.tasks import start_task
+
+from ..infra.repo import AccRepo
+
+COUNT_ADS = "account_count_ads"
+
+
+async def _fix_chunk(after: UUID, chunk_size: int) -> tuple[UUID | None, int, int]:
+    # Количество объявлений читается из другой БД, поэтому объявление,
+    # созданное между подсчётом и записью, учтётся следующей сверкой.
+    async with session_scope(DB_ACC, readonly=True) as session:
+        acc_ids = await AccRepo(session).get_account_ids(after, chunk_size)
+    if not acc_ids:
+        return None, 0, 0
+    counts = await get_container().ads_svc.get_count_ads_by_acc_ids(acc_ids)
+    async with session_scope(DB_ACC) as session:
+        xdrift = await AccRepo(session).fix_count_ads(
+            {acc_id: counts.get(acc_id, 0) for acc_id in acc_ids}
+        )
+    return acc_ids[-1], len(acc_ids), len(xdrift)
+
+
+async def reconcile_count_ads() -> int | None:
+    """Сверяет Account.count_ads с количеством объявлений в сервисе объявлений.
+
+    Returns:
+        int | None: Количество исправленных счётчиков или None, если сверку
+            выполняет другой процесс.
+    """
+    return await reconcile(COUNT_ADS, DB_ACC, _fix_chunk)
+
+
+def init_count_ads() -> None:
+    """Запускает периодическую сверку количества объявлений аккаунтов.
+
+    Сверка не выполняется при остановке процесса: незавершённый проход
+    продолжится в следующем запуске с начала таблицы.
+    """
+    interval = get_container().app_cfg.COUNTERS_RECONCILE_INTERVAL
+    if interval > 0:
+        start_task(COUNT_ADS, interval, reconcile_count_ads, run_on_stop=False)
@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from kernel.configs import AccountConfig
+from kernel.container import get_container
 from kernel.exception import ExpError, ExpCode
 
 from ..domain.irepo import IAccRepo
@@ -20,34 +20,49 @@ from compl.domain.dto import QCreateCompl, ZCompl
 from ..infra.repo import AccRepo
 from ..infra.xdao import XAccount
 
-from ads.external.svc import AdsService
-from compl.external.svc import ComplService
+from compl.external.svc import ComplService, ComplLocalService
 from notice.external.tg.client import TgClient
-from notice.external.tg.const_msg import get_acc_ban_warning_msg, get_acc_unban_warning_msg
+from notice.external.tg.const_msg import (
+    get_acc_ban_warning_msg,
+    get_acc_unban_warning_msg,
+)
 
 
 class AccUseCase:
     """Реализует бизнес-логику работы с аккаунтами, используя репозиторий.
 
+    Сервисы, не переданные явно, берутся из контейнера при первом обращении.
+
     Args:
         _repo (AccRepo): Репозиторий аккаунтов.
-        _ads_svc (AdsService): Сервис для работы с объявлениями.
-        _compl_svc (ComplService): Сервис для работы с жалобами.
-        _tg_svc (TgClient): Клиент для отправки сообщений в Telegram.
+        _compl_svc (ComplService | None): Сервис для работы с жалобами.
+        _tg_svc (TgClient | None): Клиент для отправки сообщений в Telegram.
     """
 
     def __init__(
         self,
         _repo: AccRepo,
-        _ads_svc: AdsService,
-        _compl_svc: ComplService,
-        _tg_svc: TgClient,
+        _compl_svc: ComplService | ComplLocalService | None = None,
+        _tg_svc: TgClient | None = None,
     ):
-        self.cfg = AccountConfig()
+        self.cfg = get_container().acc_cfg
         self.repo: IAccRepo = _repo
-        self.ads_svc: AdsService = _ads_svc
-        self.compl_svc: ComplService = _compl_svc
-        self.tg_svc: TgClient = _tg_svc
+        self._compl_svc = _compl_svc
+        self._tg_svc = _tg_svc
+
+    @property
+    def compl_svc(self) -> ComplService | ComplLocalService:
+        """Сервис для работы с жалобами."""
+        if self._compl_svc is None:
+            self._compl_svc = get_container().compl_svc
+        return self._compl_svc
+
+    @property
+    def tg_svc(self) -> TgClient:
+        """Клиент для отправки сообщений в Telegram."""
+        if self._tg_svc is None:
+            self._tg_svc = get_container().tg_bot
+        return self._tg_svc
 
     async def get_account_by_id(self, acc_id: UUID) -> ZAccount:
         """Получает аккаунт по его ID.
@@ -62,12 +77,7 @@ class AccUseCase:
             ExpError: Если аккаунт не найден.
         """
         try:
-            count_ads = await self.ads_svc.get_count_ads_by_acc_id(acc_id)
-        except ExpError as e:
-            raise e
-
-        try:
-            x_acc: XAccount = await self.repo.get_account_by_id(count_ads, acc_id)
+            x_acc: XAccount = await self.repo.get_account_by_id(acc_id)
         except KeyError as e:
             raise ExpError(ExpCode.ACC_ACCOUNT_NOT_FOUND, str(e)) from e
         return ZAccount.model_validate(x_acc.model_dump(mode="json"))
@@ -88,17 +98,6 @@ class AccUseCase:
             x_acc: XAccount = await self.repo.get_account_by_email(req.email)
         except KeyError as e:
             raise ExpError(ExpCode.ACC_ACCOUNT_NOT_FOUND, str(e)) from e
-
-        try:
-            count_ads = await self.ads_svc.get_count_ads_by_acc_id(x_acc.id)
-        except ExpError as e:
-            raise e
-
-        try:
-            x_acc: XAccount = await self.repo.get_account_by_email(req.email, count_ads)
-        except KeyError as e:
-            raise ExpError(ExpCode.ACC_ACCOUNT_NOT_FOUND, str(e)) from e
-
         return ZAccount.model_validate(x_acc.model_dump(mode="json"))
 
     async def copy_account_from_signup(self, signup: QEmailSignupData) -> ZAccountID:
@@ -138,7 +137,7 @@ class AccUseCase:
         return res
 
     async def get_current_account(self, acc_id: UUID) -> ZAccount:
-        """Получает текущий аккаунт с количеством объявлений.
+        """Получает текущий аккаунт.
 
         Args:
             acc_id (UUID): Идентификатор аккаунта.
@@ -146,12 +145,7 @@ class AccUseCase:
         Returns:
             ZAccount: Валидированная модель аккаунта.
         """
-        try:
-            count_ads = await self.ads_svc.get_count_ads_by_acc_id(acc_id)
-        except ExpError as e:
-            raise e
-
-        x_acc = await self.repo.get_current_account(count_ads, acc_id)
+        x_acc = await self.repo.get_current_account(acc_id)
         return ZAccount.model_validate(x_acc.model_dump(mode="json"))
 
     async def set_role_account(self, acc_id: UUID, role: AccRole) -> bool:
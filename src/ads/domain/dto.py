@@ -1,6 +1,6 @@
 from enum import Enum
 from datetime import datetime
-from pydantic import BaseModel, UUID4
+from pydantic import BaseModel, Field, UUID4
 
 
 class QAdsCategory(Enum):
@@ -11,6 +11,13 @@ class QAdsCategory(Enum):
     PROVIDING_SERVICES = "providing services"
 
 
+class QAdsFileFormat(Enum):
+    """Форматы файла импорта и выгрузки объявлений."""
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
 class QAdsPriceFilter(Enum):
     """Варианты сортировки по цене."""
 
@@ -19,14 +26,56 @@ class QAdsPriceFilter(Enum):
 
 
 class QFilter(BaseModel):
-    """Параметры фильтрации объявлений."""
+    """Параметры фильтрации объявлений.
+
+    Пагинация по offset или по курсору: cursor берётся из next_cursor
+    предыдущей страницы (с той же сортировкой price) и отменяет offset.
+    estimate_total для ленты без фильтров возвращает приблизительное общее
+    количество по статистике БД вместо точного подсчёта.
+    """
 
-    limit: int = 10
-    offset: int = 0
+    limit: int = Field(default=10, ge=1, le=100)
+    offset: int = Field(default=0, ge=0)
+    cursor: str | None = None
     price: QAdsPriceFilter | None = None
     price_from: int | None = None
     price_to: int | None = None
     ads_category: QAdsCategory | None = None
+    estimate_total: bool = False
+
+
+class QAccountAdsFilter(BaseModel):
+    """Параметры страницы объявлений аккаунта.
+
+    Без price сначала идут новые объявления. Следующая страница запрашивается
+    по next_cursor предыдущей с той же сортировкой price.
+    """
+
+    limit: int = Field(default=20, ge=1, le=100)
+    cursor: str | None = None
+    price: QAdsPriceFilter | None = None
+
+
+class QAuthorAdsFilter(QAccountAdsFilter):
+    """Параметры страницы объявлений указанного аккаунта."""
+
+    acc_id: UUID4
+
+
+class QSearch(BaseModel):
+    """Параметры полнотекстового поиска объявлений.
+
+    query разбирается как строка веб-поиска: слова, "точная фраза", or,
+    -исключённое слово. Результаты упорядочены по релевантности, следующая
+    страница запрашивается по next_cursor предыдущей с тем же query.
+    """
+
+    query: str = Field(min_length=1, max_length=256)
+    limit: int = Field(default=10, ge=1, le=100)
+    cursor: str | None = None
+    price_from: int | None = None
+    price_to: int | None = None
+    ads_category: QAdsCategory | None = None
 
 
 class QCreateAds(BaseModel):
@@ -37,6 +86,19 @@ class QCreateAds(BaseModel):
     price: int
 
 
+class QCreateAdsItem(QCreateAds):
+    """Объявление пакета: владелец и категория задаются для каждого."""
+
+    account_id: UUID4
+    ads_category: QAdsCategory = QAdsCategory.SELLING
+
+
+class QCreateAdsBulk(BaseModel):
+    """Пакет объявлений для создания одним запросом (импорт по API-ключу)."""
+
+    items: list[QCreateAdsItem] = Field(min_length=1, max_length=1000)
+
+
 class QChangeAds(BaseModel):
     """Данные для обновления объявления."""
 
@@ -53,6 +115,12 @@ class QAdmDeleteAds(BaseModel):
     reason_deletion: str
 
 
+class QAccountIds(BaseModel):
+    """Идентификаторы аккаунтов для подсчёта объявлений одним запросом."""
+
+    acc_ids: list[UUID4] = Field(min_length=1, max_length=1000)
+
+
 class ZBanned(BaseModel):
     """Информация о бане аккаунта."""
 
@@ -81,18 +149,79 @@ class ZAds(BaseModel):
     reason_deletion: str | None = None
 
 
+class ZAdsBulkItem(BaseModel):
+    """Результат создания одного объявления пакета.
+
+    index — позиция в запросе; заполнено либо id, либо error.
+    """
+
+    index: int
+    id: UUID4 | None = None
+    error: str | None = None
+
+
+class ZAdsBulk(BaseModel):
+    """Результат создания пакета объявлений."""
+
+    created: int
+    failed: int
+    items: list[ZAdsBulkItem] = []
+
+
+class ZAdsImportError(BaseModel):
+    """Ошибка строки файла импорта."""
+
+    line: int
+    error: str
+
+
+class ZAdsImport(BaseModel):
+    """Результат импорта объявлений."""
+
+    imported: int
+    failed: int
+    errors: list[ZAdsImportError] = []
+
+
+class ZAdsTitle(BaseModel):
+    """Подсказка: заголовок объявления."""
+
+    id: UUID4
+    title: str
+
+
 class ZManyAds(BaseModel):
     """Коллекция объявлений с пагинацией."""
 
     total: int
+    is_total_estimated: bool = False
     count: int
     offeset: int = 0
     items: list[ZAds] = []
+    next_cursor: str | None = None
 
 
 # ---------- AdsComment ---------
 
 
+class QCommentOrder(Enum):
+    """Порядок комментариев объявления."""
+
+    NEWEST = "newest"
+    OLDEST = "oldest"
+
+
+class QCommentFilter(BaseModel):
+    """Параметры страницы комментариев объявления.
+
+    Следующая страница запрашивается по next_cursor предыдущей с тем же order.
+    """
+
+    limit: int = Field(default=20, ge=1, le=100)
+    cursor: str | None = None
+    order: QCommentOrder = QCommentOrder.NEWEST
+
+
 class QAddAdsComment(BaseModel):
     """Данные для создания комментария к объявлению."""
 
@@ -135,3 +264,4 @@ class ZManyAdsComment(BaseModel):
     count: int
     offeset: int = 0
     items: list[ZAdsComment] = []
+    next_cursor: str | None = None
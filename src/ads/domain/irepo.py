@@ -1,19 +1,41 @@
+from typing import AsyncIterator, Callable
 from uuid import UUID
 
 from ..domain.dto import (
     QCreateAds,
+    QCreateAdsItem,
     QAdsCategory,
+    QAccountAdsFilter,
     QFilter,
+    QSearch,
     QChangeAds,
     QAddAdsComment,
+    QCommentFilter,
     QUpdateAdsComment,
 )
-from ..infra.xdao import XAds, XAdsComment
+from ..infra.xdao import (
+    XAds,
+    XAdsBulkResult,
+    XAdsComment,
+    XAdsCommentPage,
+    XAdsPage,
+    XAdsRef,
+    XAdsTitle,
+    XCounterChunk,
+)
 
 
 class IAdsRepo:
     """Интерфейс репозитория для работы с объявлениями и комментариями."""
 
+    def after_commit(self, func: Callable[[], None]) -> None:
+        """Выполняет функцию после фиксации транзакции.
+
+        Args:
+            func (Callable[[], None]): Функция без аргументов.
+        """
+        raise NotImplementedError
+
     async def create_ads(
         self, ads: QCreateAds, ads_category: QAdsCategory, acc_id: UUID | None = None
     ) -> XAds:
@@ -29,14 +51,43 @@ class IAdsRepo:
         """
         raise NotImplementedError
 
-    async def get_ads_all(self, qfilter: QFilter) -> tuple[int, list[XAds]]:
+    async def create_ads_bulk(
+        self, items: list[QCreateAdsItem]
+    ) -> list[XAdsBulkResult]:
+        """Создаёт пакет объявлений.
+
+        Args:
+            items (list[QCreateAdsItem]): Объявления с владельцем и категорией.
+
+        Returns:
+            list[XAdsBulkResult]: Результат по каждому объявлению в порядке
+                items.
+        """
+        raise NotImplementedError
+
+    async def copy_ads(self, items: list[QCreateAdsItem]) -> int:
+        """Загружает пачку объявлений целиком (COPY).
+
+        Args:
+            items (list[QCreateAdsItem]): Объявления с владельцем и категорией.
+
+        Returns:
+            int: Количество загруженных объявлений.
+
+        Raises:
+            ValueError: Если БД отклонила пачку (пачка не загружена).
+        """
+        raise NotImplementedError
+
+    async def get_ads_all(self, qfilter: QFilter) -> XAdsPage:
         """Получает все объявления с фильтром.
 
         Args:
-            qfilter (QFilter): Параметры фильтрации.
+            qfilter (QFilter): Параметры фильтрации и пагинации (offset или курсор).
 
         Returns:
-            tuple[int, list[XAds]]: Количество и список объявлений.
+            XAdsPage: Количество с учётом фильтров, объявления страницы и курсор
+                следующей страницы.
         """
         raise NotImplementedError
 
@@ -51,14 +102,29 @@ class IAdsRepo:
         """
         raise NotImplementedError
 
-    async def get_ads_by_account_id(self, acc_id: UUID) -> tuple[int, list[XAds]]:
-        """Получает объявления по ID аккаунта.
+    async def add_ads_view(self, ads_id: UUID) -> int:
+        """Учитывает просмотр объявления.
+
+        Args:
+            ads_id (UUID): Идентификатор объявления.
+
+        Returns:
+            int: Количество просмотров, ещё не записанных в БД.
+        """
+        raise NotImplementedError
+
+    async def get_ads_by_account_id(
+        self, acc_id: UUID, qfilter: QAccountAdsFilter
+    ) -> XAdsPage:
+        """Получает страницу объявлений аккаунта.
 
         Args:
             acc_id (UUID): Идентификатор аккаунта.
+            qfilter (QAccountAdsFilter): Размер страницы, сортировка и курсор.
 
         Returns:
-            tuple[int, list[XAds]]: Количество и список объявлений.
+            XAdsPage: Количество объявлений аккаунта, объявления страницы и
+                курсор следующей страницы.
         """
         raise NotImplementedError
 
@@ -101,6 +167,41 @@ class IAdsRepo:
         """
         raise NotImplementedError
 
+    def stream_ads(self, chunk_size: int) -> AsyncIterator[list[XAds]]:
+        """Читает все объявления пачками.
+
+        Args:
+            chunk_size (int): Количество строк в пачке.
+
+        Returns:
+            AsyncIterator[list[XAds]]: Пачки объявлений.
+        """
+        raise NotImplementedError
+
+    async def search_ads(self, qsearch: QSearch) -> XAdsPage:
+        """Ищет объявления по заголовку и описанию.
+
+        Args:
+            qsearch (QSearch): Поисковая строка, фильтры и курсор.
+
+        Returns:
+            XAdsPage: Количество совпадений, объявления страницы и курсор
+                следующей страницы.
+        """
+        raise NotImplementedError
+
+    async def suggest_ads(self, prefix: str, limit: int) -> list[XAdsTitle]:
+        """Подбирает заголовки объявлений по началу ввода.
+
+        Args:
+            prefix (str): Введённая часть заголовка.
+            limit (int): Максимальное количество подсказок.
+
+        Returns:
+            list[XAdsTitle]: Идентификаторы и заголовки объявлений.
+        """
+        raise NotImplementedError
+
     async def get_count_ads_by_acc_id(self, acc_id: UUID) -> int:
         """Получает количество объявлений по ID аккаунта.
 
@@ -112,6 +213,32 @@ class IAdsRepo:
         """
         raise NotImplementedError
 
+    async def get_count_ads_by_acc_ids(self, acc_ids: list[UUID]) -> dict[UUID, int]:
+        """Получает количество объявлений для нескольких аккаунтов.
+
+        Args:
+            acc_ids (list[UUID]): Идентификаторы аккаунтов.
+
+        Returns:
+            dict[UUID, int]: Количество объявлений по ID аккаунта.
+        """
+        raise NotImplementedError
+
+    async def fix_comment_counters(self, after: UUID, chunk_size: int) -> XCounterChunk:
+        """Сверяет и исправляет count_comments пачки объявлений.
+
+        Объявлениям пачки без строки AdsStats она создаётся.
+
+        Args:
+            after (UUID): ads_id, после которого начинается пачка.
+            chunk_size (int): Размер пачки.
+
+        Returns:
+            XCounterChunk: Последний ads_id пачки, созданные строки счётчиков и
+                исправленные счётчики.
+        """
+        raise NotImplementedError
+
     async def create_ads_commentary(
         self, new_comment: QAddAdsComment, acc_id: UUID
     ) -> XAdsComment:
@@ -123,17 +250,27 @@ class IAdsRepo:
 
         Returns:
             XAdsComment: Созданный комментарий.
+
+        Raises:
+            KeyError: Если объявление не найдено.
         """
         raise NotImplementedError
 
-    async def get_ads_commentaries(self, ads_id: UUID) -> tuple[int, list[XAdsComment]]:
-        """Получает комментарии к объявлению.
+    async def get_ads_commentaries(
+        self, ads_id: UUID, qfilter: QCommentFilter
+    ) -> XAdsCommentPage:
+        """Получает страницу комментариев к объявлению.
 
         Args:
             ads_id (UUID): Идентификатор объявления.
+            qfilter (QCommentFilter): Размер страницы, порядок и курсор.
 
         Returns:
-            tuple[int, list[XAdsComment]]: Количество и список комментариев.
+            XAdsCommentPage: Количество комментариев объявления, комментарии
+                страницы и курсор следующей страницы.
+
+        Raises:
+            ValueError: Если курсор повреждён или выдан для другого порядка.
         """
         raise NotImplementedError
 
@@ -164,7 +301,7 @@ class IAdsRepo:
 
     async def delete_ads_commentary(
         self, ads_id: UUID, comm_id: UUID, acc_id: UUID
-    ) -> None:
+    ) -> XAdsRef:
         """Удаляет комментарий к объявлению.
 
         Args:
@@ -173,7 +310,10 @@ class IAdsRepo:
             acc_id (UUID): Идентификатор аккаунта.
 
         Returns:
-            None
+            XAdsRef: Объявление удалённого комментария.
+
+        Raises:
+            KeyError: Если комментарий не найден.
         """
         return NotImplementedError
 
@@ -188,14 +328,16 @@ class IAdsRepo:
         """
         return NotImplementedError
 
-    async def adm_delete_ads_commentary(self, comm_id: UUID, ads_id: UUID) -> None:
+    async def adm_delete_ads_commentary(self, comm_id: UUID) -> XAdsRef:
         """Администратор удаляет комментарий к объявлению.
 
         Args:
             comm_id (UUID): Идентификатор комментария.
-            ads_id (UUID): Идентификатор объявления.
 
         Returns:
-            None
+            XAdsRef: Объявление удалённого комментария.
+
+        Raises:
+            KeyError: Если комментарий не найден.
         """
         return NotImplementedError
@@ -28,8 +28,6 @@ class Ads(Base):
         description (str): Описание объявления.
         ads_category (str): Категория объявления.
         price (int): Цена услуги.
-        count_views (int): Количество просмотров объявления.
-        count_comments (int): Количество комментариев.
         is_deleted (bool): Флаг удаления объявления.
         created_at (datetime): Дата создания объявления.
         updated_at (datetime | None): Дата последнего изменения объявления.
@@ -52,12 +50,6 @@ class Ads(Base):
     description = Column(String, nullable=False, comment="Описания объявления")
     ads_category = Column(String, nullable=False, comment="Категория объявления")
     price = Column(Integer, nullable=False, comment="Цена услуги")
-    count_views = Column(
-        Integer, nullable=False, default=0, comment="Количество просмотров объявления"
-    )
-    count_comments = Column(
-        Integer, nullable=False, default=0, comment="Количество комментариев"
-    )
     is_deleted = Column(
         BOOLEAN, nullable=False, default=False, comment="Удалено ли объявление"
     )
@@ -73,6 +65,35 @@ class Ads(Base):
     __table_args__ = (Index("ix_ads_account_id", "account_id"),)
 
 
+class AdsStats(Base):
+    """Модель таблицы счётчиков объявления.
+
+    Счётчики вынесены из широкой строки Ads в узкую таблицу с fillfactor 50:
+    их обновление не переписывает описание объявления и остаётся HOT-обновлением
+    внутри той же страницы. Строка создаётся триггером при вставке в Ads.
+
+    Attributes:
+        ads_id (UUID): ID объявления.
+        count_views (int): Количество просмотров объявления.
+        count_comments (int): Количество комментариев.
+    """
+
+    __tablename__ = "AdsStats"
+
+    ads_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("Ads.id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="ID объявления",
+    )
+    count_views = Column(
+        Integer, nullable=False, default=0, comment="Количество просмотров объявления"
+    )
+    count_comments = Column(
+        Integer, nullable=False, default=0, comment="Количество комментариев"
+    )
+
+
 class AdsComment(Base):
     """Модель таблицы комментариев к объявлению.
 
@@ -3,19 +3,30 @@ import httpx
 
 from kernel.endpoints import Endpoints as Enp
 from kernel.exception import ExpError
+from kernel.metrics import observe_call
+from kernel.pg import DB_ADS, session_scope
+
+from ..domain.dto import QAccountIds
+from ..infra.repo import AdsRepo
+from ..internal.uc import AdsUseCase
 
 
 class AdsService:
     """Сервис для работы с объявлениями через внешнее API."""
 
-    def __init__(self, _base_url: str):
+    def __init__(self, _base_url: str, _client: httpx.AsyncClient, _timeout: float):
         """Инициализирует сервис объявлений с базовым URL API.
 
         Args:
             _base_url (str): Базовый URL API сервиса объявлений.
+            _client (httpx.AsyncClient): Общий HTTP-клиент процесса.
+            _timeout (float): Таймаут запросов к сервису, сек.
         """
         self.base_url = _base_url
+        self.client = _client
+        self.timeout = _timeout
 
+    @observe_call("ads", "http")
     async def get_count_ads_by_acc_id(self, acc_id: UUID) -> int:
         """Получает количество объявлений для указанного аккаунта.
 
@@ -33,10 +44,67 @@ class AdsService:
             ValueError: При некорректном формате ответа API.
         """
         url = self.base_url + Enp.ADS_GET_COUNT_ADS_BY_ACCOUNT + f"?acc_id={acc_id}"
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(url)
-            resp_js = resp.json()
-            if not resp_js["ok"]:
-                raise ExpError(code_msg=(resp_js["err"]["code"], resp_js["err"]["msg"]))
-            res = resp_js["payload"]
-            return res
+        resp = await self.client.get(url, timeout=self.timeout)
+        resp_js = resp.json()
+        if not resp_js["ok"]:
+            raise ExpError(code_msg=(resp_js["err"]["code"], resp_js["err"]["msg"]))
+        res = resp_js["payload"]
+        return res
+
+    @observe_call("ads", "http")
+    async def get_count_ads_by_acc_ids(self, acc_ids: list[UUID]) -> dict[UUID, int]:
+        """Получает количество объявлений для нескольких аккаунтов одним запросом.
+
+        Args:
+            acc_ids (list[UUID]): Идентификаторы аккаунтов (не больше 1000).
+
+        Returns:
+            dict[UUID, int]: Количество объявлений по ID аккаунта.
+
+        Raises:
+            ExpError: Если API возвращает ошибку.
+            httpx.RequestError: При проблемах с сетевым соединением.
+        """
+        url = self.base_url + Enp.ADS_GET_COUNT_ADS_BY_ACCOUNTS
+        body = QAccountIds(acc_ids=acc_ids).model_dump(mode="json")
+        resp = await self.client.post(url, json=body, timeout=self.timeout)
+        resp_js = resp.json()
+        if not resp_js["ok"]:
+            raise ExpError(code_msg=(resp_js["err"]["code"], resp_js["err"]["msg"]))
+        return {UUID(acc_id): n for acc_id, n in resp_js["payload"].items()}
+
+
+class AdsLocalService:
+    """Сервис для работы с объявлениями внутри процесса.
+
+    Вызывает AdsUseCase напрямую, без HTTP-запроса к API. Используется, когда
+    сервис объявлений смонтирован в том же приложении (SVC_TRANSPORT=local).
+    """
+
+    @observe_call("ads", "local")
+    async def get_count_ads_by_acc_id(self, acc_id: UUID) -> int:
+        """Получает количество объявлений для указанного аккаунта.
+
+        Args:
+            acc_id (UUID): Уникальный идентификатор аккаунта.
+
+        Returns:
+            int: Количество объявлений, принадлежащих аккаунту.
+        """
+        async with session_scope(DB_ADS, readonly=True) as session:
+            return await AdsUseCase(AdsRepo(session)).get_count_ads_by_acc_id(acc_id)
+
+    @observe_call("ads", "local")
+    async def get_count_ads_by_acc_ids(self, acc_ids: list[UUID]) -> dict[UUID, int]:
+        """Получает количество объявлений для нескольких аккаунтов.
+
+        Args:
+            acc_ids (list[UUID]): Идентификаторы аккаунтов (не больше 1000).
+
+        Returns:
+            dict[UUID, int]: Количество объявлений по ID аккаунта.
+        """
+        async with session_scope(DB_ADS, readonly=True) as session:
+            return await AdsUseCase(AdsRepo(session)).get_count_ads_by_acc_ids(
+                QAccountIds(acc_ids=acc_ids)
+            )
@@ -1,33 +1,40 @@
 from uuid import UUID
 from typing import Annotated
-from fastapi import APIRouter, Depends, Body, Header, Query, Path
+from fastapi import APIRouter, Depends, Body, Header, Query, Path, Request
+from fastapi.responses import StreamingResponse
 
 from kernel.endpoints import Endpoints as Enp
-from kernel.depends import (
-    get_ads_repo_session,
-    get_compl_serivce,
-    ComplService,
-    get_tg_bot,
-    TgClient,
-)
+from kernel.depends import get_ads_repo_session, get_ads_repo_read_session
 from kernel.response import responses, SuccessResp
 from kernel.security import AJwt, ApiKey
 from kernel.exception import ExpError, ExpCode
 
+from ..internal.exporter import MEDIA_TYPES, AdsExporter
+from ..internal.importer import AdsImporter
 from ..internal.uc import AdsUseCase
 
 from ..domain.dto import (
     # QDTO
     QCreateAds,
+    QCreateAdsBulk,
     QAdsCategory,
+    QAdsFileFormat,
+    QAccountIds,
+    QAccountAdsFilter,
+    QAuthorAdsFilter,
     QFilter,
+    QSearch,
     QChangeAds,
     QAddAdsComment,
+    QCommentFilter,
     QUpdateAdsComment,
     QDelAdsComment,
     # ZDTO
     ZAds,
+    ZAdsBulk,
     ZAdsComment,
+    ZAdsImport,
+    ZAdsTitle,
     ZManyAds,
     ZManyAdsComment,
     ZBanned,
@@ -53,13 +60,11 @@ async def create_ads(
     apikey: ApiKey,
     req: Annotated[QCreateAds, Body()],
     __repo_session: Annotated[AsyncSession, Depends(get_ads_repo_session)],
-    __compl_svc: Annotated[ComplService, Depends(get_compl_serivce)],
-    __tg_svc: Annotated[TgClient, Depends(get_tg_bot)],
     account_id: Annotated[UUID | None, Header(description="Для APIKEY")] = None,
     ads_category: QAdsCategory = QAdsCategory.SELLING,
 ) -> SuccessResp[ZAds] | SuccessResp[ZBanned]:
     """Обрабатывает HTTP-запрос на создание объявления с авторизацией и валидацией."""
-    uc = AdsUseCase(AdsRepo(__repo_session), __compl_svc, __tg_svc)
+    uc = AdsUseCase(AdsRepo(__repo_session))
 
     if not apikey and not jwt:
         raise ExpError(ExpCode.SYS_UNAUTHORIZE)
@@ -82,6 +87,26 @@ async def create_ads(
     return SuccessResp[ZAds](payload=res)
 
 
+@router.post(
+    Enp.ADS_CREATE_BULK,
+    summary="Создать пакет объявлений (по API-ключу)",
+    status_code=200,
+    responses=responses(500, 503),
+)
+async def create_ads_bulk(
+    apikey: ApiKey,
+    req: Annotated[QCreateAdsBulk, Body()],
+    __repo_session: Annotated[AsyncSession, Depends(get_ads_repo_session)],
+) -> SuccessResp[ZAdsBulk]:
+    """Обрабатывает HTTP-запрос импортёра на создание пакета объявлений."""
+    if not apikey:
+        raise ExpError(ExpCode.SYS_UNAUTHORIZE)
+
+    uc = AdsUseCase(AdsRepo(__repo_session))
+    res = await uc.create_ads_bulk(req)
+    return SuccessResp[ZAdsBulk](payload=res)
+
+
 @router.get(
     Enp.ADS_GET_ALL,
     summary="Получить все объявление по фильтру",
@@ -90,16 +115,47 @@ async def create_ads(
 )
 async def get_ads_all(
     qfilter: Annotated[QFilter, Query()],
-    __repo_session: Annotated[AsyncSession, Depends(get_ads_repo_session)],
-    __compl_svc: Annotated[ComplService, Depends(get_compl_serivce)],
-    __tg_svc: Annotated[TgClient, Depends(get_tg_bot)],
+    __repo_session: Annotated[AsyncSession, Depends(get_ads_repo_read_session)],
 ) -> SuccessResp[ZManyAds]:
     """Обрабатывает HTTP-запрос на получение всех объявлений по фильтру."""
-    uc = AdsUseCase(AdsRepo(__repo_session), __compl_svc, __tg_svc)
+    uc = AdsUseCase(AdsRepo(__repo_session))
     res = await uc.get_ads_all(qfilter)
     return SuccessResp[ZManyAds](payload=res)
 
 
+@router.get(
+    Enp.ADS_SEARCH,
+    summary="Полнотекстовый поиск объявлений",
+    status_code=200,
+    responses=responses(400),
+)
+async def search_ads(
+    qsearch: Annotated[QSearch, Query()],
+    __repo_session: Annotated[AsyncSession, Depends(get_ads_repo_read_session)],
+) -> SuccessResp[ZManyAds]:
+    """Обрабатывает HTTP-запрос на поиск объявлений по заголовку и описанию."""
+    uc = AdsUseCase(AdsRepo(__repo_session))
+    res = await uc.search_ads(qsearch)
+    return SuccessResp[ZManyAds](payload=res)
+
+
+@router.get(
+    Enp.ADS_SUGGEST,
+    summary="Подсказки по заголовку объявления",
+    status_code=200,
+    responses=responses(400),
+)
+async def suggest_ads(
+    prefix: Annotated[str, Query(min_length=1, max_length=64)],
+    __repo_session: Annotated[AsyncSession, Depends(get_ads_repo_read_session)],
+    limit: Annotated[int, Query(ge=1, le=20)] = 10,
+) -> SuccessResp[list[ZAdsTitle]]:
+    """Обрабатывает HTTP-запрос на подсказки заголовков по началу ввода."""
+    uc = AdsUseCase(AdsRepo(__repo_session))
+    res = await uc.suggest_ads(prefix, limit)
+    return SuccessResp[list[ZAdsTitle]](payload=res)
+
+
 @router.get(
     Enp.ADS_GET_BY_ID,
     summary="Получить объявление по его id",
@@ -108,31 +164,27 @@ async def get_ads_all(
 )
 async def get_ads_by_id(
     ads_id: Annotated[UUID, Query()],
-    __repo_session: Annotated[AsyncSession, Depends(get_ads_repo_session)],
-    __compl_svc: Annotated[ComplService, Depends(get_compl_serivce)],
-    __tg_svc: Annotated[TgClient, Depends(get_tg_bot)],
+    __repo_session: Annotated[AsyncSession, Depends(get_ads_repo_read_session)],
 ) -> SuccessResp[ZAds]:
     """Обрабатывает HTTP-запрос на получение объявления по его идентификатору."""
-    uc = AdsUseCase(AdsRepo(__repo_session), __compl_svc, __tg_svc)
+    uc = AdsUseCase(AdsRepo(__repo_session))
     res = await uc.get_ads_by_id(ads_id)
     return SuccessResp[ZAds](payload=res)
 
 
 @router.get(
     Enp.ADS_GET_BY_ACCOUNT,
-    summary="Получить все объявления пользователя",
+    summary="Получить объявления пользователя",
     status_code=200,
     responses=responses(400, 404),
 )
 async def get_ads_by_account(
-    acc_id: Annotated[UUID, Query()],
-    __repo_session: Annotated[AsyncSession, Depends(get_ads_repo_session)],
-    __compl_svc: Annotated[ComplService, Depends(get_compl_serivce)],
-    __tg_svc: Annotated[TgClient, Depends(get_tg_bot)],
+    qfilter: Annotated[QAuthorAdsFilter, Query()],
+    __repo_session: Annotated[AsyncSession, Depends(get_ads_repo_read_session)],
 ) -> SuccessResp[ZManyAds]:
-    """Обрабатывает HTTP-запрос на получение всех объявлений пользователя."""
-    uc = AdsUseCase(AdsRepo(__repo_session), __compl_svc, __tg_svc)
-    res = await uc.get_ads_by_account_id(acc_id)
+    """Обрабатывает HTTP-запрос на получение страницы объявлений пользователя."""
+    uc = AdsUseCase(AdsRepo(__repo_session))
+    res = await uc.get_ads_by_account_id(qfilter.acc_id, qfilter)
     return SuccessResp[ZManyAds](payload=res)
 
 
@@ -144,12 +196,11 @@ async def get_ads_by_account(
 )
 async def get_my_ads(
     jwt: AJwt,
-    __repo_session: Annotated[AsyncSession, Depends(get_ads_repo_session)],
-    __compl_svc: Annotated[ComplService, Depends(get_compl_serivce)],
-    __tg_svc: Annotated[TgClient, Depends(get_tg_bot)],
+    qfilter: Annotated[QAccountAdsFilter, Query()],
+    __repo_session: Annotated[AsyncSession, Depends(get_ads_repo_read_session)],
 ) -> SuccessResp[ZManyAds]:
     """Обрабатывает HTTP-запрос на получение моих объявлений с авторизацией."""
-    uc = AdsUseCase(AdsRepo(__repo_session), __compl_svc, __tg_svc)
+    uc = AdsUseCase(AdsRepo(__repo_session))
 
     if not jwt:
         raise ExpError(ExpCode.SYS_UNAUTHORIZE)
@@ -166,7 +217,7 @@ async def get_my_ads(
         )
 
     acc_id = jwt["acc_id"]
-    res = await uc.get_ads_by_account_id(acc_id)
+    res = await uc.get_ads_by_account_id(acc_id, qfilter)
     return SuccessResp[ZManyAds](payload=res)
 
 
@@ -177,16 +228,29 @@ async def get_my_ads(
 )
 async def get_count_ads_by_acc_id(
     acc_id: Annotated[UUID, Query()],
-    __repo_session: Annotated[AsyncSession, Depends(get_ads_repo_session)],
-    __compl_svc: Annotated[ComplService, Depends(get_compl_serivce)],
-    __tg_svc: Annotated[TgClient, Depends(get_tg_bot)],
+    __repo_session: Annotated[AsyncSession, Depends(get_ads_repo_read_session)],
 ) -> SuccessResp[int]:
     """Обрабатывает HTTP-запрос на получение количества объявлений пользователя."""
-    uc = AdsUseCase(AdsRepo(__repo_session), __compl_svc, __tg_svc)
+    uc = AdsUseCase(AdsRepo(__repo_session))
     res = await uc.get_count_ads_by_acc_id(acc_id)
     return SuccessResp[int](payload=res)
 
 
+@router.post(
+    Enp.ADS_GET_COUNT_ADS_BY_ACCOUNTS,
+    summary="Получить количество объявлений нескольких пользователей",
+    status_code=200,
+)
+async def get_count_ads_by_acc_ids(
+    req: Annotated[QAccountIds, Body()],
+    __repo_session: Annotated[AsyncSession, Depends(get_ads_repo_read_session)],
+) -> SuccessResp[dict[UUID, int]]:
+    """Обрабатывает HTTP-запрос на подсчёт объявлений пачки пользователей."""
+    uc = AdsUseCase(AdsRepo(__repo_session))
+    res = await uc.get_count_ads_by_acc_ids(req)
+    return SuccessResp[dict[UUID, int]](payload=res)
+
+
 @router.patch(
     Enp.ADS_CHANGE,
     summary="Изменить мое объявление",
@@ -197,11 +261,9 @@ async def change_my_ads(
     jwt: AJwt,
     req: QChangeAds,
     __repo_session: Annotated[AsyncSession, Depends(get_ads_repo_session)],
-    __compl_svc: Annotated[ComplService, Depends(get_compl_serivce)],
-    __tg_svc: Annotated[TgClient, Depends(get_tg_bot)],
 ) -> SuccessResp[ZAds] | SuccessResp[ZBanned]:
     """Обрабатывает HTTP-запрос на изменение моего объявления с авторизацией."""
-    uc = AdsUseCase(AdsRepo(__repo_session), __compl_svc, __tg_svc)
+    uc = AdsUseCase(AdsRepo(__repo_session))
 
     if not jwt:
         raise ExpError(ExpCode.SYS_UNAUTHORIZE)
@@ -233,11 +295,9 @@ async def change_category_ads(
     ads_id: Annotated[UUID, Path()],
     req: Annotated[QAdsCategory, Query()],
     __repo_session: Annotated[AsyncSession, Depends(get_ads_repo_session)],
-    __compl_svc: Annotated[ComplService, Depends(get_compl_serivce)],
-    __tg_svc: Annotated[TgClient, Depends(get_tg_bot)],
 ) -> SuccessResp[ZAds] | SuccessResp[ZBanned]:
     """Обрабатывает HTTP-запрос на изменение категории объявления с авторизацией."""
-    uc = AdsUseCase(AdsRepo(__repo_session), __compl_svc, __tg_svc)
+    uc = AdsUseCase(AdsRepo(__repo_session))
 
     if not jwt:
         raise ExpError(ExpCode.SYS_UNAUTHORIZE)
@@ -268,11 +328,9 @@ async def delete_ads(
     jwt: AJwt,
     ads_id: Annotated[UUID, Path()],
     __repo_session: Annotated[AsyncSession, Depends(get_ads_repo_session)],
-    __compl_svc: Annotated[ComplService, Depends(get_compl_serivce)],
-    __tg_svc: Annotated[TgClient, Depends(get_tg_bot)],
 ) -> SuccessResp | SuccessResp[ZBanned]:
     """Обрабатывает HTTP-запрос на удаление объявления с авторизацией."""
-    uc = AdsUseCase(AdsRepo(__repo_session), __compl_svc, __tg_svc)
+    uc = AdsUseCase(AdsRepo(__repo_session))
 
     if not jwt:
         raise ExpError(ExpCode.SYS_UNAUTHORIZE)
@@ -304,11 +362,9 @@ async def adm_delete_ads(
     ads_id: Annotated[UUID, Path()],
     reason: Annotated[str, Body()],
     __repo_session: Annotated[AsyncSession, Depends(get_ads_repo_session)],
-    __compl_svc: Annotated[ComplService, Depends(get_compl_serivce)],
-    __tg_svc: Annotated[TgClient, Depends(get_tg_bot)],
 ) -> SuccessResp | SuccessResp[ZBanned]:
     """Обрабатывает HTTP-запрос на удаление объявления из общего списка с авторизацией администратора."""
-    uc = AdsUseCase(AdsRepo(__repo_session), __compl_svc, __tg_svc)
+    uc = AdsUseCase(AdsRepo(__repo_session))
 
     if not jwt:
         raise ExpError(ExpCode.SYS_UNAUTHORIZE)
@@ -320,6 +376,69 @@ async def adm_delete_ads(
     return SuccessResp()
 
 
+@router.post(
+    Enp.ADM_IMPORT_ADS,
+    summary="Импорт объявлений из NDJSON/CSV (Администратор)",
+    status_code=200,
+    responses=responses(400, 503),
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/x-ndjson": {"schema": {"type": "string"}},
+                "text/csv": {"schema": {"type": "string"}},
+            },
+        }
+    },
+)
+async def adm_import_ads(
+    jwt: AJwt,
+    request: Request,
+    fmt: QAdsFileFormat = QAdsFileFormat.NDJSON,
+) -> SuccessResp[ZAdsImport] | SuccessResp[ZBanned]:
+    """Обрабатывает HTTP-запрос на потоковый импорт объявлений из тела запроса с авторизацией администратора."""
+    if not jwt:
+        raise ExpError(ExpCode.SYS_UNAUTHORIZE)
+
+    if jwt["role"] != AccRole.ADMIN.value:
+        raise ExpError(ExpCode.ADS_INCORRECT_ROLE)
+
+    try:
+        res = await AdsImporter().run(request.stream(), fmt)
+    except ValueError as e:
+        raise ExpError(ExpCode.ADS_INVALID_IMPORT_FILE, str(e)) from e
+    return SuccessResp[ZAdsImport](payload=res)
+
+
+@router.get(
+    Enp.ADM_EXPORT_ADS,
+    summary="Выгрузить все объявления в NDJSON/CSV (Администратор, API-ключ)",
+    status_code=200,
+    responses=responses(400, 503),
+    response_class=StreamingResponse,
+)
+async def adm_export_ads(
+    jwt: AJwt,
+    apikey: ApiKey,
+    fmt: QAdsFileFormat = QAdsFileFormat.NDJSON,
+) -> StreamingResponse:
+    """Обрабатывает HTTP-запрос на потоковую выгрузку всех объявлений с авторизацией администратора или по API-ключу."""
+    if not apikey:
+        if not jwt:
+            raise ExpError(ExpCode.SYS_UNAUTHORIZE)
+
+        if jwt["role"] != AccRole.ADMIN.value:
+            raise ExpError(ExpCode.ADS_INCORRECT_ROLE)
+
+    exporter = AdsExporter(fmt)
+    await exporter.open()
+    return StreamingResponse(
+        exporter.stream(),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="ads.{fmt.value}"'},
+    )
+
+
 @router.post(
     Enp.ADS_ADD_COMMENTARY,
     summary="Добавить комментарий к объявлению",
@@ -331,11 +450,9 @@ async def create_ads_commentary(
     ads_id: Annotated[UUID, Path()],
     commentary: Annotated[str, Body()],
     __repo_session: Annotated[AsyncSession, Depends(get_ads_repo_session)],
-    __compl_svc: Annotated[ComplService, Depends(get_compl_serivce)],
-    __tg_svc: Annotated[TgClient, Depends(get_tg_bot)],
 ) -> SuccessResp[ZAdsComment] | SuccessResp[ZBanned]:
     """Обрабатывает HTTP-запрос на добавление комментария к объявлению с авторизацией."""
-    uc = AdsUseCase(AdsRepo(__repo_session), __compl_svc, __tg_svc)
+    uc = AdsUseCase(AdsRepo(__repo_session))
 
     if not jwt:
         raise ExpError(ExpCode.SYS_UNAUTHORIZE)
@@ -366,13 +483,12 @@ async def create_ads_commentary(
 )
 async def get_ads_commentaries(
     ads_id: Annotated[UUID, Path()],
-    __repo_session: Annotated[AsyncSession, Depends(get_ads_repo_session)],
-    __compl_svc: Annotated[ComplService, Depends(get_compl_serivce)],
-    __tg_svc: Annotated[TgClient, Depends(get_tg_bot)],
+    qfilter: Annotated[QCommentFilter, Query()],
+    __repo_session: Annotated[AsyncSession, Depends(get_ads_repo_read_session)],
 ) -> SuccessResp[ZManyAdsComment]:
-    """Обрабатывает HTTP-запрос на получение списка комментариев в объявлении."""
-    uc = AdsUseCase(AdsRepo(__repo_session), __compl_svc, __tg_svc)
-    res = await uc.get_ads_commentaries(ads_id)
+    """Обрабатывает HTTP-запрос на получение страницы комментариев в объявлении."""
+    uc = AdsUseCase(AdsRepo(__repo_session))
+    res = await uc.get_ads_commentaries(ads_id, qfilter)
     return SuccessResp[ZManyAdsComment](payload=res)
 
 
@@ -385,12 +501,10 @@ async def get_ads_commentaries(
 async def get_ads_commentary(
     ads_id: Annotated[UUID, Path()],
     comm_id: Annotated[UUID, Path()],
-    __repo_session: Annotated[AsyncSession, Depends(get_ads_repo_session)],
-    __compl_svc: Annotated[ComplService, Depends(get_compl_serivce)],
-    __tg_svc: Annotated[TgClient, Depends(get_tg_bot)],
+    __repo_session: Annotated[AsyncSession, Depends(get_ads_repo_read_session)],
 ) -> SuccessResp[ZAdsComment]:
     """Обрабатывает HTTP-запрос на получение данных по комментарию в объявлении."""
-    uc = AdsUseCase(AdsRepo(__repo_session), __compl_svc, __tg_svc)
+    uc = AdsUseCase(AdsRepo(__repo_session))
     res = await uc.get_ads_commentary(ads_id, comm_id)
     return SuccessResp[ZAdsComment](payload=res)
 
@@ -407,11 +521,9 @@ async def update_ads_commentary(
     comm_id: Annotated[UUID, Path()],
     commentary: Annotated[str, Body()],
     __repo_session: Annotated[AsyncSession, Depends(get_ads_repo_session)],
-    __compl_svc: Annotated[ComplService, Depends(get_compl_serivce)],
-    __tg_svc: Annotated[TgClient, Depends(get_tg_bot)],
 ) -> SuccessResp[ZAdsComment] | SuccessResp[ZBanned]:
     """Обрабатывает HTTP-запрос на изменение комментария в объявлении с авторизацией."""
-    uc = AdsUseCase(AdsRepo(__repo_session), __compl_svc, __tg_svc)
+    uc = AdsUseCase(AdsRepo(__repo_session))
 
     if not jwt:
         raise ExpError(ExpCode.SYS_UNAUTHORIZE)
@@ -447,11 +559,9 @@ async def delete_ads_commentary(
     ads_id: Annotated[UUID, Path()],
     comm_id: Annotated[UUID, Path()],
     __repo_session: Annotated[AsyncSession, Depends(get_ads_repo_session)],
-    __compl_svc: Annotated[ComplService, Depends(get_compl_serivce)],
-    __tg_svc: Annotated[TgClient, Depends(get_tg_bot)],
 ) -> SuccessResp | SuccessResp[ZBanned]:
     """Обрабатывает HTTP-запрос на удаление комментария в объявлении с авторизацией."""
-    uc = AdsUseCase(AdsRepo(__repo_session), __compl_svc, __tg_svc)
+    uc = AdsUseCase(AdsRepo(__repo_session))
 
     if not jwt:
         raise ExpError(ExpCode.SYS_UNAUTHORIZE)
@@ -484,11 +594,9 @@ async def adm_delete_ads_commentary(
     jwt: AJwt,
     comm_id: Annotated[UUID, Path()],
     __repo_session: Annotated[AsyncSession, Depends(get_ads_repo_session)],
-    __compl_svc: Annotated[ComplService, Depends(get_compl_serivce)],
-    __tg_svc: Annotated[TgClient, Depends(get_tg_bot)],
 ) -> SuccessResp:
     """Обрабатывает HTTP-запрос на удаление комментария в объявлении администратором."""
-    uc = AdsUseCase(AdsRepo(__repo_session), __compl_svc, __tg_svc)
+    uc = AdsUseCase(AdsRepo(__repo_session))
 
     if not jwt:
         raise ExpError(ExpCode.SYS_UNAUTHORIZE)
@@ -511,11 +619,9 @@ async def send_complaint(
     ads_id: Annotated[UUID, Path()],
     msg: Annotated[str, Body()],
     __repo_session: Annotated[AsyncSession, Depends(get_ads_repo_session)],
-    __compl_svc: Annotated[ComplService, Depends(get_compl_serivce)],
-    __tg_svc: Annotated[TgClient, Depends(get_tg_bot)],
 ) -> SuccessResp[ZCompl]:
     """Обрабатывает HTTP-запрос на отправку жалобы на объявление."""
-    uc = AdsUseCase(AdsRepo(__repo_session), __compl_svc, __tg_svc)
+    uc = AdsUseCase(AdsRepo(__repo_session))
 
     if not jwt:
         raise ExpError(ExpCode.SYS_UNAUTHORIZE)
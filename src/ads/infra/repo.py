@@ -1,24 +1,322 @@
-from uuid import UUID
+import re
+from datetime import datetime
+from uuid import UUID, uuid4
+from typing import AsyncIterator, Callable
+from asyncpg import PostgresError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.dialects.postgresql import insert
-from sqlalchemy import select, delete, update, text, func
-from sqlalchemy.exc import NoResultFound
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import insert, ARRAY, TSVECTOR
+from sqlalchemy import (
+    select,
+    delete,
+    update,
+    text,
+    func,
+    bindparam,
+    tuple_,
+    literal_column,
+    event,
+    or_,
+    any_,
+    String,
+    Uuid,
+)
+from sqlalchemy.exc import DBAPIError, NoResultFound
 
+from kernel.cursor import decode_cursor, encode_cursor
 from kernel.exception import ExpError, ExpCode
 
 from ..domain.irepo import IAdsRepo
 from ..domain.dto import (
     QCreateAds,
+    QCreateAdsItem,
+    QAccountAdsFilter,
     QFilter,
+    QSearch,
     QAdsCategory,
     QAdsPriceFilter,
     QChangeAds,
     QAddAdsComment,
+    QCommentFilter,
+    QCommentOrder,
     QUpdateAdsComment,
 )
-from ..domain.models import Ads, AdsComment
+from ..domain.models import Ads, AdsComment, AdsStats
+
+from .views import add_view
+from .xdao import (
+    XAds,
+    XAdsBulkResult,
+    XAdsComment,
+    XAdsCommentPage,
+    XAdsPage,
+    XAdsRef,
+    XAdsTitle,
+    XCounterChunk,
+    XCounterDrift,
+)
 
-from .xdao import XAds, XAdsComment
+# Горячие запросы собираются один раз при импорте: Core-выражения по таблицам
+# возвращают строки без ORM-сущностей, а параметры передаются через bindparam.
+ADS = Ads.__table__
+ADS_COMMENT = AdsComment.__table__
+ADS_STATS = AdsStats.__table__
+
+# Объявление читается вместе со счётчиками из узкой таблицы AdsStats.
+STATS_COLUMNS = (
+    func.coalesce(ADS_STATS.c.count_views, 0).label("count_views"),
+    func.coalesce(ADS_STATS.c.count_comments, 0).label("count_comments"),
+)
+ADS_WITH_STATS = ADS.outerjoin(ADS_STATS, ADS_STATS.c.ads_id == ADS.c.id)
+
+SELECT_ADS = select(*ADS.c, *STATS_COLUMNS).select_from(ADS_WITH_STATS)
+# Объявления аккаунта вместе с количеством всех его объявлений; оба идут по
+# индексам с ведущей account_id (миграция 011).
+COUNT_ADS_BY_ACCOUNT_ID = (
+    select(func.count())
+    .select_from(ADS)
+    .where(ADS.c.account_id == bindparam("acc_id"))
+    .scalar_subquery()
+)
+SELECT_ADS_BY_ACCOUNT_ID = SELECT_ADS.add_columns(
+    COUNT_ADS_BY_ACCOUNT_ID.label("total")
+).where(ADS.c.account_id == bindparam("acc_id"))
+# Колонки Ads, заполняемые при импорте через COPY; остальные берут DEFAULT.
+COPY_ADS_COLUMNS = ("account_id", "title", "description", "ads_category", "price")
+# Число строк Ads по статистике планировщика (обновляется autovacuum/ANALYZE);
+# -1, если таблица ещё не анализировалась и оценкам планировщика верить нельзя.
+ESTIMATE_ADS_TOTAL = literal_column(
+    "(SELECT reltuples::bigint FROM pg_class WHERE oid = '\"Ads\"'::regclass)"
+)
+SELECT_ADS_BY_ID = SELECT_ADS.where(ADS.c.id == bindparam("ads_id"))
+# Количество комментариев объявления берётся из счётчика AdsStats, а не
+# count(*) по AdsComment.
+COUNT_COMMENTS_BY_ADS_ID = func.coalesce(
+    select(ADS_STATS.c.count_comments)
+    .where(ADS_STATS.c.ads_id == bindparam("ads_id"))
+    .scalar_subquery(),
+    0,
+)
+SELECT_COMMENTS_BY_ADS_ID = select(
+    *ADS_COMMENT.c, COUNT_COMMENTS_BY_ADS_ID.label("total")
+).where(ADS_COMMENT.c.ads_id == bindparam("ads_id"))
+
+# Лента и поиск не показывают помеченные удалёнными объявления; условие
+# совпадает с предикатом частичных индексов ленты (миграция 009).
+FEED_VISIBLE = ~ADS.c.is_deleted
+# Оценка числа объявлений ленты — строки плана выборки по FEED_VISIBLE:
+# reltuples с долей неудалённых по статистике is_deleted. reltuples сам по
+# себе учитывает и помеченные удалёнными.
+ESTIMATE_FEED_TOTAL = text(
+    "EXPLAIN (FORMAT JSON) "
+    + str(select(ADS.c.id).where(FEED_VISIBLE).compile(dialect=postgresql.dialect()))
+)
+
+# Сортировки ленты объявлений: имя в курсоре, колонка ключа и направление.
+# id замыкает ключ, чтобы порядок был строгим при равных ценах и датах; обе
+# колонки идут в одном направлении, поэтому keyset-условие записывается
+# сравнением кортежей и идёт по индексам (created_at, id) и (price, id) или
+# их вариантам с ведущей ads_category.
+ADS_ORDERINGS = {
+    None: ("created_desc", ADS.c.created_at, False),
+    QAdsPriceFilter.BY_INCREASE: ("price_asc", ADS.c.price, True),
+    QAdsPriceFilter.BY_DECREASE: ("price_desc", ADS.c.price, False),
+}
+
+# Запись комментария и изменение счётчика count_comments — один запрос с
+# изменяющим данные CTE: оба изменения видны или не видны вместе, а счётчик
+# меняется, только если комментарий действительно вставлен или удалён.
+# Комментарий вставляется из строк CTE, поэтому к отсутствующему объявлению
+# (без строки AdsStats) ничего не вставится. Запросы возвращают и категорию
+# объявления, чтобы сбросить страницы ленты с его count_comments. Имена
+# параметров не совпадают с колонками: такие имена SQLAlchemy резервирует за
+# VALUES/SET.
+_COMMENT_BUMPED = (
+    update(ADS_STATS)
+    .values(count_comments=ADS_STATS.c.count_comments + 1)
+    .where(
+        ADS_STATS.c.ads_id == bindparam("comm_ads_id"),
+        ADS.c.id == ADS_STATS.c.ads_id,
+    )
+    .returning(ADS_STATS.c.ads_id, ADS.c.ads_category)
+    .cte("bumped")
+)
+_COMMENT_INSERTED = (
+    insert(ADS_COMMENT)
+    .from_select(
+        ["ads_id", "account_id", "ads_comment"],
+        select(
+            _COMMENT_BUMPED.c.ads_id,
+            bindparam("acc_id", type_=ADS_COMMENT.c.account_id.type),
+            bindparam("comm_text", type_=ADS_COMMENT.c.ads_comment.type),
+        ),
+        # id и created_at берут DEFAULT таблицы.
+        include_defaults=False,
+    )
+    .returning(*ADS_COMMENT.c)
+    .cte("inserted")
+)
+CREATE_COMMENT = select(*_COMMENT_INSERTED.c, _COMMENT_BUMPED.c.ads_category).join_from(
+    _COMMENT_INSERTED,
+    _COMMENT_BUMPED,
+    _COMMENT_BUMPED.c.ads_id == _COMMENT_INSERTED.c.ads_id,
+)
+
+
+def delete_comment(*conds):
+    """Строит удаление комментария с уменьшением счётчика объявления.
+
+    Args:
+        *conds: Условия WHERE по AdsComment.
+
+    Returns:
+        Update: Запрос, возвращающий id и категорию объявления удалённого
+            комментария (нет строк, если комментарий не найден).
+    """
+    deleted = (
+        delete(ADS_COMMENT).where(*conds).returning(ADS_COMMENT.c.ads_id).cte("deleted")
+    )
+    return (
+        update(ADS_STATS)
+        .values(count_comments=ADS_STATS.c.count_comments - 1)
+        .where(ADS_STATS.c.ads_id == deleted.c.ads_id, ADS.c.id == deleted.c.ads_id)
+        .returning(ADS_STATS.c.ads_id.label("id"), ADS.c.ads_category)
+    )
+
+
+DELETE_COMMENT = delete_comment(
+    ADS_COMMENT.c.id == bindparam("comm_id"),
+    ADS_COMMENT.c.ads_id == bindparam("comm_ads_id"),
+    ADS_COMMENT.c.account_id == bindparam("acc_id"),
+)
+ADM_DELETE_COMMENT = delete_comment(ADS_COMMENT.c.id == bindparam("comm_id"))
+
+COUNT_ADS_BY_ACC_IDS = (
+    select(ADS.c.account_id, func.count())
+    .where(ADS.c.account_id == any_(bindparam("acc_ids", type_=ARRAY(Uuid))))
+    .group_by(ADS.c.account_id)
+)
+
+# Сверка count_comments идёт пачками по ads_id. Сначала для объявлений пачки
+# создаются недостающие строки AdsStats (их счётчик выставляет та же сверка),
+# после чего строки AdsStats пачки совпадают с объявлениями пачки. Затем они
+# блокируются: запись комментария меняет AdsStats в той же транзакции, что и
+# AdsComment, поэтому после блокировки незавершённых записей по пачке нет, а
+# следующий запрос видит все зафиксированные комментарии и пересчитывает
+# счётчик точно. Новые записи ждут конца короткой транзакции пачки.
+_ADS_CHUNK = (
+    select(ADS.c.id)
+    .where(ADS.c.id > bindparam("after"))
+    .order_by(ADS.c.id)
+    .limit(bindparam("chunk_size"))
+    .subquery("chunk")
+)
+CREATE_MISSING_STATS = (
+    insert(ADS_STATS)
+    .from_select(
+        ["ads_id"],
+        select(_ADS_CHUNK.c.id)
+        .select_from(
+            _ADS_CHUNK.outerjoin(ADS_STATS, ADS_STATS.c.ads_id == _ADS_CHUNK.c.id)
+        )
+        .where(ADS_STATS.c.ads_id.is_(None)),
+    )
+    .on_conflict_do_nothing(index_elements=[ADS_STATS.c.ads_id])
+    .returning(ADS_STATS.c.ads_id)
+)
+LOCK_STATS_CHUNK = (
+    select(ADS_STATS.c.ads_id)
+    .where(ADS_STATS.c.ads_id > bindparam("after"))
+    .order_by(ADS_STATS.c.ads_id)
+    .limit(bindparam("chunk_size"))
+    .with_for_update()
+)
+_STORED = ADS_STATS.alias("stored")
+_STATS_ACTUAL = (
+    select(
+        _STORED.c.ads_id,
+        _STORED.c.count_comments.label("stored"),
+        select(func.count())
+        .select_from(ADS_COMMENT)
+        .where(ADS_COMMENT.c.ads_id == _STORED.c.ads_id)
+        .scalar_subquery()
+        .label("actual"),
+    )
+    .where(_STORED.c.ads_id == any_(bindparam("ads_ids", type_=ARRAY(Uuid))))
+    .subquery("actual")
+)
+FIX_COMMENT_COUNTERS = (
+    update(ADS_STATS)
+    .values(count_comments=_STATS_ACTUAL.c.actual)
+    .where(
+        ADS_STATS.c.ads_id == _STATS_ACTUAL.c.ads_id,
+        _STATS_ACTUAL.c.stored != _STATS_ACTUAL.c.actual,
+    )
+    .returning(
+        ADS_STATS.c.ads_id.label("id"), _STATS_ACTUAL.c.stored, _STATS_ACTUAL.c.actual
+    )
+)
+
+# Порядки комментариев объявления: имя в курсоре и направление по
+# (created_at, id), индекс (ads_id, created_at, id) из миграции 010.
+COMMENT_ORDERINGS = {
+    QCommentOrder.NEWEST: ("comment_desc", False),
+    QCommentOrder.OLDEST: ("comment_asc", True),
+}
+# Сортировки, ключ которых в курсоре — дата в ISO-формате.
+DATETIME_ORDERINGS = {"created_desc", "comment_desc", "comment_asc"}
+
+# Генерируемая колонка поиска (миграция 007) не входит в модель Ads, чтобы
+# не читаться вместе с объявлением.
+SEARCH_VECTOR = literal_column('"Ads".search_vector', TSVECTOR)
+SEARCH_CONFIG = literal_column("'russian'::regconfig")
+SEARCH_ORDERING = "rank"
+
+# Подсказки по заголовку идут по триграммному индексу (миграция 008): сначала
+# заголовки, начинающиеся с префикса, затем нечёткие совпадения слов.
+# Префиксу короче SUGGEST_TRGM_MIN_LEN триграмм не хватает, такие префиксы
+# ищутся только по началу заголовка через B-tree по lower(title) COLLATE "C".
+# Экранирование в шаблоне — обратной косой чертой, escape-символом LIKE по
+# умолчанию в Postgres.
+SUGGEST_TRGM_MIN_LEN = 3
+SUGGEST_PREFIX = ADS.c.title.ilike(bindparam("pattern"))
+SUGGEST_ADS = (
+    select(ADS.c.id, ADS.c.title)
+    .where(
+        FEED_VISIBLE,
+        or_(
+            SUGGEST_PREFIX, bindparam("prefix", type_=String).bool_op("<%")(ADS.c.title)
+        ),
+    )
+    .order_by(
+        SUGGEST_PREFIX.desc(),
+        func.word_similarity(bindparam("prefix"), ADS.c.title).desc(),
+        ADS.c.id,
+    )
+    .limit(bindparam("limit"))
+)
+SUGGEST_TITLE_C = func.lower(ADS.c.title).collate("C")
+SUGGEST_ADS_SHORT = (
+    select(ADS.c.id, ADS.c.title)
+    .where(FEED_VISIBLE, SUGGEST_TITLE_C.like(bindparam("pattern")))
+    .order_by(SUGGEST_TITLE_C, ADS.c.id)
+    .limit(bindparam("limit"))
+)
+
+
+def with_stats(stmt):
+    """Дополняет изменённые строки Ads счётчиками из AdsStats.
+
+    Args:
+        stmt: INSERT или UPDATE по Ads с returning(*ADS.c).
+
+    Returns:
+        Select: Один запрос, возвращающий строки для XAds.
+    """
+    changed = stmt.cte("changed")
+    return select(*changed.c, *STATS_COLUMNS).select_from(
+        changed.outerjoin(ADS_STATS, ADS_STATS.c.ads_id == changed.c.id)
+    )
 
 
 class AdsRepo(IAdsRepo):
@@ -31,6 +329,25 @@ class AdsRepo(IAdsRepo):
     def __init__(self, _session: AsyncSession):
         self.session: AsyncSession = _session
 
+    async def warmup(self) -> None:
+        """Выполняет горячие запросы чтения для прогрева кешей запросов."""
+        await self.get_ads_all(QFilter())
+        await self.get_ads_by_account_id(UUID(int=0), QAccountAdsFilter())
+        await self.get_ads_commentaries(UUID(int=0), QCommentFilter())
+        await self.get_count_ads_by_acc_id(UUID(int=0))
+
+    def after_commit(self, func: Callable[[], None]) -> None:
+        """Выполняет функцию после фиксации транзакции сессии.
+
+        При откате транзакции функция не вызывается.
+
+        Args:
+            func (Callable[[], None]): Функция без аргументов.
+        """
+        event.listen(
+            self.session.sync_session, "after_commit", lambda _: func(), once=True
+        )
+
     async def create_ads(
         self, ads: QCreateAds, ads_category: QAdsCategory, acc_id: UUID | None = None
     ) -> XAds:
@@ -53,84 +370,347 @@ class AdsRepo(IAdsRepo):
                 ads_category=ads_category.value,
                 price=ads.price,
             )
-            .returning(Ads)
+            .returning(*ADS.c)
         )
         res = await self.session.execute(req)
-        await self.session.commit()
-        row = res.scalar_one()
-        return XAds(
-            id=row.id,
-            account_id=row.account_id,
-            title=row.title,
-            description=row.description,
-            ads_category=row.ads_category,
-            price=row.price,
-            count_views=row.count_views,
-            count_comments=row.count_comments,
-            is_deleted=row.is_deleted,
-            created_at=row.created_at,
-            updated_at=row.updated_at,
-            deleted_at=row.deleted_at,
-            reason_deletion=row.reason_deletion,
+        # Строку AdsStats создаёт триггер, счётчики нового объявления нулевые.
+        return XAds(**res.mappings().one(), count_views=0, count_comments=0)
+
+    async def create_ads_bulk(
+        self, items: list[QCreateAdsItem]
+    ) -> list[XAdsBulkResult]:
+        """Создаёт пакет объявлений одним многострочным INSERT.
+
+        Пакет вставляется в точке сохранения. Если вставка не удалась,
+        объявления вставляются по одному, каждое в своей точке сохранения,
+        чтобы ошибка одного не отменяла остальные.
+
+        Args:
+            items (list[QCreateAdsItem]): Объявления с владельцем и категорией.
+
+        Returns:
+            list[XAdsBulkResult]: Результат по каждому объявлению в порядке
+                items.
+        """
+        # id задаются заранее: порядок строк RETURNING не гарантирован.
+        values = [
+            {
+                "id": uuid4(),
+                "account_id": item.account_id,
+                "title": item.title,
+                "description": item.description,
+                "ads_category": item.ads_category.value,
+                "price": item.price,
+            }
+            for item in items
+        ]
+        try:
+            async with self.session.begin_nested():
+                res = await self.session.execute(
+                    insert(Ads).values(values).returning(*ADS.c)
+                )
+                rows = {row["id"]: row for row in res.mappings()}
+        except DBAPIError:
+            return [
+                await self._create_ads_one(index, row)
+                for index, row in enumerate(values)
+            ]
+        return [
+            XAdsBulkResult(
+                index=index,
+                ads=XAds(**rows[row["id"]], count_views=0, count_comments=0),
+            )
+            for index, row in enumerate(values)
+        ]
+
+    async def copy_ads(self, items: list[QCreateAdsItem]) -> int:
+        """Загружает объявления через COPY в точке сохранения.
+
+        COPY вставляет пачку целиком или не вставляет ничего. Строки AdsStats
+        создаёт триггер, как и при INSERT.
+
+        Args:
+            items (list[QCreateAdsItem]): Объявления с владельцем и категорией.
+
+        Returns:
+            int: Количество загруженных объявлений.
+
+        Raises:
+            ValueError: Если БД отклонила пачку (пачка не загружена).
+        """
+        records = [
+            (
+                item.account_id,
+                item.title,
+                item.description,
+                item.ads_category.value,
+                item.price,
+            )
+            for item in items
+        ]
+        conn = await self.session.connection()
+        raw = await conn.get_raw_connection()
+        try:
+            async with self.session.begin_nested():
+                await raw.driver_connection.copy_records_to_table(
+                    ADS.name, records=records, columns=COPY_ADS_COLUMNS
+                )
+        except PostgresError as e:
+            raise ValueError(str(e)) from e
+        return len(records)
+
+    async def _create_ads_one(self, index: int, values: dict) -> XAdsBulkResult:
+        """Вставляет одно объявление пакета в отдельной точке сохранения."""
+        try:
+            async with self.session.begin_nested():
+                res = await self.session.execute(
+                    insert(Ads).values(values).returning(*ADS.c)
+                )
+                row = res.mappings().one()
+        except DBAPIError as e:
+            # Текст ошибки Postgres без префикса класса исключения драйвера.
+            error = getattr(e.orig.__cause__, "message", str(e.orig))
+            return XAdsBulkResult(index=index, error=error)
+        return XAdsBulkResult(
+            index=index, ads=XAds(**row, count_views=0, count_comments=0)
         )
 
-    async def get_ads_all(self, qfilter: QFilter) -> tuple[int, list[XAds]]:
+    async def get_ads_all(self, qfilter: QFilter) -> XAdsPage:
         """Получает все объявления с учётом фильтров и пагинации.
 
+        С курсором страница выбирается keyset-условием после последней записи
+        предыдущей страницы, offset при этом не учитывается. Без курсора
+        работает прежняя пагинация по offset. Помеченные удалёнными объявления в
+        ленту не попадают.
+
+        Общее количество учитывает фильтры и считается подзапросом в том же
+        запросе, что и страница. С estimate_total лента без фильтров берёт
+        оценку планировщика для выборки неудалённых объявлений вместо
+        count(*).
+
         Args:
             qfilter (QFilter): Параметры фильтрации и пагинации.
 
         Returns:
-            tuple[int, list[XAds]]: Общее количество объявлений и список объявлений.
+            XAdsPage: Общее количество, объявления страницы и курсор следующей
+                страницы (None, если страница последняя).
+
+        Raises:
+            ValueError: Если курсор повреждён или выдан для другой сортировки.
         """
-        count_req = select(func.count()).select_from(Ads)
-        count_res = await self.session.execute(count_req)
-        await self.session.commit()
-        total = count_res.scalar_one()
+        try:
+            order_name, key, asc = ADS_ORDERINGS[qfilter.price]
+        except KeyError as e:
+            raise ExpError(ExpCode.ADS_FILTER_ERR) from e
+
+        filters = self._filter_conds(qfilter)
+        conds = [FEED_VISIBLE, *filters]
+        is_estimated = qfilter.estimate_total and not filters
+        count_req = select(func.count()).select_from(ADS).where(*conds)
+        req = SELECT_ADS.where(*conds)
+        if not is_estimated:
+            req = req.add_columns(count_req.scalar_subquery().label("total"))
+        if qfilter.cursor:
+            last = self._decode_ads_cursor(qfilter.cursor, order_name)
+            position = tuple_(key, ADS.c.id)
+            req = req.where(position > last if asc else position < last)
+        else:
+            req = req.offset(qfilter.offset)
+
+        if asc:
+            req = req.order_by(key.asc(), ADS.c.id.asc())
+        else:
+            req = req.order_by(key.desc(), ADS.c.id.desc())
+
+        # Лишняя строка показывает, есть ли следующая страница.
+        xres = await self.session.execute(req.limit(qfilter.limit + 1))
+        rows = xres.mappings().all()
+        total = -1
+        if is_estimated:
+            total = await self._estimate_feed_total()
+            is_estimated = total >= 0
+        elif rows:
+            total = rows[0]["total"]
+        if total < 0:
+            # Пустая страница (конец ленты) не вернула строку с количеством или
+            # статистики для оценки ещё нет.
+            total = (await self.session.execute(count_req)).scalar_one()
+
+        res = [XAds(**row) for row in rows[: qfilter.limit]]
+        next_cursor = None
+        if len(rows) > len(res) and res:
+            value = getattr(res[-1], key.name)
+            if isinstance(value, datetime):
+                value = value.isoformat()
+            next_cursor = encode_cursor(
+                {"o": order_name, "k": value, "id": str(res[-1].id)}
+            )
+        return XAdsPage(
+            total=total,
+            is_total_estimated=is_estimated,
+            items=res,
+            next_cursor=next_cursor,
+        )
 
-        req = select(Ads).limit(qfilter.limit).offset(qfilter.offset)
-        if qfilter.ads_category:
-            req = req.where(Ads.ads_category == qfilter.ads_category.value)
+    async def stream_ads(self, chunk_size: int) -> AsyncIterator[list[XAds]]:
+        """Читает все объявления серверным курсором.
 
-        if qfilter.price:
-            if qfilter.price == QAdsPriceFilter.BY_DECREASE:
-                req = req.order_by(Ads.price.desc())
-            elif qfilter.price == QAdsPriceFilter.BY_INCREASE:
-                req = req.order_by(Ads.price.asc())
-            else:
-                raise ExpError(ExpCode.ADS_FILTER_ERR)
+        Строки забираются из курсора пачками, поэтому в памяти находится не
+        больше одной пачки независимо от размера таблицы. Удалённые объявления
+        тоже выгружаются. Сессия должна оставаться открытой, пока итератор не
+        исчерпан.
 
-        if qfilter.price_from:
-            req = req.where(Ads.price > qfilter.price_from)
+        Args:
+            chunk_size (int): Количество строк в пачке.
 
-        if qfilter.price_to:
-            req = req.where(Ads.price < qfilter.price_to)
+        Yields:
+            list[XAds]: Очередная пачка объявлений.
+        """
+        res = await self.session.stream(
+            SELECT_ADS.execution_options(yield_per=chunk_size)
+        )
+        async for rows in res.mappings().partitions():
+            yield [XAds(**row) for row in rows]
+
+    async def search_ads(self, qsearch: QSearch) -> XAdsPage:
+        """Ищет объявления по заголовку и описанию.
+
+        Совпадения выбираются по GIN-индексу search_vector и упорядочены по
+        релевантности (ts_rank_cd), при равной релевантности по id. Фильтры
+        категории и цены применяются как в ленте, общее количество считается
+        по всем совпадениям подзапросом в том же запросе.
+
+        Args:
+            qsearch (QSearch): Поисковая строка, фильтры и курсор.
+
+        Returns:
+            XAdsPage: Количество совпадений, объявления страницы и курсор
+                следующей страницы.
+
+        Raises:
+            ValueError: Если курсор повреждён или выдан не для поиска.
+        """
+        query = func.websearch_to_tsquery(SEARCH_CONFIG, qsearch.query)
+        conds = [
+            SEARCH_VECTOR.bool_op("@@")(query),
+            FEED_VISIBLE,
+            *self._filter_conds(qsearch),
+        ]
+        rank = func.ts_rank_cd(SEARCH_VECTOR, query)
+        total_col = (
+            select(func.count()).select_from(ADS).where(*conds).scalar_subquery()
+        )
+
+        req = SELECT_ADS.add_columns(
+            rank.label("rank"), total_col.label("total")
+        ).where(*conds)
+        if qsearch.cursor:
+            last = self._decode_ads_cursor(qsearch.cursor, SEARCH_ORDERING)
+            req = req.where(tuple_(rank, ADS.c.id) < last)
+        req = req.order_by(rank.desc(), ADS.c.id.desc()).limit(qsearch.limit + 1)
 
         xres = await self.session.execute(req)
-        await self.session.commit()
-        res = []
-        for row in xres.scalars().all():
-            res.append(
-                XAds(
-                    id=row.id,
-                    account_id=row.account_id,
-                    title=row.title,
-                    description=row.description,
-                    ads_category=row.ads_category,
-                    price=row.price,
-                    count_views=row.count_views,
-                    count_comments=row.count_comments,
-                    is_deleted=row.is_deleted,
-                    created_at=row.created_at,
-                    updated_at=row.updated_at,
-                    deleted_at=row.deleted_at,
-                    reason_deletion=row.reason_deletion,
-                )
+        rows = xres.mappings().all()
+        if rows:
+            total = rows[0]["total"]
+        else:
+            total = (await self.session.execute(select(total_col))).scalar_one()
+
+        page = rows[: qsearch.limit]
+        next_cursor = None
+        if len(rows) > len(page) and page:
+            next_cursor = encode_cursor(
+                {"o": SEARCH_ORDERING, "k": page[-1]["rank"], "id": str(page[-1]["id"])}
+            )
+        return XAdsPage(
+            total=total, items=[XAds(**row) for row in page], next_cursor=next_cursor
+        )
+
+    async def _estimate_feed_total(self) -> int:
+        """Оценивает число объявлений ленты по статистике планировщика.
+
+        Returns:
+            int: Оценка или -1, если "Ads" ещё не анализировалась.
+        """
+        reltuples = (await self.session.execute(select(ESTIMATE_ADS_TOTAL))).scalar()
+        if reltuples < 0:
+            return -1
+        res = await self.session.execute(ESTIMATE_FEED_TOTAL)
+        return int(res.scalar_one()[0]["Plan"]["Plan Rows"])
+
+    async def suggest_ads(self, prefix: str, limit: int) -> list[XAdsTitle]:
+        """Подбирает заголовки объявлений по началу ввода.
+
+        Args:
+            prefix (str): Введённая часть заголовка.
+            limit (int): Максимальное количество подсказок.
+
+        Returns:
+            list[XAdsTitle]: Идентификаторы и заголовки объявлений.
+        """
+        pattern = re.sub(r"([\\%_])", r"\\\1", prefix) + "%"
+        if len(prefix) < SUGGEST_TRGM_MIN_LEN:
+            xres = await self.session.execute(
+                SUGGEST_ADS_SHORT, {"pattern": pattern.lower(), "limit": limit}
             )
-        return total, res
+        else:
+            xres = await self.session.execute(
+                SUGGEST_ADS, {"pattern": pattern, "prefix": prefix, "limit": limit}
+            )
+        return [XAdsTitle(**row) for row in xres.mappings()]
+
+    @staticmethod
+    def _filter_conds(qfilter: QFilter | QSearch) -> list:
+        """Собирает условия фильтров категории и цены.
+
+        Args:
+            qfilter (QFilter | QSearch): Параметры фильтрации.
+
+        Returns:
+            list: Условия WHERE по таблице Ads.
+        """
+        conds = []
+        if qfilter.ads_category:
+            conds.append(ADS.c.ads_category == qfilter.ads_category.value)
+
+        if qfilter.price_from:
+            conds.append(ADS.c.price > qfilter.price_from)
+
+        if qfilter.price_to:
+            conds.append(ADS.c.price < qfilter.price_to)
+        return conds
+
+    @staticmethod
+    def _decode_ads_cursor(cursor: str, order_name: str) -> tuple:
+        """Разбирает курсор ленты объявлений.
+
+        Args:
+            cursor (str): Курсор из ZManyAds.next_cursor.
+            order_name (str): Имя сортировки текущего запроса.
+
+        Returns:
+            tuple: Значение ключа сортировки и id последней записи.
+
+        Raises:
+            ValueError: Если курсор повреждён или выдан для другой сортировки.
+        """
+        payload = decode_cursor(cursor)
+        if payload.get("o") != order_name:
+            raise ValueError("Курсор выдан для другой сортировки")
+        try:
+            value = payload["k"]
+            if order_name in DATETIME_ORDERINGS:
+                value = datetime.fromisoformat(value)
+            elif order_name == SEARCH_ORDERING:
+                value = float(value)
+            else:
+                value = int(value)
+            return value, UUID(payload["id"])
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError("Неверный курсор") from e
 
     async def get_ads_by_id(self, ads_id: UUID) -> XAds:
-        """Получает объявление по ID и увеличивает счётчик просмотров.
+        """Получает объявление по ID.
 
         Args:
             ads_id (UUID): Идентификатор объявления.
@@ -138,74 +718,81 @@ class AdsRepo(IAdsRepo):
         Returns:
             XAds: Объявление с указанным ID.
         """
-        req = (
-            update(Ads).values(count_views=Ads.count_views + 1).where(Ads.id == ads_id)
-        )
-        try:
-            res = await self.session.execute(req)
-        except NoResultFound as e:
-            raise KeyError("Объявление не найдено") from e
-        await self.session.commit()
-
-        req = select(Ads).where(Ads.id == ads_id)
-        res = await self.session.execute(req)
-        await self.session.commit()
-        row = res.scalar_one_or_none()
+        res = await self.session.execute(SELECT_ADS_BY_ID, {"ads_id": ads_id})
+        row = res.mappings().one_or_none()
         if row is None:
             raise KeyError("Объявление в бд не найдено")
-        return XAds(
-            id=row.id,
-            account_id=row.account_id,
-            title=row.title,
-            description=row.description,
-            ads_category=row.ads_category,
-            price=row.price,
-            count_views=row.count_views,
-            count_comments=row.count_comments,
-            is_deleted=row.is_deleted,
-            created_at=row.created_at,
-            updated_at=row.updated_at,
-            deleted_at=row.deleted_at,
-            reason_deletion=row.reason_deletion,
-        )
+        return XAds(**row)
+
+    async def add_ads_view(self, ads_id: UUID) -> int:
+        """Учитывает просмотр объявления.
 
-    async def get_ads_by_account_id(self, acc_id: UUID) -> tuple[int, list[XAds]]:
-        """Получает все объявления по идентификатору аккаунта.
+        Просмотр копится в буфере процесса и записывается в БД периодическим
+        сбросом (ads.infra.views), без блокировки строки объявления.
 
         Args:
-            acc_id (UUID): Идентификатор аккаунта.
+            ads_id (UUID): Идентификатор объявления.
 
         Returns:
-            tuple[int, list[XAds]]: Общее количество объявлений и список объявлений аккаунта.
+            int: Количество просмотров объявления, ещё не записанных в БД.
         """
-        count_req = select(func.count()).select_from(Ads)
-        count_res = await self.session.execute(count_req)
-        await self.session.commit()
-        total = count_res.scalar_one()
+        return add_view(ads_id)
 
-        req = select(Ads).where(Ads.account_id == acc_id)
-        xres = await self.session.execute(req)
-        await self.session.commit()
-        res = []
-        for row in xres.scalars().all():
-            res.append(
-                XAds(
-                    id=row.id,
-                    account_id=row.account_id,
-                    title=row.title,
-                    description=row.description,
-                    ads_category=row.ads_category,
-                    price=row.price,
-                    count_views=row.count_views,
-                    count_comments=row.count_comments,
-                    is_deleted=row.is_deleted,
-                    created_at=row.created_at,
-                    updated_at=row.updated_at,
-                    deleted_at=row.deleted_at,
-                    reason_deletion=row.reason_deletion,
+    async def get_ads_by_account_id(
+        self, acc_id: UUID, qfilter: QAccountAdsFilter
+    ) -> XAdsPage:
+        """Получает страницу объявлений аккаунта.
+
+        Страница выбирается keyset-условием после последней записи предыдущей
+        страницы. Помеченные удалёнными объявления тоже возвращаются. Общее
+        количество объявлений аккаунта считается подзапросом в том же запросе.
+
+        Args:
+            acc_id (UUID): Идентификатор аккаунта.
+            qfilter (QAccountAdsFilter): Размер страницы, сортировка и курсор.
+
+        Returns:
+            XAdsPage: Количество объявлений аккаунта, объявления страницы и
+                курсор следующей страницы (None, если страница последняя).
+
+        Raises:
+            ValueError: Если курсор повреждён или выдан для другой сортировки.
+        """
+        order_name, key, asc = ADS_ORDERINGS[qfilter.price]
+        req = SELECT_ADS_BY_ACCOUNT_ID
+        if qfilter.cursor:
+            last = self._decode_ads_cursor(qfilter.cursor, order_name)
+            position = tuple_(key, ADS.c.id)
+            req = req.where(position > last if asc else position < last)
+        if asc:
+            req = req.order_by(key.asc(), ADS.c.id.asc())
+        else:
+            req = req.order_by(key.desc(), ADS.c.id.desc())
+
+        # Лишняя строка показывает, есть ли следующая страница.
+        xres = await self.session.execute(
+            req.limit(qfilter.limit + 1), {"acc_id": acc_id}
+        )
+        rows = xres.mappings().all()
+        if rows:
+            total = rows[0]["total"]
+        else:
+            total = (
+                await self.session.execute(
+                    select(COUNT_ADS_BY_ACCOUNT_ID), {"acc_id": acc_id}
                 )
+            ).scalar_one()
+
+        res = [XAds(**row) for row in rows[: qfilter.limit]]
+        next_cursor = None
+        if len(rows) > len(res) and res:
+            value = getattr(res[-1], key.name)
+            if isinstance(value, datetime):
+                value = value.isoformat()
+            next_cursor = encode_cursor(
+                {"o": order_name, "k": value, "id": str(res[-1].id)}
             )
-        return total, res
+        return XAdsPage(total=total, items=res, next_cursor=next_cursor)
 
     async def update_ads(self, new_ads: QChangeAds, acc_id: UUID) -> XAds:
         """Обновляет объявление по данным и идентификатору аккаунта.
@@ -226,29 +813,13 @@ class AdsRepo(IAdsRepo):
                 updated_at=text("NOW()"),
             )
             .where(Ads.account_id == acc_id, Ads.id == new_ads.ads_id)
-            .returning(Ads)
-        )
-        try:
-            res = await self.session.execute(req)
-        except NoResultFound as e:
-            raise KeyError("Объявление не найдено") from e
-        await self.session.commit()
-        row = res.scalar_one()
-        return XAds(
-            id=row.id,
-            account_id=row.account_id,
-            title=row.title,
-            description=row.description,
-            ads_category=row.ads_category,
-            price=row.price,
-            count_views=row.count_views,
-            count_comments=row.count_comments,
-            is_deleted=row.is_deleted,
-            created_at=row.created_at,
-            updated_at=row.updated_at,
-            deleted_at=row.deleted_at,
-            reason_deletion=row.reason_deletion,
+            .returning(*ADS.c)
         )
+        res = await self.session.execute(with_stats(req))
+        row = res.mappings().one_or_none()
+        if row is None:
+            raise KeyError("Объявление не найдено")
+        return XAds(**row)
 
     async def update_category_ads(
         self, ads_id: UUID, new_category: QAdsCategory, acc_id: UUID
@@ -267,29 +838,13 @@ class AdsRepo(IAdsRepo):
             update(Ads)
             .values(ads_category=new_category.value, updated_at=text("NOW()"))
             .where(Ads.account_id == acc_id, Ads.id == ads_id)
-            .returning(Ads)
-        )
-        try:
-            res = await self.session.execute(req)
-        except NoResultFound as e:
-            raise KeyError("Объявление не найдено") from e
-        await self.session.commit()
-        row = res.scalar_one()
-        return XAds(
-            id=row.id,
-            account_id=row.account_id,
-            title=row.title,
-            description=row.description,
-            ads_category=row.ads_category,
-            price=row.price,
-            count_views=row.count_views,
-            count_comments=row.count_comments,
-            is_deleted=row.is_deleted,
-            created_at=row.created_at,
-            updated_at=row.updated_at,
-            deleted_at=row.deleted_at,
-            reason_deletion=row.reason_deletion,
+            .returning(*ADS.c)
         )
+        res = await self.session.execute(with_stats(req))
+        row = res.mappings().one_or_none()
+        if row is None:
+            raise KeyError("Объявление не найдено")
+        return XAds(**row)
 
     async def delete_ads(self, ads_id: UUID, acc_id: UUID) -> None:
         """Удаляет объявление по ID объявления и аккаунта.
@@ -303,7 +858,6 @@ class AdsRepo(IAdsRepo):
         """
         req = delete(Ads).where(Ads.account_id == acc_id, Ads.id == ads_id)
         await self.session.execute(req)
-        await self.session.commit()
 
     async def adm_delete_ads(self, ads_id: UUID) -> None:
         """Удаляет объявление администратором по ID объявления.
@@ -316,7 +870,6 @@ class AdsRepo(IAdsRepo):
         """
         req = delete(Ads).where(Ads.id == ads_id)
         await self.session.execute(req)
-        await self.session.commit()
 
     async def get_count_ads_by_acc_id(self, acc_id: UUID) -> int:
         """Получает количество объявлений по ID аккаунта.
@@ -330,9 +883,49 @@ class AdsRepo(IAdsRepo):
 
         req = select(func.count()).select_from(Ads).where(Ads.account_id == acc_id)
         count_ads = await self.session.execute(req)
-        await self.session.commit()
         return count_ads.scalar_one()
 
+    async def get_count_ads_by_acc_ids(self, acc_ids: list[UUID]) -> dict[UUID, int]:
+        """Получает количество объявлений для нескольких аккаунтов одним запросом.
+
+        Args:
+            acc_ids (list[UUID]): Идентификаторы аккаунтов.
+
+        Returns:
+            dict[UUID, int]: Количество объявлений по ID аккаунта; аккаунты без
+                объявлений в словарь не попадают.
+        """
+        res = await self.session.execute(COUNT_ADS_BY_ACC_IDS, {"acc_ids": acc_ids})
+        return dict(res.tuples().all())
+
+    async def fix_comment_counters(self, after: UUID, chunk_size: int) -> XCounterChunk:
+        """Сверяет count_comments пачки объявлений с количеством комментариев.
+
+        Объявлениям пачки без строки AdsStats она создаётся.
+
+        Args:
+            after (UUID): ads_id, после которого начинается пачка.
+            chunk_size (int): Размер пачки.
+
+        Returns:
+            XCounterChunk: Последний ads_id пачки, созданные строки счётчиков и
+                исправленные счётчики.
+        """
+        params = {"after": after, "chunk_size": chunk_size}
+        res = await self.session.execute(CREATE_MISSING_STATS, params)
+        created = res.scalars().all()
+        res = await self.session.execute(LOCK_STATS_CHUNK, params)
+        ads_ids = res.scalars().all()
+        if not ads_ids:
+            return XCounterChunk()
+        res = await self.session.execute(FIX_COMMENT_COUNTERS, {"ads_ids": ads_ids})
+        return XCounterChunk(
+            last_id=ads_ids[-1],
+            checked=len(ads_ids),
+            created=created,
+            drift=[XCounterDrift(**row) for row in res.mappings()],
+        )
+
     # -------------------- AdsCommentary -------------------
 
     async def create_ads_commentary(
@@ -340,44 +933,30 @@ class AdsRepo(IAdsRepo):
     ) -> XAdsComment:
         """Создаёт комментарий к объявлению и увеличивает счётчик комментариев.
 
+        Вставка и счётчик — один запрос (CREATE_COMMENT).
+
         Args:
             new_comment (QAddAdsComment): Данные нового комментария.
             acc_id (UUID): Идентификатор аккаунта, создающего комментарий.
 
         Returns:
             XAdsComment: Созданный комментарий к объявлению.
-        """
-        req = (
-            update(Ads)
-            .values(count_comments=Ads.count_comments + 1)
-            .where(Ads.id == new_comment.ads_id)
-        )
-        try:
-            res = await self.session.execute(req)
-        except NoResultFound as e:
-            raise KeyError("Объявление не найдено") from e
-        await self.session.commit()
 
-        req = (
-            insert(AdsComment)
-            .values(
-                ads_id=new_comment.ads_id,
-                account_id=acc_id,
-                ads_comment=new_comment.ads_comment,
-            )
-            .returning(AdsComment)
-        )
-        res = await self.session.execute(req)
-        await self.session.commit()
-        row = res.scalar_one()
-        return XAdsComment(
-            id=row.id,
-            ads_id=row.ads_id,
-            account_id=row.account_id,
-            ads_comment=row.ads_comment,
-            created_at=row.created_at,
-            updated_at=row.updated_at,
+        Raises:
+            KeyError: Если объявление не найдено.
+        """
+        res = await self.session.execute(
+            CREATE_COMMENT,
+            {
+                "comm_ads_id": new_comment.ads_id,
+                "acc_id": acc_id,
+                "comm_text": new_comment.ads_comment,
+            },
         )
+        row = res.mappings().one_or_none()
+        if row is None:
+            raise KeyError("Объявление не найдено")
+        return XAdsComment(**row)
 
     async def get_ads_commentary(self, ads_id: UUID, comment_id: UUID) -> XAdsComment:
         """Получает комментарий по ID объявления и комментария.
@@ -393,7 +972,6 @@ class AdsRepo(IAdsRepo):
             AdsComment.ads_id == ads_id, AdsComment.id == comment_id
         )
         res = await self.session.execute(req)
-        await self.session.commit()
         row = res.scalar_one_or_none()
         if row is None:
             raise KeyError("Объявление в бд не найдено")
@@ -406,36 +984,63 @@ class AdsRepo(IAdsRepo):
             updated_at=row.updated_at,
         )
 
-    async def get_ads_commentaries(self, ads_id: UUID) -> tuple[int, list[XAdsComment]]:
-        """Получает все комментарии к объявлению и их общее количество.
+    async def get_ads_commentaries(
+        self, ads_id: UUID, qfilter: QCommentFilter
+    ) -> XAdsCommentPage:
+        """Получает страницу комментариев к объявлению.
+
+        Страница выбирается keyset-условием по (created_at, id) после последней
+        записи предыдущей страницы. Общее количество — счётчик count_comments
+        объявления, читается в том же запросе.
 
         Args:
             ads_id (UUID): Идентификатор объявления.
+            qfilter (QCommentFilter): Размер страницы, порядок и курсор.
 
         Returns:
-            tuple[int, list[XAdsComment]]: Общее количество комментариев и список комментариев.
-        """
-        count_req = select(func.count()).select_from(AdsComment)
-        count_res = await self.session.execute(count_req)
-        await self.session.commit()
-        total = count_res.scalar_one()
+            XAdsCommentPage: Количество комментариев объявления, комментарии
+                страницы и курсор следующей страницы (None, если страница
+                последняя).
 
-        req = select(AdsComment).where(AdsComment.ads_id == ads_id)
-        xres = await self.session.execute(req)
-        await self.session.commit()
-        res = []
-        for row in xres.scalars().all():
-            res.append(
-                XAdsComment(
-                    id=row.id,
-                    ads_id=row.ads_id,
-                    account_id=row.account_id,
-                    ads_comment=row.ads_comment,
-                    created_at=row.created_at,
-                    updated_at=row.updated_at,
+        Raises:
+            ValueError: Если курсор повреждён или выдан для другого порядка.
+        """
+        order_name, asc = COMMENT_ORDERINGS[qfilter.order]
+        req = SELECT_COMMENTS_BY_ADS_ID
+        position = tuple_(ADS_COMMENT.c.created_at, ADS_COMMENT.c.id)
+        if qfilter.cursor:
+            last = self._decode_ads_cursor(qfilter.cursor, order_name)
+            req = req.where(position > last if asc else position < last)
+        if asc:
+            req = req.order_by(ADS_COMMENT.c.created_at.asc(), ADS_COMMENT.c.id.asc())
+        else:
+            req = req.order_by(ADS_COMMENT.c.created_at.desc(), ADS_COMMENT.c.id.desc())
+
+        # Лишняя строка показывает, есть ли следующая страница.
+        xres = await self.session.execute(
+            req.limit(qfilter.limit + 1), {"ads_id": ads_id}
+        )
+        rows = xres.mappings().all()
+        if rows:
+            total = rows[0]["total"]
+        else:
+            total = (
+                await self.session.execute(
+                    select(COUNT_COMMENTS_BY_ADS_ID), {"ads_id": ads_id}
                 )
+            ).scalar_one()
+
+        res = [XAdsComment(**row) for row in rows[: qfilter.limit]]
+        next_cursor = None
+        if len(rows) > len(res) and res:
+            next_cursor = encode_cursor(
+                {
+                    "o": order_name,
+                    "k": res[-1].created_at.isoformat(),
+                    "id": str(res[-1].id),
+                }
             )
-        return total, res
+        return XAdsCommentPage(total=total, items=res, next_cursor=next_cursor)
 
     async def update_ads_commentary(
         self, update_comm: QUpdateAdsComment
@@ -462,7 +1067,6 @@ class AdsRepo(IAdsRepo):
             res = await self.session.execute(req)
         except NoResultFound as e:
             raise KeyError("Объявление не найдено") from e
-        await self.session.commit()
         row = res.scalar_one()
         return XAdsComment(
             id=row.id,
@@ -475,35 +1079,30 @@ class AdsRepo(IAdsRepo):
 
     async def delete_ads_commentary(
         self, ads_id: UUID, comm_id: UUID, acc_id: UUID
-    ) -> None:
+    ) -> XAdsRef:
         """Удаляет комментарий к объявлению и обновляет счётчик комментариев.
 
+        Удаление и счётчик — один запрос (DELETE_COMMENT).
+
         Args:
             ads_id (UUID): Идентификатор объявления.
             comm_id (UUID): Идентификатор комментария.
             acc_id (UUID): Идентификатор аккаунта, к которому принадлежит комментарий.
 
         Returns:
-            None
-        """
-        req = (
-            update(Ads)
-            .values(count_comments=Ads.count_comments - 1)
-            .where(Ads.id == ads_id)
-        )
-        try:
-            await self.session.execute(req)
-        except NoResultFound as e:
-            raise KeyError("Объявление не найдено") from e
-        await self.session.commit()
+            XAdsRef: Объявление удалённого комментария.
 
-        req = delete(AdsComment).where(
-            AdsComment.account_id == acc_id,
-            AdsComment.ads_id == ads_id,
-            AdsComment.id == comm_id,
+        Raises:
+            KeyError: Если комментарий автора в объявлении не найден.
+        """
+        res = await self.session.execute(
+            DELETE_COMMENT,
+            {"comm_id": comm_id, "comm_ads_id": ads_id, "acc_id": acc_id},
         )
-        await self.session.execute(req)
-        await self.session.commit()
+        row = res.mappings().one_or_none()
+        if row is None:
+            raise KeyError("Комментарий не найден")
+        return XAdsRef(**row)
 
     async def get_ads_id_by_comm_id(self, comm_id: UUID) -> UUID:
         """Получает ID объявления по ID комментария.
@@ -519,36 +1118,28 @@ class AdsRepo(IAdsRepo):
         """
         req = select(AdsComment).where(AdsComment.id == comm_id)
         res = await self.session.execute(req)
-        await self.session.commit()
 
         row = res.scalar_one_or_none()
         if row is None:
             raise KeyError("Объявление в бд не найдено")
         return row.ads_id
 
-    async def adm_delete_ads_commentary(self, comm_id: UUID, ads_id: UUID) -> None:
+    async def adm_delete_ads_commentary(self, comm_id: UUID) -> XAdsRef:
         """Удаляет администратором комментарий к объявлению и обновляет счётчик комментариев.
 
+        Удаление и счётчик — один запрос (ADM_DELETE_COMMENT).
+
         Args:
             comm_id (UUID): Идентификатор комментария.
 
         Returns:
-            None
-        """
-        req = (
-            update(Ads)
-            .values(count_comments=Ads.count_comments - 1)
-            .where(Ads.id == ads_id)
-        )
-        try:
-            await self.session.execute(req)
-        except NoResultFound as e:
-            raise KeyError("Объявление не найдено") from e
-        await self.session.commit()
+            XAdsRef: Объявление удалённого комментария.
 
-        req = delete(AdsComment).where(
-            AdsComment.ads_id == ads_id,
-            AdsComment.id == comm_id,
-        )
-        await self.session.execute(req)
-        await self.session.commit()
+        Raises:
+            KeyError: Если комментарий не найден.
+        """
+        res = await self.session.execute(ADM_DELETE_COMMENT, {"comm_id": comm_id})
+        row = res.mappings().one_or_none()
+        if row is None:
+            raise KeyError("Комментарий не найден")
+        return XAdsRef(**row)
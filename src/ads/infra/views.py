@@ -0,0 +1,94 @@
+from typing import Callable
+from uuid import UUID
+
+from sqlalchemy import text
+
+from kernel.container import get_container
+from kernel.pg import DB_ADS, session_scope
+from kernel.tasks import get_task, start_task
+
+# Просмотры объявлений, накопленные процессом с последнего сброса: ads_id -> n.
+VIEWS: dict[UUID, int] = {}
+VIEWS_FLUSH_TASK = "ads_views_flush"
+VIEWS_LIMIT: dict[str, int] = {"size": 10_000}
+# Вызываются со списком id объявлений после успешного сброса просмотров.
+VIEWS_FLUSH_LISTENERS: list[Callable[[list[UUID]], None]] = []
+
+# Один UPDATE на все накопленные объявления; удалённые за это время строки
+# просто не совпадут по id.
+FLUSH_VIEWS = text(
+    """
+    UPDATE "AdsStats" AS s
+    SET count_views = s.count_views + v.n
+    FROM unnest(CAST(:ids AS uuid[]), CAST(:counts AS integer[])) AS v(id, n)
+    WHERE s.ads_id = v.id
+    """
+)
+
+
+def add_view(ads_id: UUID) -> int:
+    """Учитывает просмотр объявления в буфере процесса.
+
+    При заполнении буфера запрашивает внеочередной сброс.
+
+    Args:
+        ads_id (UUID): Идентификатор объявления.
+
+    Returns:
+        int: Количество просмотров объявления, ещё не записанных в БД.
+    """
+    VIEWS[ads_id] = VIEWS.get(ads_id, 0) + 1
+    if len(VIEWS) >= VIEWS_LIMIT["size"]:
+        task = get_task(VIEWS_FLUSH_TASK)
+        if task is not None:
+            task.wake()
+    return VIEWS[ads_id]
+
+
+async def flush_views() -> int:
+    """Записывает накопленные просмотры в БД одним UPDATE.
+
+    Если запись не удалась, просмотры возвращаются в буфер и уйдут при
+    следующем сбросе.
+
+    Returns:
+        int: Количество объявлений, по которым записаны просмотры.
+    """
+    if not VIEWS:
+        return 0
+    batch = dict(VIEWS)
+    VIEWS.clear()
+    try:
+        async with session_scope(DB_ADS) as session:
+            await session.execute(
+                FLUSH_VIEWS, {"ids": list(batch), "counts": list(batch.values())}
+            )
+    except BaseException:
+        for ads_id, n in batch.items():
+            VIEWS[ads_id] = VIEWS.get(ads_id, 0) + n
+        raise
+    for listener in VIEWS_FLUSH_LISTENERS:
+        listener(list(batch))
+    return len(batch)
+
+
+def on_views_flushed(func: Callable[[list[UUID]], None]) -> None:
+    """Подписывает функцию на успешный сброс просмотров.
+
+    Args:
+        func (Callable[[list[UUID]], None]): Получает id объявлений, просмотры
+            которых записаны в БД.
+    """
+    VIEWS_FLUSH_LISTENERS.append(func)
+
+
+def init_views() -> None:
+    """Запускает периодический сброс буфера просмотров.
+
+    Просмотры, не записанные из-за аварийного завершения процесса, теряются;
+    окно потерь ограничено ADS_VIEWS_FLUSH_INTERVAL. При штатной остановке
+    буфер сбрасывается в stop_tasks().
+    """
+    cfg = get_container().ads_cfg
+    VIEWS_LIMIT["size"] = cfg.ADS_VIEWS_BUFFER_SIZE
+    start_task(VIEWS_FLUSH_TASK, cfg.ADS_VIEWS_FLUSH_INTERVAL, flush_views)
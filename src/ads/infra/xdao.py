@@ -20,6 +20,37 @@ class XAds(BaseModel):
     reason_deletion: str | None = None
 
 
+class XAdsBulkResult(BaseModel):
+    """Результат вставки одного объявления пакета."""
+
+    index: int
+    ads: XAds | None = None
+    error: str | None = None
+
+
+class XAdsRef(BaseModel):
+    """Объявление, затронутое записью: id и категория для сброса кешей."""
+
+    id: UUID4
+    ads_category: str
+
+
+class XAdsTitle(BaseModel):
+    """Заголовок объявления для подсказок."""
+
+    id: UUID4
+    title: str
+
+
+class XAdsPage(BaseModel):
+    """Страница ленты объявлений."""
+
+    total: int
+    is_total_estimated: bool = False
+    items: list[XAds] = []
+    next_cursor: str | None = None
+
+
 class XAdsComment(BaseModel):
     """Модель данных комментария к объявлению."""
 
@@ -29,3 +60,30 @@ class XAdsComment(BaseModel):
     ads_comment: str
     created_at: datetime = datetime.now()
     updated_at: datetime | None = None
+    # Категория объявления возвращается только созданием комментария.
+    ads_category: str | None = None
+
+
+class XAdsCommentPage(BaseModel):
+    """Страница комментариев объявления."""
+
+    total: int
+    items: list[XAdsComment] = []
+    next_cursor: str | None = None
+
+
+class XCounterDrift(BaseModel):
+    """Исправленное сверкой значение счётчика."""
+
+    id: UUID4
+    stored: int
+    actual: int
+
+
+class XCounterChunk(BaseModel):
+    """Пачка сверки счётчиков."""
+
+    last_id: UUID4 | None = None
+    checked: int = 0
+    created: list[UUID4] = []
+    drift: list[XCounterDrift] = []
@@ -0,0 +1,71 @@
+from typing import Hashable
+from uuid import UUID
+
+from kernel.cache import Generations, TTLCache
+from kernel.container import get_container
+
+from ..domain.dto import QAdsCategory, QFilter
+from ..infra.views import on_views_flushed
+
+# Объявления по id и страницы ленты по нормализованному QFilter. Размеры и
+# время жизни задаются в init_ads_cache().
+ADS_CACHE = TTLCache("ads", 10_000, 10.0)
+ADS_PAGES_CACHE = TTLCache("ads_pages", 1_000, 10.0)
+# Подсказки по коротким префиксам заголовка; не сбрасываются при изменениях,
+# устаревают по времени жизни.
+ADS_SUGGEST_CACHE = TTLCache("ads_suggest", 5_000, 60.0)
+
+# Поколения страниц ленты: по категории для страниц с фильтром ads_category
+# и ALL_CATEGORIES для страниц без него.
+ADS_PAGES_GENERATIONS = Generations()
+ALL_CATEGORIES = "*"
+
+
+def _drop_flushed(ads_ids: list[UUID]) -> None:
+    # Записанные просмотры больше не учитываются буфером, поэтому count_views
+    # в кеше этих объявлений устарел.
+    for ads_id in ads_ids:
+        ADS_CACHE.pop(ads_id)
+
+
+on_views_flushed(_drop_flushed)
+
+
+def init_ads_cache() -> None:
+    """Настраивает кеши объявлений по конфигу Ads сервиса."""
+    cfg = get_container().ads_cfg
+    ADS_CACHE.configure(cfg.ADS_CACHE_SIZE, cfg.ADS_CACHE_TTL)
+    ADS_PAGES_CACHE.configure(cfg.ADS_CACHE_PAGES_SIZE, cfg.ADS_CACHE_TTL)
+    ADS_SUGGEST_CACHE.configure(cfg.ADS_SUGGEST_CACHE_SIZE, cfg.ADS_SUGGEST_CACHE_TTL)
+
+
+def page_key(qfilter: QFilter) -> Hashable:
+    """Возвращает ключ страницы ленты.
+
+    Ключ строится из параметров, уже проверенных QFilter: limit не больше 100 и
+    offset не отрицателен, поэтому страница в кеше не больше 100 объявлений.
+
+    Args:
+        qfilter (QFilter): Параметры фильтрации и пагинации.
+
+    Returns:
+        Hashable: Поколение группы и значения всех параметров фильтра.
+    """
+    group = qfilter.ads_category.value if qfilter.ads_category else ALL_CATEGORIES
+    params = tuple(sorted(qfilter.model_dump(mode="json").items()))
+    return group, ADS_PAGES_GENERATIONS.get(group), params
+
+
+def invalidate_ads(ads_id: UUID | None, *categories: str) -> None:
+    """Удаляет объявление из кеша и сбрасывает страницы ленты его категорий.
+
+    Args:
+        ads_id (UUID | None): Идентификатор объявления (None — только ленты).
+        *categories (str): Затронутые категории. Если не переданы (категория
+            неизвестна), сбрасываются страницы всех категорий.
+    """
+    if ads_id is not None:
+        ADS_CACHE.pop(ads_id)
+    if not categories:
+        categories = tuple(category.value for category in QAdsCategory)
+    ADS_PAGES_GENERATIONS.bump(ALL_CATEGORIES, *categories)
@@ -0,0 +1,84 @@
+import csv
+import io
+from contextlib import AsyncExitStack
+from typing import AsyncIterator
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from kernel.container import get_container
+from kernel.exception import ExpError, ExpCode
+from kernel.pg import DB_ADS_EXPORT, session_scope
+
+from ..domain.dto import QAdsFileFormat
+from ..infra.repo import AdsRepo
+from ..infra.xdao import XAds
+
+MEDIA_TYPES = {
+    QAdsFileFormat.NDJSON: "application/x-ndjson",
+    QAdsFileFormat.CSV: "text/csv; charset=utf-8",
+}
+EXPORT_FIELDS = tuple(XAds.model_fields)
+
+
+def _ndjson(chunk: list[XAds]) -> bytes:
+    return "".join(xads.model_dump_json() + "\n" for xads in chunk).encode()
+
+
+def _csv(rows: list[tuple | list]) -> bytes:
+    buf = io.StringIO()
+    csv.writer(buf).writerows(rows)
+    return buf.getvalue().encode()
+
+
+def _csv_rows(chunk: list[XAds]) -> list[list]:
+    return [list(xads.model_dump(mode="json").values()) for xads in chunk]
+
+
+class AdsExporter:
+    """Потоковая выгрузка всех объявлений в NDJSON или CSV.
+
+    Соединение берётся из отдельного пула DB_ADS_EXPORT в open(), до начала
+    ответа: при занятом пуле клиент получает ошибку, а не оборванный поток.
+    Строки читаются серверным курсором и кодируются пачками, поэтому память не
+    зависит от размера таблицы. Соединение возвращается в пул после последней
+    пачки или при обрыве ответа.
+
+    Attributes:
+        fmt (QAdsFileFormat): Формат выгрузки.
+        chunk_size (int): Количество строк в пачке.
+    """
+
+    def __init__(self, fmt: QAdsFileFormat, chunk_size: int | None = None):
+        self.fmt = fmt
+        self.chunk_size = chunk_size or get_container().ads_cfg.ADS_EXPORT_CHUNK_SIZE
+        self.stack = AsyncExitStack()
+        self.repo: AdsRepo | None = None
+
+    async def open(self) -> None:
+        """Открывает транзакцию только для чтения в пуле выгрузки.
+
+        Raises:
+            ExpError: Если все соединения пула выгрузки заняты.
+        """
+        try:
+            session = await self.stack.enter_async_context(
+                session_scope(DB_ADS_EXPORT, readonly=True)
+            )
+        except PoolTimeoutError as e:
+            raise ExpError(ExpCode.ADS_EXPORT_BUSY) from e
+        self.repo = AdsRepo(session)
+
+    async def stream(self) -> AsyncIterator[bytes]:
+        """Кодирует объявления пачками; для CSV первой идёт строка заголовка.
+
+        Yields:
+            bytes: Очередная часть файла.
+        """
+        async with self.stack:
+            if self.fmt == QAdsFileFormat.CSV:
+                yield _csv([EXPORT_FIELDS])
+            async for chunk in self.repo.stream_ads(self.chunk_size):
+                if self.fmt == QAdsFileFormat.CSV:
+                    yield _csv(_csv_rows(chunk))
+                else:
+                    yield _ndjson(chunk)
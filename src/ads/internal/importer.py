@@ -0,0 +1,217 @@
+import codecs
+import csv
+from typing import AsyncIterator
+
+from pydantic import ValidationError
+
+from kernel.container import get_container
+from kernel.pg import DB_ADS, session_scope
+
+from ..domain.dto import (
+    QAdsFileFormat,
+    QCreateAdsItem,
+    ZAdsImport,
+    ZAdsImportError,
+)
+from ..infra.repo import AdsRepo
+
+from .cache import invalidate_ads
+
+# Строка (запись CSV) длиннее этого размера — ошибка файла: иначе файл без
+# переводов строк целиком оказался бы в памяти.
+MAX_LINE_SIZE = 1 << 20
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Разбивает поток байт UTF-8 на строки.
+
+    Args:
+        chunks (AsyncIterator[bytes]): Части файла произвольного размера.
+
+    Yields:
+        str: Строка вместе с переводом строки (последняя — без него).
+
+    Raises:
+        ValueError: Если файл не в UTF-8 или строка длиннее MAX_LINE_SIZE.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buf = ""
+    async for chunk in chunks:
+        *lines, buf = (buf + decoder.decode(chunk)).split("\n")
+        for line in lines:
+            yield line + "\n"
+        if len(buf) > MAX_LINE_SIZE:
+            raise ValueError(f"Строка длиннее {MAX_LINE_SIZE} символов")
+    buf += decoder.decode(b"", final=True)
+    if buf:
+        yield buf
+
+
+async def _ndjson_rows(lines: AsyncIterator[str]) -> AsyncIterator[tuple[int, str]]:
+    lineno = 0
+    async for line in lines:
+        lineno += 1
+        if line.strip():
+            yield lineno, line
+
+
+def _in_quotes(line: str, quoted: bool) -> bool:
+    """Проверяет, остаётся ли открытым поле в кавычках в конце строки CSV.
+
+    Как и csv.reader, кавычка открывает поле только в его начале; кавычка
+    внутри поля без кавычек (TV 27" screen) — обычный символ.
+
+    Args:
+        line (str): Строка файла.
+        quoted (bool): Строка продолжает поле в кавычках предыдущей строки;
+            иначе она начинает запись.
+
+    Returns:
+        bool: True, если запись продолжается на следующей строке.
+    """
+    if not quoted and '"' not in line:
+        return False
+    pos = 0
+    if not quoted and line.startswith('"'):
+        quoted, pos = True, 1
+    while True:
+        if quoted:
+            end = line.find('"', pos)
+            if end < 0:
+                return True
+            if line.startswith('"', end + 1):
+                # Удвоенная кавычка внутри поля.
+                pos = end + 2
+                continue
+            quoted, pos = False, end + 1
+        comma = line.find(",", pos)
+        if comma < 0:
+            return False
+        pos = comma + 1
+        if line.startswith('"', pos):
+            quoted, pos = True, pos + 1
+
+
+async def _csv_rows(lines: AsyncIterator[str]) -> AsyncIterator[tuple[int, dict]]:
+    # Запись CSV может занимать несколько строк: поле в кавычках содержит
+    # перевод строки. Строки копятся, пока поле в кавычках не закрыто, затем
+    # запись целиком разбирает csv.reader.
+    header = None
+    record = ""
+    quoted = False
+    start = lineno = 0
+    async for line in lines:
+        lineno += 1
+        if not record:
+            start = lineno
+        record += line
+        quoted = _in_quotes(line, quoted)
+        if quoted:
+            if len(record) > MAX_LINE_SIZE:
+                raise ValueError(f"Запись CSV со строки {start} не закрыта")
+            continue
+        values = next(csv.reader([record]), [])
+        record = ""
+        if not values:
+            continue
+        if header is None:
+            header = values
+            continue
+        # Пустое поле — значение по умолчанию (например, категория selling).
+        yield start, {key: val for key, val in zip(header, values) if val != ""}
+    if record:
+        raise ValueError(f"Запись CSV со строки {start} не закрыта")
+
+
+def _validate(row: str | dict) -> QCreateAdsItem:
+    if isinstance(row, str):
+        return QCreateAdsItem.model_validate_json(row)
+    return QCreateAdsItem.model_validate(row)
+
+
+def _error_msg(exp: ValidationError) -> str:
+    return "; ".join(
+        ".".join(map(str, err["loc"])) + ": " + err["msg"] if err["loc"] else err["msg"]
+        for err in exp.errors()
+    )
+
+
+class AdsImporter:
+    """Импорт объявлений из потока NDJSON или CSV.
+
+    Строки проверяются по QCreateAdsItem и пишутся пачками через COPY, каждая
+    пачка в своей транзакции, поэтому память ограничена размером пачки. Если
+    БД отклонила пачку, она вставляется построчно и ошибки отдельных строк
+    попадают в отчёт. Импорт не атомарен: при ошибке файла уже записанные
+    пачки остаются.
+
+    Attributes:
+        chunk_size (int): Количество строк в пачке.
+        max_errors (int): Сколько ошибок строк вернуть в отчёте.
+        res (ZAdsImport): Отчёт об импорте.
+    """
+
+    def __init__(self, chunk_size: int | None = None, max_errors: int | None = None):
+        cfg = get_container().ads_cfg
+        self.chunk_size = chunk_size or cfg.ADS_IMPORT_CHUNK_SIZE
+        self.max_errors = max_errors or cfg.ADS_IMPORT_MAX_ERRORS
+        self.res = ZAdsImport(imported=0, failed=0)
+
+    async def run(
+        self, chunks: AsyncIterator[bytes], fmt: QAdsFileFormat
+    ) -> ZAdsImport:
+        """Импортирует объявления из потока.
+
+        Args:
+            chunks (AsyncIterator[bytes]): Содержимое файла частями.
+            fmt (QAdsFileFormat): Формат файла. Для CSV первая строка —
+                заголовок с именами полей QCreateAdsItem.
+
+        Returns:
+            ZAdsImport: Количество загруженных и отклонённых строк, ошибки строк.
+
+        Raises:
+            ValueError: Если файл не удалось разобрать (в сообщении — сколько
+                объявлений уже загружено).
+        """
+        rows = _csv_rows if fmt == QAdsFileFormat.CSV else _ndjson_rows
+        batch: list[tuple[int, QCreateAdsItem]] = []
+        try:
+            async for lineno, row in rows(iter_lines(chunks)):
+                try:
+                    batch.append((lineno, _validate(row)))
+                except ValidationError as e:
+                    self._fail(lineno, _error_msg(e))
+                    continue
+                if len(batch) >= self.chunk_size:
+                    await self._write(batch)
+                    batch = []
+            if batch:
+                await self._write(batch)
+        except ValueError as e:
+            raise ValueError(f"{e}; загружено объявлений: {self.res.imported}") from e
+        finally:
+            if self.res.imported:
+                invalidate_ads(None)
+        return self.res
+
+    async def _write(self, batch: list[tuple[int, QCreateAdsItem]]) -> None:
+        items = [item for _, item in batch]
+        async with session_scope(DB_ADS) as session:
+            repo = AdsRepo(session)
+            try:
+                self.res.imported += await repo.copy_ads(items)
+                return
+            except ValueError:
+                pass
+            xres = await repo.create_ads_bulk(items)
+        for (lineno, _), xitem in zip(batch, xres):
+            if xitem.ads is None:
+                self._fail(lineno, xitem.error or "")
+            else:
+                self.res.imported += 1
+
+    def _fail(self, lineno: int, error: str) -> None:
+        self.res.failed += 1
+        if len(self.res.errors) < self.max_errors:
+            self.res.errors.append(ZAdsImportError(line=lineno, error=error))
@@ -0,0 +1,47 @@
+from uuid import UUID
+
+from kernel.container import get_container
+from kernel.pg import DB_ADS, session_scope
+from kernel.reconcile import reconcile
+from kernel.tasks import start_task
+
+from ..infra.repo import AdsRepo
+
+from .cache import ADS_CACHE
+
+COMMENT_COUNTERS = "ads_count_comments"
+
+
+async def _fix_chunk(after: UUID, chunk_size: int) -> tuple[UUID | None, int, int]:
+    async with session_scope(DB_ADS) as session:
+        xchunk = await AdsRepo(session).fix_comment_counters(after, chunk_size)
+    fixed = set(xchunk.created) | {xdrift.id for xdrift in xchunk.drift}
+    # Страницы ленты с прежним значением устаревают по TTL.
+    for ads_id in fixed:
+        ADS_CACHE.pop(ads_id)
+    return xchunk.last_id, xchunk.checked, len(fixed)
+
+
+async def reconcile_comment_counters() -> int | None:
+    """Сверяет AdsStats.count_comments с количеством строк AdsComment.
+
+    Недостающие строки AdsStats создаются и считаются исправленными.
+
+    Returns:
+        int | None: Количество исправленных счётчиков или None, если сверку
+            выполняет другой процесс.
+    """
+    return await reconcile(COMMENT_COUNTERS, DB_ADS, _fix_chunk)
+
+
+def init_comment_counters() -> None:
+    """Запускает периодическую сверку счётчиков комментариев.
+
+    Сверка не выполняется при остановке процесса: незавершённый проход
+    продолжится в следующем запуске с начала таблицы.
+    """
+    interval = get_container().app_cfg.COUNTERS_RECONCILE_INTERVAL
+    if interval > 0:
+        start_task(
+            COMMENT_COUNTERS, interval, reconcile_comment_counters, run_on_stop=False
+        )
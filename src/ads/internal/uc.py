@@ -1,19 +1,27 @@
 from uuid import UUID
 
-from kernel.configs import AdsConfig
+from kernel.container import get_container
 from kernel.exception import ExpError, ExpCode
 
 from ..domain.irepo import IAdsRepo
 from ..domain.dto import (
     QCreateAds,
+    QCreateAdsBulk,
     QAdsCategory,
+    QAccountAdsFilter,
     QFilter,
+    QSearch,
     QChangeAds,
     QAddAdsComment,
+    QCommentFilter,
     QUpdateAdsComment,
     QDelAdsComment,
+    QAccountIds,
     ZAds,
+    ZAdsBulk,
+    ZAdsBulkItem,
     ZAdsComment,
+    ZAdsTitle,
     ZManyAds,
     ZManyAdsComment,
 )
@@ -22,7 +30,15 @@ from compl.domain.dto import QCreateCompl, ZCompl
 from ..infra.repo import AdsRepo
 from ..infra.xdao import XAds, XAdsComment
 
-from compl.external.svc import ComplService
+from .cache import (
+    ADS_CACHE,
+    ADS_PAGES_CACHE,
+    ADS_SUGGEST_CACHE,
+    invalidate_ads,
+    page_key,
+)
+
+from compl.external.svc import ComplService, ComplLocalService
 from notice.external.tg.client import TgClient
 from notice.external.tg.const_msg import get_ads_warning_msg
 
@@ -30,17 +46,38 @@ from notice.external.tg.const_msg import get_ads_warning_msg
 class AdsUseCase:
     """Управляет бизнес-логикой для работы с объявлениями и комментариями.
 
+    Сервисы, не переданные явно, берутся из контейнера при первом обращении.
+
     Args:
         _repo (AdsRepo): Репозиторий для операций с объявлениями.
-        _compl_svc (ComplService): Сервис для работы с жалобами.
-        _tg_svc (TgClient): Клиент для отправки сообщений в Telegram.
+        _compl_svc (ComplService | None): Сервис для работы с жалобами.
+        _tg_svc (TgClient | None): Клиент для отправки сообщений в Telegram.
     """
 
-    def __init__(self, _repo: AdsRepo, _compl_svc: ComplService, _tg_svc: TgClient):
-        self.cfg = AdsConfig()
+    def __init__(
+        self,
+        _repo: AdsRepo,
+        _compl_svc: ComplService | ComplLocalService | None = None,
+        _tg_svc: TgClient | None = None,
+    ):
+        self.cfg = get_container().ads_cfg
         self.repo: IAdsRepo = _repo
-        self.compl_svc: ComplService = _compl_svc
-        self.tg_svc: TgClient = _tg_svc
+        self._compl_svc = _compl_svc
+        self._tg_svc = _tg_svc
+
+    @property
+    def compl_svc(self) -> ComplService | ComplLocalService:
+        """Сервис для работы с жалобами."""
+        if self._compl_svc is None:
+            self._compl_svc = get_container().compl_svc
+        return self._compl_svc
+
+    @property
+    def tg_svc(self) -> TgClient:
+        """Клиент для отправки сообщений в Telegram."""
+        if self._tg_svc is None:
+            self._tg_svc = get_container().tg_bot
+        return self._tg_svc
 
     async def create_ads(
         self, req: QCreateAds, ads_category: QAdsCategory, acc_id: UUID | None = None
@@ -56,52 +93,173 @@ class AdsUseCase:
             ZAds: Созданное объявление.
         """
         res: XAds = await self.repo.create_ads(req, ads_category, acc_id)
+        self.repo.after_commit(lambda: invalidate_ads(None, res.ads_category))
         return ZAds.model_validate(res.model_dump(mode="json"))
 
+    async def create_ads_bulk(self, req: QCreateAdsBulk) -> ZAdsBulk:
+        """Создаёт пакет объявлений.
+
+        Ошибка отдельного объявления возвращается в его элементе ответа и не
+        отменяет создание остальных.
+
+        Args:
+            req (QCreateAdsBulk): Пакет объявлений.
+
+        Returns:
+            ZAdsBulk: Количество созданных и неудачных, результат по каждому.
+        """
+        xres = await self.repo.create_ads_bulk(req.items)
+        items = []
+        categories = set()
+        for xitem in xres:
+            if xitem.ads is None:
+                items.append(ZAdsBulkItem(index=xitem.index, error=xitem.error))
+                continue
+            items.append(ZAdsBulkItem(index=xitem.index, id=xitem.ads.id))
+            categories.add(xitem.ads.ads_category)
+        if categories:
+            self.repo.after_commit(lambda: invalidate_ads(None, *categories))
+        created = sum(1 for item in items if item.id is not None)
+        return ZAdsBulk(created=created, failed=len(items) - created, items=items)
+
     async def get_ads_all(self, qfilter: QFilter) -> ZManyAds:
         """Получает список всех объявлений с учётом фильтра.
 
+        Страница берётся из кеша процесса, если её поколение не сброшено
+        изменением объявлений той же категории.
+
         Args:
             qfilter (QFilter): Фильтр для выборки объявлений.
 
         Returns:
             ZManyAds: Множество объявлений с метаданными.
         """
-        total, xres = await self.repo.get_ads_all(qfilter)
+        key = page_key(qfilter)
+        cached: ZManyAds | None = ADS_PAGES_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+        try:
+            xpage = await self.repo.get_ads_all(qfilter)
+        except ValueError as e:
+            raise ExpError(ExpCode.ADS_INVALID_CURSOR, str(e)) from e
+        res = []
+        for xads in xpage.items:
+            res.append(ZAds(**xads.model_dump(mode="json")))
+        page = ZManyAds(
+            total=xpage.total,
+            is_total_estimated=xpage.is_total_estimated,
+            count=len(res),
+            offeset=qfilter.offset,
+            items=res,
+            next_cursor=xpage.next_cursor,
+        )
+        ADS_PAGES_CACHE.set(key, page)
+        return page
+
+    async def search_ads(self, qsearch: QSearch) -> ZManyAds:
+        """Ищет объявления по заголовку и описанию.
+
+        Args:
+            qsearch (QSearch): Поисковая строка, фильтры и курсор.
+
+        Returns:
+            ZManyAds: Найденные объявления по убыванию релевантности.
+        """
+        try:
+            xpage = await self.repo.search_ads(qsearch)
+        except ValueError as e:
+            raise ExpError(ExpCode.ADS_INVALID_CURSOR, str(e)) from e
         res = []
-        for xads in xres:
+        for xads in xpage.items:
             res.append(ZAds(**xads.model_dump(mode="json")))
-        return ZManyAds(total=total, count=len(res), offeset=qfilter.offset, items=res)
+        return ZManyAds(
+            total=xpage.total,
+            count=len(res),
+            items=res,
+            next_cursor=xpage.next_cursor,
+        )
+
+    async def suggest_ads(self, prefix: str, limit: int) -> list[ZAdsTitle]:
+        """Подбирает заголовки объявлений по началу ввода.
+
+        Подсказки для коротких префиксов (не длиннее
+        ADS_SUGGEST_CACHE_PREFIX_LEN) берутся из кеша процесса; кеш снимает
+        нагрузку только с повторяющихся префиксов, первый запрос каждого
+        префикса идёт в БД.
+
+        Args:
+            prefix (str): Введённая часть заголовка.
+            limit (int): Максимальное количество подсказок.
+
+        Returns:
+            list[ZAdsTitle]: Идентификаторы и заголовки объявлений.
+        """
+        prefix = " ".join(prefix.lower().split())
+        if not prefix:
+            return []
+
+        key = None
+        if len(prefix) <= self.cfg.ADS_SUGGEST_CACHE_PREFIX_LEN:
+            key = (prefix, limit)
+            cached: list[ZAdsTitle] | None = ADS_SUGGEST_CACHE.get(key)
+            if cached is not None:
+                return cached
+
+        xres = await self.repo.suggest_ads(prefix, limit)
+        res = [ZAdsTitle(**xads.model_dump(mode="json")) for xads in xres]
+        if key is not None:
+            ADS_SUGGEST_CACHE.set(key, res)
+        return res
 
     async def get_ads_by_id(self, ads_id: UUID) -> ZAds:
-        """Получает объявление по его идентификатору.
+        """Получает объявление по его идентификатору и учитывает просмотр.
+
+        Объявление берётся из кеша процесса, если оно не изменялось.
 
         Args:
             ads_id (UUID): Идентификатор объявления.
 
         Returns:
-            ZAds: Найденное объявление.
+            ZAds: Найденное объявление с учётом ещё не записанных просмотров.
         """
-        try:
-            res: XAds = await self.repo.get_ads_by_id(ads_id)
-        except KeyError as e:
-            raise ExpError(ExpCode.ADS_NOT_FOUND, str(e)) from e
-        return ZAds.model_validate(res.model_dump(mode="json"))
-
-    async def get_ads_by_account_id(self, acc_id: UUID) -> ZAds:
-        """Получает объявления по идентификатору аккаунта.
+        ads: ZAds | None = ADS_CACHE.get(ads_id)
+        if ads is None:
+            try:
+                res: XAds = await self.repo.get_ads_by_id(ads_id)
+            except KeyError as e:
+                raise ExpError(ExpCode.ADS_NOT_FOUND, str(e)) from e
+            ads = ZAds.model_validate(res.model_dump(mode="json"))
+            ADS_CACHE.set(ads_id, ads)
+
+        pending = await self.repo.add_ads_view(ads_id)
+        return ads.model_copy(update={"count_views": ads.count_views + pending})
+
+    async def get_ads_by_account_id(
+        self, acc_id: UUID, qfilter: QAccountAdsFilter
+    ) -> ZManyAds:
+        """Получает страницу объявлений аккаунта.
 
         Args:
             acc_id (UUID): Идентификатор аккаунта.
+            qfilter (QAccountAdsFilter): Размер страницы, сортировка и курсор.
 
         Returns:
-            ZManyAds: Множество объявлений данного аккаунта.
+            ZManyAds: Объявления страницы и количество всех объявлений аккаунта.
         """
-        total, xres = await self.repo.get_ads_by_account_id(acc_id)
+        try:
+            xpage = await self.repo.get_ads_by_account_id(acc_id, qfilter)
+        except ValueError as e:
+            raise ExpError(ExpCode.ADS_INVALID_CURSOR, str(e)) from e
         res = []
-        for xads in xres:
+        for xads in xpage.items:
             res.append(ZAds(**xads.model_dump(mode="json")))
-        return ZManyAds(total=total, count=len(res), items=res)
+        return ZManyAds(
+            total=xpage.total,
+            count=len(res),
+            items=res,
+            next_cursor=xpage.next_cursor,
+        )
 
     async def change_my_ads(self, req: QChangeAds, acc_id: UUID) -> ZAds:
         """Обновляет собственное объявление.
@@ -117,6 +275,7 @@ class AdsUseCase:
             res: XAds = await self.repo.update_ads(req, acc_id)
         except KeyError as e:
             raise ExpError(ExpCode.ADS_NOT_FOUND, str(e)) from e
+        self.repo.after_commit(lambda: invalidate_ads(res.id, res.ads_category))
         return ZAds.model_validate(res.model_dump(mode="json"))
 
     async def change_category_ads(
@@ -136,6 +295,8 @@ class AdsUseCase:
             res: XAds = await self.repo.update_category_ads(ads_id, req, acc_id)
         except KeyError as e:
             raise ExpError(ExpCode.ADS_NOT_FOUND, str(e)) from e
+        # Прежняя категория неизвестна, сбрасываются ленты всех категорий.
+        self.repo.after_commit(lambda: invalidate_ads(ads_id))
         return ZAds.model_validate(res.model_dump(mode="json"))
 
     async def delete_ads(self, ads_id: UUID, acc_id: UUID) -> bool:
@@ -149,6 +310,7 @@ class AdsUseCase:
             bool: Результат удаления (True при успешном удалении).
         """
         await self.repo.delete_ads(ads_id, acc_id)
+        self.repo.after_commit(lambda: invalidate_ads(ads_id))
         return True
 
     async def adm_delete_ads(self, ads_id: UUID, reason: str) -> bool:
@@ -164,6 +326,7 @@ class AdsUseCase:
         ads = await self.repo.get_ads_by_id(ads_id)
 
         await self.repo.adm_delete_ads(ads_id)
+        self.repo.after_commit(lambda: invalidate_ads(ads_id, ads.ads_category))
 
         msg = await get_ads_warning_msg(ads.title, reason)
         await self.tg_svc.send_message(msg)
@@ -181,6 +344,19 @@ class AdsUseCase:
         res = await self.repo.get_count_ads_by_acc_id(acc_id)
         return res
 
+    async def get_count_ads_by_acc_ids(self, req: QAccountIds) -> dict[UUID, int]:
+        """Получает количество объявлений для нескольких аккаунтов.
+
+        Args:
+            req (QAccountIds): Идентификаторы аккаунтов.
+
+        Returns:
+            dict[UUID, int]: Количество объявлений по ID аккаунта; для аккаунтов
+                без объявлений — 0.
+        """
+        counts = await self.repo.get_count_ads_by_acc_ids(req.acc_ids)
+        return {acc_id: counts.get(acc_id, 0) for acc_id in req.acc_ids}
+
     # ---------- AdsCommentary -------------
 
     async def create_ads_commentary(
@@ -199,6 +375,8 @@ class AdsUseCase:
             res: XAdsComment = await self.repo.create_ads_commentary(req, acc_id)
         except KeyError as e:
             raise ExpError(ExpCode.ADS_NOT_FOUND, str(e)) from e
+        # Меняется count_comments объявления и страниц ленты с ним.
+        self.repo.after_commit(lambda: invalidate_ads(res.ads_id, res.ads_category))
         return ZAdsComment.model_validate(res.model_dump(mode="json"))
 
     async def get_ads_commentary(self, ads_id: UUID, comment_id: UUID) -> ZAdsComment:
@@ -217,20 +395,31 @@ class AdsUseCase:
             raise ExpError(ExpCode.ADS_COMMENTARY_NOT_FOUND, str(e)) from e
         return ZAdsComment.model_validate(res.model_dump(mode="json"))
 
-    async def get_ads_commentaries(self, ads_id: UUID) -> ZManyAdsComment:
-        """Получает все комментарии к объявлению.
+    async def get_ads_commentaries(
+        self, ads_id: UUID, qfilter: QCommentFilter
+    ) -> ZManyAdsComment:
+        """Получает страницу комментариев к объявлению.
 
         Args:
             ads_id (UUID): Идентификатор объявления.
+            qfilter (QCommentFilter): Размер страницы, порядок и курсор.
 
         Returns:
-            ZManyAdsComment: Множество комментариев с метаданными.
+            ZManyAdsComment: Комментарии страницы с метаданными.
         """
-        total, xres = await self.repo.get_ads_commentaries(ads_id)
+        try:
+            xpage = await self.repo.get_ads_commentaries(ads_id, qfilter)
+        except ValueError as e:
+            raise ExpError(ExpCode.ADS_INVALID_CURSOR, str(e)) from e
         res = []
-        for xads in xres:
+        for xads in xpage.items:
             res.append(ZAdsComment(**xads.model_dump(mode="json")))
-        return ZManyAdsComment(total=total, count=len(res), items=res)
+        return ZManyAdsComment(
+            total=xpage.total,
+            count=len(res),
+            items=res,
+            next_cursor=xpage.next_cursor,
+        )
 
     async def update_ads_commentary(self, req: QUpdateAdsComment) -> ZAdsComment:
         """Обновляет комментарий к объявлению.
@@ -257,11 +446,12 @@ class AdsUseCase:
             bool: Результат удаления (True при успешном удалении).
         """
         try:
-            await self.repo.delete_ads_commentary(
+            xads = await self.repo.delete_ads_commentary(
                 req.ads_id, req.comm_id, req.account_id
             )
         except KeyError as e:
             raise ExpError(ExpCode.ADS_COMMENTARY_NOT_FOUND, str(e)) from e
+        self.repo.after_commit(lambda: invalidate_ads(xads.id, xads.ads_category))
         return True
 
     async def adm_delete_ads_commentary(self, comm_id: UUID) -> bool:
@@ -274,14 +464,10 @@ class AdsUseCase:
             bool: Результат удаления (True при успешном удалении).
         """
         try:
-            ads_id = await self.repo.get_ads_id_by_comm_id(comm_id)
-        except KeyError as e:
-            raise ExpError(ExpCode.ADS_COMMENTARY_NOT_FOUND, str(e)) from e
-
-        try:
-            await self.repo.adm_delete_ads_commentary(comm_id, ads_id)
+            xads = await self.repo.adm_delete_ads_commentary(comm_id)
         except KeyError as e:
             raise ExpError(ExpCode.ADS_COMMENTARY_NOT_FOUND, str(e)) from e
+        self.repo.after_commit(lambda: invalidate_ads(xads.id, xads.ads_category))
         return True
 
     async def send_complaint(self, req: QCreateCompl) -> ZCompl:
@@ -309,7 +495,10 @@ class AdsUseCase:
         Returns:
             bool: True, если аккаунт является автором объявления, иначе False.
         """
-        ads = await self.get_ads_by_id(ads_id)
+        try:
+            ads = await self.repo.get_ads_by_id(ads_id)
+        except KeyError as e:
+            raise ExpError(ExpCode.ADS_NOT_FOUND, str(e)) from e
 
         if str(ads.account_id) == acc_id:
             return True
@@ -3,13 +3,7 @@ from fastapi import APIRouter, Depends, Body
 from fastapi.security import OAuth2PasswordRequestForm
 
 from kernel.endpoints import Endpoints as Enp
-from kernel.depends import (
-    get_auth_repo_session,
-    get_account_serivce,
-    AccService,
-    get_tg_bot,
-    TgClient,
-)
+from kernel.depends import get_auth_repo_session
 from kernel.response import responses, SuccessResp
 
 from ..internal.uc import AuthUseCase
@@ -51,11 +45,9 @@ tags = {"name": "auth", "description": "Внутренние эндпоинты
 async def signup_email(
     req: Annotated[QEmailSignup, Body()],
     __repo_session: Annotated[AsyncSession, Depends(get_auth_repo_session)],
-    __acc_svc: Annotated[AccService, Depends(get_account_serivce)],
-    __tg_svc: Annotated[TgClient, Depends(get_tg_bot)],
 ) -> SuccessResp[ZEmailSignup]:
     """Обрабатывает HTTP-запрос на регистрацию пользователя по email с отправкой кода подтверждения."""
-    uc = AuthUseCase(AuthRepo(__repo_session), __acc_svc, __tg_svc)
+    uc = AuthUseCase(AuthRepo(__repo_session))
     res = await uc.signup_email(req)
     return SuccessResp[ZEmailSignup](payload=res)
 
@@ -69,11 +61,9 @@ async def signup_email(
 async def confirm_email(
     req: Annotated[QConfirmCode, Body()],
     __repo_session: Annotated[AsyncSession, Depends(get_auth_repo_session)],
-    __acc_svc: Annotated[AccService, Depends(get_account_serivce)],
-    __tg_svc: Annotated[TgClient, Depends(get_tg_bot)],
 ) -> SuccessResp[ZAccountID]:
     """Обрабатывает HTTP-запрос на подтверждение email с помощью кода подтверждения."""
-    uc = AuthUseCase(AuthRepo(__repo_session), __acc_svc, __tg_svc)
+    uc = AuthUseCase(AuthRepo(__repo_session))
     res = await uc.confirm_email(req)
     return SuccessResp[ZAccountID](payload=res)
 
@@ -87,11 +77,9 @@ async def confirm_email(
 async def signin_email(
     req: Annotated[QEmailSignin, Body()],
     __repo_session: Annotated[AsyncSession, Depends(get_auth_repo_session)],
-    __acc_svc: Annotated[AccService, Depends(get_account_serivce)],
-    __tg_svc: Annotated[TgClient, Depends(get_tg_bot)],
 ) -> SuccessResp[ZToken]:
     """Обрабатывает HTTP-запрос на авторизацию пользователя по email и паролю."""
-    uc = AuthUseCase(AuthRepo(__repo_session), __acc_svc, __tg_svc)
+    uc = AuthUseCase(AuthRepo(__repo_session))
     res = await uc.signin_email(req)
     return SuccessResp[ZToken](payload=res)
 
@@ -105,11 +93,9 @@ async def signin_email(
 async def signin_email_form(
     form: Annotated[OAuth2PasswordRequestForm, Depends()],
     __repo_session: Annotated[AsyncSession, Depends(get_auth_repo_session)],
-    __acc_svc: Annotated[AccService, Depends(get_account_serivce)],
-    __tg_svc: Annotated[TgClient, Depends(get_tg_bot)],
 ) -> ZToken:
     """Обрабатывает HTTP-запрос на авторизацию пользователя по email и паролю через форму OAuth2."""
-    uc = AuthUseCase(AuthRepo(__repo_session), __acc_svc, __tg_svc)
+    uc = AuthUseCase(AuthRepo(__repo_session))
     req = QEmailSignin(email=form.username, password=form.password)
     res = await uc.signin_email(req)
     return res
@@ -124,11 +110,9 @@ async def signin_email_form(
 async def refresh_token(
     req: Annotated[QRefreshToken, Body()],
     __repo_session: Annotated[AsyncSession, Depends(get_auth_repo_session)],
-    __acc_svc: Annotated[AccService, Depends(get_account_serivce)],
-    __tg_svc: Annotated[TgClient, Depends(get_tg_bot)],
 ) -> SuccessResp[ZToken]:
     """Обрабатывает HTTP-запрос на обновление access-токена с использованием refresh-токена."""
-    uc = AuthUseCase(AuthRepo(__repo_session), __acc_svc, __tg_svc)
+    uc = AuthUseCase(AuthRepo(__repo_session))
     res = await uc.refresh_token(req)
     return SuccessResp[ZToken](payload=res)
 
@@ -142,10 +126,8 @@ async def refresh_token(
 async def revoke_token(
     req: Annotated[QRevokeToken, Body()],
     __repo_session: Annotated[AsyncSession, Depends(get_auth_repo_session)],
-    __acc_svc: Annotated[AccService, Depends(get_account_serivce)],
-    __tg_svc: Annotated[TgClient, Depends(get_tg_bot)],
 ) -> SuccessResp[ZRevokedTokens]:
     """Обрабатывает HTTP-запрос на деактивацию (отзыв) токенов по идентификатору аккаунта."""
-    uc = AuthUseCase(AuthRepo(__repo_session), __acc_svc, __tg_svc)
+    uc = AuthUseCase(AuthRepo(__repo_session))
     res = await uc.revoke_token(req)
     return SuccessResp[ZRevokedTokens](payload=res)
@@ -20,6 +20,13 @@ class AuthRepo(IAuthRepo):
     def __init__(self, _session: AsyncSession):
         self.session: AsyncSession = _session
 
+    async def warmup(self) -> None:
+        """Выполняет горячие запросы чтения для прогрева кешей запросов."""
+        try:
+            await self.get_email_signup(UUID(int=0))
+        except KeyError:
+            pass
+
     async def create_email_signup(
         self, email: str, pwd_hash: str, salt: str, code: int
     ) -> XEmailSignup:
@@ -61,7 +68,6 @@ class AuthRepo(IAuthRepo):
             await self.session.rollback()
             raise RecursionError from e
 
-        await self.session.commit()
         row = res.scalar_one()
         return XEmailSignup(
             id=row.id,
@@ -112,7 +118,6 @@ class AuthRepo(IAuthRepo):
         """
         req = delete(SignupAccount).where(SignupAccount.id == signup_id)
         await self.session.execute(req)
-        await self.session.commit()
 
     async def inc_email_confirm_wrong_code_attempts(
         self, signup_id: UUID
@@ -144,7 +149,6 @@ class AuthRepo(IAuthRepo):
             await self.session.rollback()
             raise RecursionError from e
 
-        await self.session.commit()
         row = res.scalar_one()
         return XEmailSignup(
             id=row.id,
@@ -178,7 +182,6 @@ class AuthRepo(IAuthRepo):
             .returning(SignupAccount)
         )
         res = await self.session.execute(req)
-        await self.session.commit()
         row = res.scalar_one()
         return XEmailSignup(
             id=row.id,
@@ -214,7 +217,6 @@ class AuthRepo(IAuthRepo):
             RefreshToken.expires_at > text("NOW()"),
         )
         res = await self.session.execute(req)
-        await self.session.commit()
         row = res.scalar_one_or_none()
         if row is None:
             raise KeyError("Отсутствует токен в базе")
@@ -232,7 +234,6 @@ class AuthRepo(IAuthRepo):
 
         req = delete(RefreshToken).where(RefreshToken.expires_at < text("NOW()"))
         await self.session.execute(req)
-        await self.session.commit()
 
     async def save_refresh_token(self, acc_id: UUID, token: str) -> XRefreshToken:
         """Сохраняет новый refresh-токен для аккаунта с сроком действия 7 дней.
@@ -255,7 +256,6 @@ class AuthRepo(IAuthRepo):
             .returning(RefreshToken)
         )
         res = await self.session.execute(req)
-        await self.session.commit()
         row = res.scalar_one()
         return XRefreshToken(
             id=row.id,
@@ -281,8 +281,7 @@ class AuthRepo(IAuthRepo):
             .values(
                 is_revoked=True,
             )
-            .where(RefreshToken.acc_id == acc_id, RefreshToken.is_revoked == False)
+            .where(RefreshToken.account_id == acc_id, RefreshToken.is_revoked == False)
         )
         res = await self.session.execute(req)
-        await self.session.commit()
         return res.rowcount
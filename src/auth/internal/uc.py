@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from kernel.configs import AuthConfig
+from kernel.container import get_container
 from kernel.security import (
     create_confirm_code,
     create_password_hash,
@@ -33,7 +33,7 @@ from account.domain.dto import (
 from ..infra.repo import AuthRepo
 from ..infra.xdao import XEmailSignup
 
-from account.external.svc import AccService
+from account.external.svc import AccService, AccLocalService
 from notice.external.tg.client import TgClient
 from notice.external.tg.const_msg import get_code_msg
 
@@ -41,17 +41,38 @@ from notice.external.tg.const_msg import get_code_msg
 class AuthUseCase:
     """Управляет бизнес-логикой аутентификации и авторизации.
 
+    Сервисы, не переданные явно, берутся из контейнера при первом обращении.
+
     Args:
         _repo (AuthRepo): Репозиторий для работы с данными аутентификации.
-        _acc_svc (AccService): Сервис для работы с аккаунтами.
-        _tg_svc (TgClient): Клиент Telegram для отправки сообщений.
+        _acc_svc (AccService | None): Сервис для работы с аккаунтами.
+        _tg_svc (TgClient | None): Клиент Telegram для отправки сообщений.
     """
 
-    def __init__(self, _repo: AuthRepo, _acc_svc: AccService, _tg_svc: TgClient):
-        self.cfg = AuthConfig()
+    def __init__(
+        self,
+        _repo: AuthRepo,
+        _acc_svc: AccService | AccLocalService | None = None,
+        _tg_svc: TgClient | None = None,
+    ):
+        self.cfg = get_container().auth_cfg
         self.repo: IAuthRepo = _repo
-        self.acc_svc: AccService = _acc_svc
-        self.tg_svc: TgClient = _tg_svc
+        self._acc_svc = _acc_svc
+        self._tg_svc = _tg_svc
+
+    @property
+    def acc_svc(self) -> AccService | AccLocalService:
+        """Сервис для работы с аккаунтами."""
+        if self._acc_svc is None:
+            self._acc_svc = get_container().acc_svc
+        return self._acc_svc
+
+    @property
+    def tg_svc(self) -> TgClient:
+        """Клиент Telegram для отправки сообщений."""
+        if self._tg_svc is None:
+            self._tg_svc = get_container().tg_bot
+        return self._tg_svc
 
     async def signup_email(self, req: QEmailSignup) -> ZEmailSignup:
         """Создаёт заявку на регистрацию по email.
@@ -0,0 +1,124 @@
+"""Проверка счётчика комментариев под конкурентной записью.
+
+Создаёт объявление и параллельно создаёт и удаляет его комментарии через
+AdsRepo, каждый вызов в своей транзакции, как в обработчиках. Удаления
+выбирают случайный из созданных комментариев, поэтому один комментарий
+удаляется несколькими писателями одновременно; доля --fail-rate транзакций
+откатывается после записи. В конце сравнивает count_comments из AdsStats с
+фактическим количеством строк AdsComment и печатает отчёт в JSON; при
+расхождении завершается с кодом 1. Нужен Postgres с применёнными миграциями и
+переменные окружения приложения:
+
+    cd src && python -m bench.comment_counter --writes 5000 --concurrency 20
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+from uuid import UUID, uuid4
+
+from sqlalchemy import func, select, text
+
+from ads.domain.dto import QAddAdsComment, QAdsCategory, QCreateAds
+from ads.domain.models import AdsComment, AdsStats
+from ads.infra.repo import AdsRepo
+from kernel.container import init_container
+from kernel.pg import DB_ADS, init_pg, close_pg, session_scope
+
+from .common import run_load
+
+
+class InjectedError(Exception):
+    """Сбой после записи, откатывающий транзакцию."""
+
+
+async def _counts(ads_id: UUID) -> tuple[int, int]:
+    async with session_scope(DB_ADS, readonly=True) as session:
+        counter = await session.scalar(
+            select(AdsStats.count_comments).where(AdsStats.ads_id == ads_id)
+        )
+        rows = await session.scalar(
+            select(func.count())
+            .select_from(AdsComment)
+            .where(AdsComment.ads_id == ads_id)
+        )
+    return counter, rows
+
+
+async def main(args: argparse.Namespace) -> int:
+    """Прогоняет конкурентную запись и сверяет счётчик."""
+    init_container()
+    init_pg()
+    acc_id = uuid4()
+    async with session_scope(DB_ADS) as session:
+        xads = await AdsRepo(session).create_ads(
+            QCreateAds(title="comment counter", description="bench", price=1),
+            QAdsCategory.SELLING,
+            acc_id,
+        )
+    comments: list[UUID] = []
+    stats = {"created": 0, "deleted": 0, "delete_missed": 0, "rolled_back": 0}
+
+    async def call() -> bool:
+        is_create = not comments or random.random() < args.create_ratio
+        fail = random.random() < args.fail_rate
+        try:
+            async with session_scope(DB_ADS) as session:
+                repo = AdsRepo(session)
+                if is_create:
+                    xcomm = await repo.create_ads_commentary(
+                        QAddAdsComment(ads_id=xads.id, ads_comment="bench"), acc_id
+                    )
+                else:
+                    comm_id = random.choice(comments)
+                    await repo.delete_ads_commentary(xads.id, comm_id, acc_id)
+                if fail:
+                    raise InjectedError
+        except InjectedError:
+            stats["rolled_back"] += 1
+            return True
+        except KeyError:
+            # Комментарий уже удалён другим писателем: счётчик не меняется.
+            stats["delete_missed"] += 1
+            return True
+        if is_create:
+            comments.append(xcomm.id)
+            stats["created"] += 1
+        else:
+            if comm_id in comments:
+                comments.remove(comm_id)
+            stats["deleted"] += 1
+        return True
+
+    try:
+        report = await run_load(call, args.writes, args.concurrency)
+        counter, rows = await _counts(xads.id)
+        report.update(stats)
+        report.update(
+            {
+                "expected": stats["created"] - stats["deleted"],
+                "count_comments": counter,
+                "comment_rows": rows,
+                "ok": not report["errors"]
+                and counter == rows == stats["created"] - stats["deleted"],
+            }
+        )
+        print(json.dumps(report, indent=2))
+        return 0 if report["ok"] else 1
+    finally:
+        async with session_scope(DB_ADS) as session:
+            await session.execute(
+                text('DELETE FROM "Ads" WHERE id = :ads_id'), {"ads_id": xads.id}
+            )
+        await close_pg(0)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--writes", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--create-ratio", type=float, default=0.6)
+    parser.add_argument("--fail-rate", type=float, default=0.05)
+    sys.exit(asyncio.run(main(parser.parse_args())))
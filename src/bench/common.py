@@ -0,0 +1,78 @@
+import asyncio
+import statistics
+import time
+from typing import Awaitable, Callable
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Возвращает перцентиль выборки (метод ближайшего ранга).
+
+    Args:
+        values (list[float]): Выборка значений.
+        pct (float): Перцентиль в диапазоне 0..100.
+
+    Returns:
+        float: Значение перцентиля, 0.0 для пустой выборки.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(int(round(pct / 100 * len(ordered) + 0.5)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+def summarize(latencies: list[float], elapsed: float, errors: int = 0) -> dict:
+    """Сводит замеры задержек в отчёт.
+
+    Args:
+        latencies (list[float]): Задержки успешных запросов, сек.
+        elapsed (float): Общее время прогона, сек.
+        errors (int): Количество неуспешных запросов.
+
+    Returns:
+        dict: RPS и перцентили задержки в миллисекундах.
+    """
+    return {
+        "requests": len(latencies) + errors,
+        "errors": errors,
+        "rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 3) if latencies else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+    }
+
+
+async def run_load(
+    call: Callable[[], Awaitable[bool]], requests: int, concurrency: int
+) -> dict:
+    """Выполняет вызовы с заданной конкурентностью и замеряет задержки.
+
+    Args:
+        call (Callable): Корутина одного вызова, возвращает True при успехе.
+        requests (int): Общее количество вызовов.
+        concurrency (int): Количество одновременных вызовов.
+
+    Returns:
+        dict: Отчёт summarize().
+    """
+    latencies: list[float] = []
+    errors = 0
+    queue = iter(range(requests))
+
+    async def worker():
+        nonlocal errors
+        for _ in queue:
+            start = time.perf_counter()
+            try:
+                ok = await call()
+            except Exception:  # pylint: disable=broad-except
+                ok = False
+            if ok:
+                latencies.append(time.perf_counter() - start)
+            else:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, time.perf_counter() - start, errors)
@@ -0,0 +1,227 @@
+"""Микробенчмарк горячих запросов репозиториев.
+
+Сравнивает ORM-путь (select(Model) + копирование сущности в X-модель поле за
+полем, как было в репозиториях) с быстрым путём репозиториев: готовые Core
+выражения и сборка X-моделей из строк без ORM-сущностей. Печатает строки в
+секунду и процессорное время на вызов. Нужен Postgres с применёнными
+миграциями и переменные окружения приложения:
+
+    cd src && python -m bench.hot_queries --seed 200 --iterations 300
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from uuid import UUID
+
+from sqlalchemy import select, func, update, insert
+
+from account.domain.models import Account
+from account.infra.repo import AccRepo
+from account.infra.xdao import XAccount
+from ads.domain.dto import QCommentFilter, QFilter
+from ads.domain.models import Ads, AdsComment, AdsStats
+from ads.infra.repo import AdsRepo
+from ads.infra.xdao import XAds, XAdsComment
+from kernel.container import init_container
+from kernel.pg import DB_ACC, DB_ADS, init_pg, close_pg, session_scope
+
+
+def _x_ads(row: Ads, stats: AdsStats | None) -> XAds:
+    return XAds(
+        id=row.id,
+        account_id=row.account_id,
+        title=row.title,
+        description=row.description,
+        ads_category=row.ads_category,
+        price=row.price,
+        count_views=stats.count_views if stats else 0,
+        count_comments=stats.count_comments if stats else 0,
+        is_deleted=row.is_deleted,
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+        deleted_at=row.deleted_at,
+        reason_deletion=row.reason_deletion,
+    )
+
+
+async def orm_get_ads_all(session, qfilter: QFilter) -> tuple[int, list[XAds]]:
+    """ORM-путь get_ads_all."""
+    total = (await session.execute(select(func.count()).select_from(Ads))).scalar_one()
+    req = (
+        select(Ads, AdsStats)
+        .outerjoin(AdsStats, AdsStats.ads_id == Ads.id)
+        .limit(qfilter.limit)
+        .offset(qfilter.offset)
+    )
+    res = await session.execute(req)
+    return total, [_x_ads(row, stats) for row, stats in res.all()]
+
+
+async def orm_get_ads_by_id(session, ads_id: UUID) -> XAds:
+    """ORM-путь get_ads_by_id."""
+    req = (
+        update(AdsStats)
+        .values(count_views=AdsStats.count_views + 1)
+        .where(AdsStats.ads_id == ads_id)
+    )
+    await session.execute(req)
+    res = await session.execute(
+        select(Ads, AdsStats)
+        .outerjoin(AdsStats, AdsStats.ads_id == Ads.id)
+        .where(Ads.id == ads_id)
+    )
+    return _x_ads(*res.one())
+
+
+async def orm_get_ads_commentaries(session, ads_id: UUID):
+    """ORM-путь get_ads_commentaries."""
+    total = (
+        await session.execute(select(func.count()).select_from(AdsComment))
+    ).scalar_one()
+    res = await session.execute(select(AdsComment).where(AdsComment.ads_id == ads_id))
+    return total, [
+        XAdsComment(
+            id=row.id,
+            ads_id=row.ads_id,
+            account_id=row.account_id,
+            ads_comment=row.ads_comment,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+        )
+        for row in res.scalars().all()
+    ]
+
+
+async def orm_get_account_by_id(session, acc_id: UUID) -> XAccount:
+    """ORM-путь get_account_by_id."""
+    res = await session.execute(select(Account).where(Account.id == acc_id))
+    row = res.scalar_one()
+    return XAccount(
+        id=row.id,
+        email=row.email,
+        pwd_hash=row.pwd_hash,
+        salt=row.salt,
+        role=row.role,
+        count_ads=row.count_ads,
+        is_banned=row.is_banned,
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+        blocked_at=row.blocked_at,
+        reason_blocked=row.reason_blocked,
+        blocked_to=row.blocked_to,
+    )
+
+
+async def _bench(db: str, call, iterations: int, rows_per_call: int) -> dict:
+    """Выполняет вызов в отдельной транзакции iterations раз."""
+    for _ in range(10):
+        async with session_scope(db) as session:
+            await call(session)
+
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    for _ in range(iterations):
+        async with session_scope(db) as session:
+            await call(session)
+    cpu = time.process_time() - cpu
+    wall = time.perf_counter() - wall
+    return {
+        "calls_per_sec": round(iterations / wall, 1),
+        "rows_per_sec": round(iterations * rows_per_call / wall, 1),
+        "cpu_per_call_us": round(cpu / iterations * 1e6, 1),
+    }
+
+
+async def _seed(count: int) -> tuple[UUID, UUID]:
+    """Создаёт объявления и комментарии для прогона."""
+    async with session_scope(DB_ACC) as session:
+        acc_id = (await session.execute(select(Account.id).limit(1))).scalar_one()
+    async with session_scope(DB_ADS) as session:
+        ids = (
+            (
+                await session.execute(
+                    insert(Ads)
+                    .values(
+                        [
+                            {
+                                "account_id": acc_id,
+                                "title": f"bench {i}",
+                                "description": "hot queries",
+                                "ads_category": "selling",
+                                "price": i,
+                            }
+                            for i in range(count)
+                        ]
+                    )
+                    .returning(Ads.id)
+                )
+            )
+            .scalars()
+            .all()
+        )
+        await session.execute(
+            insert(AdsComment).values(
+                [
+                    {"ads_id": ids[0], "account_id": acc_id, "ads_comment": f"c{i}"}
+                    for i in range(min(count, 50))
+                ]
+            )
+        )
+    return acc_id, ids[0]
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Запускает сравнение и печатает отчёт в JSON."""
+    init_container()
+    init_pg()
+    try:
+        acc_id, ads_id = await _seed(args.seed)
+        qfilter = QFilter(limit=args.limit)
+        n_comments = min(args.seed, 50)
+        cases = {
+            "get_ads_all": (
+                DB_ADS,
+                args.limit,
+                lambda s: orm_get_ads_all(s, qfilter),
+                lambda s: AdsRepo(s).get_ads_all(qfilter),
+            ),
+            "get_ads_by_id": (
+                DB_ADS,
+                1,
+                lambda s: orm_get_ads_by_id(s, ads_id),
+                lambda s: AdsRepo(s).get_ads_by_id(ads_id),
+            ),
+            "get_ads_commentaries": (
+                DB_ADS,
+                n_comments,
+                lambda s: orm_get_ads_commentaries(s, ads_id),
+                lambda s: AdsRepo(s).get_ads_commentaries(
+                    ads_id, QCommentFilter(limit=n_comments)
+                ),
+            ),
+            "get_account_by_id": (
+                DB_ACC,
+                1,
+                lambda s: orm_get_account_by_id(s, acc_id),
+                lambda s: AccRepo(s).get_account_by_id(acc_id),
+            ),
+        }
+        report = {}
+        for name, (db, rows, orm_call, repo_call) in cases.items():
+            report[name] = {
+                "orm": await _bench(db, orm_call, args.iterations, rows),
+                "repo": await _bench(db, repo_call, args.iterations, rows),
+            }
+        print(json.dumps(report, indent=2))
+    finally:
+        await close_pg(0)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seed", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--iterations", type=int, default=300)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,146 @@
+"""Бенчмарк обновления счётчика одного горячего объявления.
+
+Сравнивает прежнюю раскладку (счётчики в широкой строке Ads рядом с
+description, fillfactor 100) с узкой таблицей счётчиков AdsStats
+(fillfactor 50). Для каждой раскладки создаётся временная копия таблицы с
+--rows строками, после чего конкурентные транзакции увеличивают count_views
+одной строки. Печатает обновления в секунду, задержки, долю HOT-обновлений
+и рост таблицы вместе с индексами. Нужен Postgres с применёнными миграциями
+и переменные окружения приложения:
+
+    cd src && python -m bench.hot_update --updates 5000 --concurrency 10
+"""
+
+import argparse
+import asyncio
+import json
+from uuid import uuid4
+
+from sqlalchemy import text
+
+from kernel.configs import AdsConfig
+from kernel.pg import create_pg_engine
+
+from .common import run_load
+
+# Таблица -> (DDL копии, колонка ключа, дополнительные колонки строки).
+LAYOUTS = {
+    "wide_ads": (
+        'CREATE TABLE bench_wide_ads (LIKE "Ads" INCLUDING DEFAULTS INCLUDING INDEXES);'
+        " ALTER TABLE bench_wide_ads"
+        " ADD COLUMN count_views INT NOT NULL DEFAULT 0,"
+        " ADD COLUMN count_comments INT NOT NULL DEFAULT 0",
+        "id",
+        ", account_id, title, description, ads_category, price",
+    ),
+    "narrow_stats": (
+        'CREATE TABLE bench_narrow_stats (LIKE "AdsStats" INCLUDING DEFAULTS'
+        " INCLUDING INDEXES) WITH (fillfactor = {fillfactor})",
+        "ads_id",
+        "",
+    ),
+}
+
+STATS = text(
+    """
+    SELECT n_tup_upd, n_tup_hot_upd, pg_total_relation_size(relid) AS size
+    FROM pg_stat_user_tables WHERE relname = :table
+    """
+)
+
+
+async def _table_stats(engine, table: str) -> dict:
+    async with engine.connect() as conn:
+        row = (await conn.execute(STATS, {"table": table})).mappings().one()
+    return dict(row)
+
+
+async def bench_layout(args: argparse.Namespace, name: str) -> dict:
+    """Создаёт копию таблицы, прогоняет обновления и возвращает отчёт."""
+    ddl, key, extra = LAYOUTS[name]
+    table = f"bench_{name}"
+    cfg = AdsConfig()
+    engine = create_pg_engine(
+        "bench",
+        cfg.ADS_DB_URL,
+        pool_size=args.concurrency,
+        max_overflow=0,
+        pool_timeout=30,
+        pre_ping=False,
+        recycle=-1,
+        echo=False,
+    )
+    hot_id = uuid4()
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP TABLE IF EXISTS {table}"))
+            for stmt in ddl.format(fillfactor=args.fillfactor).split(";"):
+                await conn.execute(text(stmt))
+            values = ""
+            if extra:
+                values = (
+                    ", gen_random_uuid(), 'bench', repeat('x', :size), 'selling', 1"
+                )
+            insert = text(
+                f"INSERT INTO {table} ({key}{extra})"
+                f" SELECT CASE WHEN i = 0 THEN CAST(:hot AS uuid)"
+                f" ELSE gen_random_uuid() END{values}"
+                " FROM generate_series(0, :rows - 1) AS i"
+            )
+            params = {"hot": str(hot_id), "rows": args.rows}
+            if extra:
+                params["size"] = args.description_size
+            await conn.execute(insert, params)
+            await conn.execute(text(f"ANALYZE {table}"))
+        await engine.dispose()
+        before = await _table_stats(engine, table)
+
+        update = text(
+            f"UPDATE {table} SET count_views = count_views + 1 WHERE {key} = :id"
+        )
+
+        async def call() -> bool:
+            async with engine.begin() as conn:
+                await conn.execute(update, {"id": hot_id})
+            return True
+
+        report = await run_load(call, args.updates, args.concurrency)
+
+        # Статистика таблиц сбрасывается процессом сервера при отключении.
+        await engine.dispose()
+        await asyncio.sleep(0.5)
+        after = await _table_stats(engine, table)
+        updates = after["n_tup_upd"] - before["n_tup_upd"]
+        hot = after["n_tup_hot_upd"] - before["n_tup_hot_upd"]
+        report.update(
+            {
+                "updates": updates,
+                "hot_updates": hot,
+                "hot_ratio": round(hot / updates, 3) if updates else 0.0,
+                "size_before_kb": before["size"] // 1024,
+                "size_after_kb": after["size"] // 1024,
+            }
+        )
+        return report
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP TABLE IF EXISTS {table}"))
+        await engine.dispose()
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Прогоняет обе раскладки и печатает отчёт в JSON."""
+    report = {}
+    for name in LAYOUTS:
+        report[name] = await bench_layout(args, name)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--updates", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--description-size", type=int, default=1500)
+    parser.add_argument("--fillfactor", type=int, default=50)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,603 @@
+"""Нагрузочный прогон по всем эндпоинтам Endpoints.
+
+Поднимает приложение отдельным процессом (uvicorn --factory main:create_app)
+и заглушку Telegram Bot API внутри прогона, готовит данные через API и
+нагружает каждый маршрут с заданной конкурентностью. Для каждого маршрута
+печатает RPS и p50/p95/p99, отчёт сохраняется в JSON и может сравниваться с
+предыдущим прогоном. Нужен Postgres с применёнными миграциями (прогон пишет в
+БД, поэтому лучше одноразовая база из docker-compose) и переменные окружения
+приложения:
+
+    cd src && python -m bench.load --requests 200 --concurrency 20 \\
+        --out baseline.json
+    cd src && python -m bench.load --requests 200 --concurrency 20 \\
+        --baseline baseline.json --out current.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import sys
+import time
+from collections import Counter
+from datetime import datetime
+from uuid import uuid4
+
+import httpx
+import uvicorn
+from fastapi import FastAPI
+
+from kernel.endpoints import Endpoints as Enp
+
+from .common import run_load
+
+CODE_RE = re.compile(r"Email: (\S+)\nКод подтверждения: (\d+)")
+
+
+def create_tg_stub(messages: list[str]) -> FastAPI:
+    """Создаёт заглушку Telegram Bot API.
+
+    Args:
+        messages (list[str]): Список, в который складываются тексты сообщений.
+
+    Returns:
+        FastAPI: Приложение с эндпоинтом sendMessage.
+    """
+    stub = FastAPI()
+
+    @stub.post("/bot{token}/sendMessage")
+    async def send_message(token: str, req: dict):  # pylint: disable=unused-argument
+        messages.append(req.get("text", ""))
+        return {"ok": True, "result": {"message_id": len(messages)}}
+
+    return stub
+
+
+async def start_app(args: argparse.Namespace, tg_url: str):
+    """Запускает приложение отдельным процессом и ждёт готовности.
+
+    Args:
+        args (argparse.Namespace): Параметры прогона.
+        tg_url (str): URL заглушки Telegram Bot API.
+
+    Returns:
+        asyncio.subprocess.Process: Процесс uvicorn.
+
+    Raises:
+        RuntimeError: Если приложение не ответило за --startup-timeout.
+    """
+    url = f"http://{args.host}:{args.port}"
+    env = dict(os.environ, API_URL=url, TGBOT_API_URL=tg_url)
+    if args.transport:
+        env["SVC_TRANSPORT"] = args.transport
+    proc = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-m",
+        "uvicorn",
+        "--factory",
+        "main:create_app",
+        "--host",
+        args.host,
+        "--port",
+        str(args.port),
+        "--workers",
+        str(args.workers),
+        "--no-access-log",
+        "--log-level",
+        "warning",
+        env=env,
+    )
+    deadline = time.monotonic() + args.startup_timeout
+    async with httpx.AsyncClient(base_url=url) as client:
+        while time.monotonic() < deadline:
+            if proc.returncode is not None:
+                break
+            try:
+                if (await client.get(Enp.ADS_GET_ALL)).status_code == 200:
+                    return proc
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    await stop_app(proc)
+    raise RuntimeError(f"Приложение не поднялось на {url}")
+
+
+async def stop_app(proc) -> None:
+    """Останавливает процесс приложения."""
+    if proc.returncode is None:
+        proc.terminate()
+        try:
+            await asyncio.wait_for(proc.wait(), 15)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+
+
+def _payload(resp: httpx.Response):
+    """Возвращает payload успешного ответа приложения."""
+    body = resp.json()
+    if resp.status_code != 200 or not body.get("ok"):
+        raise RuntimeError(f"{resp.request.url}: {resp.status_code} {body}")
+    return body["payload"]
+
+
+async def _gather(n: int, factory, limit: int) -> list:
+    """Выполняет n корутин factory() не более limit одновременно."""
+    sem = asyncio.Semaphore(limit)
+
+    async def one():
+        async with sem:
+            return await factory()
+
+    return list(await asyncio.gather(*(one() for _ in range(n))))
+
+
+def _email() -> str:
+    return f"load-{uuid4().hex[:16]}@example.com"
+
+
+async def seed(client: httpx.AsyncClient, args, messages: list[str]) -> dict:
+    """Готовит данные прогона через API.
+
+    Повторяемые маршруты работают с общими объявлением, комментарием и
+    жалобой. Для маршрутов, которые расходуют данные (подтверждение
+    регистрации, удаления), заранее создаются пулы по одному элементу на
+    вызов.
+
+    Returns:
+        dict: Идентификаторы, заголовки авторизации и пулы.
+    """
+    n = args.requests + args.warmup
+    signin = {"email": args.email, "password": args.password}
+    token = _payload(await client.post(Enp.AUTH_SIGNIN_EMAIL, json=signin))
+    headers = {"Authorization": f"Bearer {token['access_token']}"}
+    admin = _payload(await client.get(Enp.ACCOUNT_CURRENT, headers=headers))
+
+    async def create_ads():
+        resp = await client.post(
+            Enp.ADS_CREATE,
+            json={"title": "load", "description": "bench.load", "price": 100},
+            headers=headers,
+        )
+        return _payload(resp)["id"]
+
+    async def create_comment(ads_id):
+        resp = await client.post(
+            Enp.ADS_ADD_COMMENTARY.format(ads_id=ads_id), json="load", headers=headers
+        )
+        return _payload(resp)["id"]
+
+    async def signup():
+        email = _email()
+        resp = await client.post(
+            Enp.AUTH_SIGNUP_EMAIL, json={"email": email, "password": "load"}
+        )
+        return email, _payload(resp)["id"]
+
+    ads_id = await create_ads()
+    comm_id = await create_comment(ads_id)
+    compl = _payload(
+        await client.post(
+            Enp.COMPL_ADD_COMPLAINT,
+            json={
+                "compl_on_id": ads_id,
+                "service": "ads",
+                "author_id": admin["id"],
+                "complaints": "load",
+            },
+        )
+    )
+
+    signups = await _gather(n + 1, signup, args.concurrency)
+    codes = dict(CODE_RE.findall("\n".join(messages)))
+    confirms = [{"signup_id": sid, "code": codes[email]} for email, sid in signups]
+    # Отдельный пользователь: на него жалуются, его банят, а он жалуется на
+    # объявление администратора (на своё пожаловаться нельзя).
+    target = _payload(await client.post(Enp.AUTH_CONFIRM_EMAIL, json=confirms.pop()))
+    user = {"email": signups[-1][0], "password": "load"}
+    user_token = _payload(await client.post(Enp.AUTH_SIGNIN_EMAIL, json=user))
+
+    return {
+        "headers": headers,
+        "refresh_token": token["refresh_token"],
+        "admin": admin,
+        "target_id": target["id"],
+        "user_headers": {"Authorization": f"Bearer {user_token['access_token']}"},
+        "ads_id": ads_id,
+        "comm_id": comm_id,
+        "compl_id": compl["id"],
+        "confirms": confirms,
+        "ads_delete": await _gather(n, create_ads, args.concurrency),
+        "ads_adm_delete": await _gather(n, create_ads, args.concurrency),
+        "comm_delete": await _gather(
+            n, lambda: create_comment(ads_id), args.concurrency
+        ),
+        "comm_adm_delete": await _gather(
+            n, lambda: create_comment(ads_id), args.concurrency
+        ),
+    }
+
+
+def scenario(ctx: dict, args) -> list[tuple]:
+    """Описывает вызов каждого маршрута.
+
+    ADS_ADD_COMPLAINT_COMMENTARY объявлен в Endpoints, но обработчика у него
+    нет, поэтому он попадает в skipped отчёта.
+
+    Returns:
+        list[tuple]: (метод, шаблон маршрута, фабрика параметров запроса,
+            ожидаемые статусы). Фабрика возвращает параметры пути и kwargs
+            для httpx.AsyncClient.request.
+    """
+    auth = {"headers": ctx["headers"]}
+    adm = ctx["admin"]
+    ads = {"ads_id": ctx["ads_id"]}
+    comm = {"ads_id": ctx["ads_id"], "comm_id": ctx["comm_id"]}
+    signin = {"email": args.email, "password": args.password}
+
+    def signup_body():
+        return {}, {"json": {"email": _email(), "password": "load"}}
+
+    def copy_signup_body():
+        return {}, {
+            "json": {
+                "id": str(uuid4()),
+                "email": _email(),
+                "pwd_hash": "load",
+                "salt": "load",
+                "code": 0,
+            }
+        }
+
+    return [
+        ("POST", Enp.AUTH_SIGNUP_EMAIL, signup_body, (200,)),
+        (
+            "POST",
+            Enp.AUTH_CONFIRM_EMAIL,
+            lambda: ({}, {"json": ctx["confirms"].pop()}),
+            (200,),
+        ),
+        ("POST", Enp.AUTH_SIGNIN_EMAIL, lambda: ({}, {"json": signin}), (200,)),
+        (
+            "POST",
+            Enp.AUTH_SIGNIN_EMAIL_FORM,
+            lambda: ({}, {"data": {"username": args.email, "password": args.password}}),
+            (200,),
+        ),
+        # signin выдаёт refresh-токен с type=access, поэтому обновление сейчас
+        # отвечает 400; замеряется путь до этой проверки.
+        (
+            "POST",
+            Enp.AUTH_REFRESH_TOKEN,
+            lambda: ({}, {"json": {"refresh_token": ctx["refresh_token"]}}),
+            (200, 400),
+        ),
+        # Первый вызов отзывает все токены, остальные отвечают 404.
+        (
+            "POST",
+            Enp.AUTH_REVOKE_TOKEN,
+            lambda: ({}, {"json": {"account_id": adm["id"]}}),
+            (200, 404),
+        ),
+        ("GET", Enp.ACCOUNT_CURRENT, lambda: ({}, auth), (200,)),
+        (
+            "GET",
+            Enp.ACCOUNT_GET_BY_ID,
+            lambda: ({"acc_id": adm["id"]}, {}),
+            (200,),
+        ),
+        (
+            "GET",
+            Enp.ACCOUNT_GET_BY_EMAIL,
+            lambda: ({"email": adm["email"]}, {}),
+            (200,),
+        ),
+        ("POST", Enp.ACCOUNT_COPY_FOR_SIGNUP, copy_signup_body, (200,)),
+        ("GET", Enp.ACCOUNT_GET_ALL, lambda: ({}, {}), (200,)),
+        (
+            "POST",
+            Enp.ACCOUNT_IS_EMAIL_BUSY,
+            lambda: ({"email": adm["email"]}, {}),
+            (200,),
+        ),
+        (
+            "POST",
+            Enp.ACCOUNT_SEND_COMPLAINT,
+            lambda: ({"acc_id": ctx["target_id"]}, {"json": "load", **auth}),
+            (200,),
+        ),
+        (
+            "POST",
+            Enp.ADS_CREATE,
+            lambda: (
+                {},
+                {"json": {"title": "load", "description": "c", "price": 1}, **auth},
+            ),
+            (200,),
+        ),
+        (
+            "PATCH",
+            Enp.ADS_CHANGE,
+            lambda: (
+                ads,
+                {
+                    "json": {**ads, "title": "load", "description": "u", "price": 2},
+                    **auth,
+                },
+            ),
+            (200,),
+        ),
+        (
+            "PATCH",
+            Enp.ADS_CHANGE_CATEGORY,
+            lambda: (ads, {"params": {"req": "buying"}, **auth}),
+            (200,),
+        ),
+        (
+            "DELETE",
+            Enp.ADS_DELETE,
+            lambda: ({"ads_id": ctx["ads_delete"].pop()}, auth),
+            (200,),
+        ),
+        ("GET", Enp.ADS_GET_ALL, lambda: ({}, {"params": {"limit": 10}}), (200,)),
+        ("GET", Enp.ADS_GET_BY_ME, lambda: ({}, auth), (200,)),
+        ("GET", Enp.ADS_GET_BY_ID, lambda: ({}, {"params": ads}), (200,)),
+        (
+            "GET",
+            Enp.ADS_GET_BY_ACCOUNT,
+            lambda: ({}, {"params": {"acc_id": adm["id"]}}),
+            (200,),
+        ),
+        (
+            "GET",
+            Enp.ADS_GET_COUNT_ADS_BY_ACCOUNT,
+            lambda: ({}, {"params": {"acc_id": adm["id"]}}),
+            (200,),
+        ),
+        (
+            "POST",
+            Enp.ADS_SEND_COMPLAINT,
+            lambda: (ads, {"json": "load", "headers": ctx["user_headers"]}),
+            (200,),
+        ),
+        (
+            "POST",
+            Enp.ADS_ADD_COMMENTARY,
+            lambda: (ads, {"json": "load", **auth}),
+            (200,),
+        ),
+        ("GET", Enp.ADS_GET_COMMENTATIES, lambda: (ads, {}), (200,)),
+        ("GET", Enp.ADS_ACTION_COMMENTARY, lambda: (comm, {}), (200,)),
+        (
+            "PATCH",
+            Enp.ADS_ACTION_COMMENTARY,
+            lambda: (comm, {"json": "load", **auth}),
+            (200,),
+        ),
+        (
+            "DELETE",
+            Enp.ADS_ACTION_COMMENTARY,
+            lambda: ({**ads, "comm_id": ctx["comm_delete"].pop()}, auth),
+            (200,),
+        ),
+        (
+            "POST",
+            Enp.COMPL_ADD_COMPLAINT,
+            lambda: (
+                {},
+                {
+                    "json": {
+                        "compl_on_id": ctx["ads_id"],
+                        "service": "ads",
+                        "author_id": adm["id"],
+                        "complaints": "load",
+                    }
+                },
+            ),
+            (200,),
+        ),
+        ("GET", Enp.COMPL_GET_MY_COMPLAINTS, lambda: ({}, auth), (200,)),
+        (
+            "GET",
+            Enp.COMPL_GET_MY_COMPLAINT,
+            lambda: ({"compl_id": ctx["compl_id"]}, auth),
+            (200,),
+        ),
+        (
+            "DELETE",
+            Enp.ADM_DELETE_ADS,
+            lambda: ({"ads_id": ctx["ads_adm_delete"].pop()}, {"json": "load", **auth}),
+            (200,),
+        ),
+        (
+            "DELETE",
+            Enp.ADM_DELETE_COMMENTARY,
+            lambda: ({"comm_id": ctx["comm_adm_delete"].pop()}, auth),
+            (200,),
+        ),
+        (
+            "PATCH",
+            Enp.ADM_SET_ROLE_ACCOUNT,
+            lambda: (
+                {"acc_id": ctx["target_id"]},
+                {"params": {"role": "user"}, **auth},
+            ),
+            (200,),
+        ),
+        (
+            "PATCH",
+            Enp.ADM_SET_BAN_ACCOUNT,
+            lambda: (
+                {"acc_id": ctx["target_id"]},
+                {"params": {"blocked_to": "week"}, "json": "load", **auth},
+            ),
+            (200,),
+        ),
+        (
+            "PATCH",
+            Enp.ADM_SET_UNBAN_ACCOUNT,
+            lambda: ({"acc_id": ctx["target_id"]}, auth),
+            (200,),
+        ),
+        ("GET", Enp.ADM_GET_COMPLAINTS, lambda: ({}, auth), (200,)),
+        (
+            "GET",
+            Enp.ADM_GET_COMPLAINT_BY_ID,
+            lambda: ({"compl_id": ctx["compl_id"]}, auth),
+            (200,),
+        ),
+        (
+            "GET",
+            Enp.SYS_POOL_STATS,
+            lambda: ({}, {"headers": {"X-API-KEY": os.environ.get("API_KEY", "")}}),
+            (200,),
+        ),
+    ]
+
+
+def uncovered(routes: list[tuple]) -> list[str]:
+    """Возвращает маршруты Endpoints, которых нет в сценарии."""
+    covered = {route for _, route, _, _ in routes}
+    return sorted({getattr(Enp, name) for name in dir(Enp) if name.isupper()} - covered)
+
+
+async def bench_route(client, method, route, build, ok, args) -> dict:
+    """Нагружает один маршрут и возвращает отчёт run_load со статусами."""
+    statuses: Counter = Counter()
+
+    async def call() -> bool:
+        path, kwargs = build()
+        try:
+            resp = await client.request(method, route.format(**path), **kwargs)
+        except httpx.HTTPError as e:
+            statuses[type(e).__name__] += 1
+            return False
+        statuses[str(resp.status_code)] += 1
+        return resp.status_code in ok
+
+    for _ in range(args.warmup):
+        await call()
+    statuses.clear()
+    res = await run_load(call, args.requests, args.concurrency)
+    res["statuses"] = dict(sorted(statuses.items()))
+    return res
+
+
+def compare(report: dict, baseline: dict) -> None:
+    """Печатает изменение RPS и p95 относительно базового прогона."""
+
+    def delta(new, old):
+        return f"{(new - old) / old * 100:+.1f}%" if old else "n/a"
+
+    print(
+        f"\n{'endpoint':<52} {'rps':>8} {'base':>8} {'Δrps':>8} "
+        f"{'p95':>8} {'base':>8} {'Δp95':>8}"
+    )
+    for name, row in report["routes"].items():
+        old = baseline["routes"].get(name)
+        if old is None:
+            continue
+        print(
+            f"{name:<52} {row['rps']:>8} {old['rps']:>8} "
+            f"{delta(row['rps'], old['rps']):>8} {row['p95_ms']:>8} "
+            f"{old['p95_ms']:>8} {delta(row['p95_ms'], old['p95_ms']):>8}"
+        )
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Поднимает окружение, прогоняет маршруты и сохраняет отчёт."""
+    messages: list[str] = []
+    tg = uvicorn.Server(
+        uvicorn.Config(
+            create_tg_stub(messages),
+            host=args.host,
+            port=args.tg_port,
+            log_level="warning",
+            access_log=False,
+        )
+    )
+    tg_task = asyncio.create_task(tg.serve())
+    while not tg.started:
+        if tg_task.done():
+            await tg_task
+            raise RuntimeError("Заглушка Telegram не поднялась")
+        await asyncio.sleep(0.05)
+
+    proc = None
+    try:
+        proc = await start_app(args, f"http://{args.host}:{args.tg_port}")
+        limits = httpx.Limits(
+            max_connections=args.concurrency,
+            max_keepalive_connections=args.concurrency,
+        )
+        async with httpx.AsyncClient(
+            base_url=f"http://{args.host}:{args.port}",
+            limits=limits,
+            timeout=args.timeout,
+        ) as client:
+            ctx = await seed(client, args, messages)
+            routes = scenario(ctx, args)
+
+            report = {
+                "meta": {
+                    "created_at": datetime.now().isoformat(timespec="seconds"),
+                    "requests": args.requests,
+                    "concurrency": args.concurrency,
+                    "workers": args.workers,
+                    "transport": args.transport or os.environ.get("SVC_TRANSPORT"),
+                    "skipped": uncovered(routes),
+                },
+                "routes": {},
+            }
+            print(
+                f"{'endpoint':<52} {'rps':>8} {'p50':>8} {'p95':>8} "
+                f"{'p99':>8} {'err':>5}"
+            )
+            for method, route, build, ok in routes:
+                if args.routes and not any(r in route for r in args.routes):
+                    continue
+                name = f"{method} {route}"
+                row = await bench_route(client, method, route, build, ok, args)
+                report["routes"][name] = row
+                print(
+                    f"{name:<52} {row['rps']:>8} {row['p50_ms']:>8} "
+                    f"{row['p95_ms']:>8} {row['p99_ms']:>8} {row['errors']:>5}"
+                )
+    finally:
+        if proc is not None:
+            await stop_app(proc)
+        tg.should_exit = True
+        await tg_task
+
+    if report["meta"]["skipped"]:
+        print("\nНе покрыты сценарием:", ", ".join(report["meta"]["skipped"]))
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            compare(report, json.load(f))
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--transport", choices=("http", "local"), default=None)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--tg-port", type=int, default=8091)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--startup-timeout", type=float, default=60.0)
+    parser.add_argument("--email", default="admin@ad.com")
+    parser.add_argument("--password", default="admin")
+    parser.add_argument("--routes", nargs="*", help="Подстроки маршрутов для прогона")
+    parser.add_argument("--out", help="Файл для сохранения отчёта")
+    parser.add_argument("--baseline", help="Отчёт прошлого прогона для сравнения")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,258 @@
+"""Проверка планов запросов ленты и списка объявлений аккаунта.
+
+Засевает объявления с описанием типичной длины (от ширины строки зависит,
+выгоднее ли планировщику читать таблицу целиком), выполняет VACUUM ANALYZE и
+для каждого сочетания QFilter (сортировка, категория, диапазон цены, offset
+или курсор) снимает EXPLAIN ровно тех запросов, которые выполняет
+AdsRepo.get_ads_all, а для каждой сортировки QAccountAdsFilter — запросов
+AdsRepo.get_ads_by_account_id по засеянному аккаунту. Все объявления засеваются
+одному аккаунту, то есть проверяется худший случай — аккаунт с тысячами
+объявлений. Подсказки AdsRepo.suggest_ads проверяются для префиксов разной
+длины: короткие идут по B-tree по lower(title), остальные — по триграммному
+индексу, для них нужен pg_trgm (миграция 008). Завершается с кодом 1, если хоть
+один вариант читает "Ads" последовательным сканированием.
+
+VACUUM ANALYZE может выполнить только владелец таблиц, поэтому, если
+приложение ходит в БД не владельцем, нужен --maintenance-url. Нужен Postgres с
+применёнными миграциями и переменные окружения приложения:
+
+    cd src && python -m bench.plan_check --seed 20000 \\
+        --maintenance-url postgresql+asyncpg://postgres@127.0.0.1:5432/ads
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import sys
+from typing import Awaitable, Callable
+from uuid import uuid4
+
+from sqlalchemy import event, text
+
+from ads.domain.dto import QAccountAdsFilter, QAdsCategory, QAdsPriceFilter, QFilter
+from ads.infra.repo import SUGGEST_TRGM_MIN_LEN, AdsRepo
+from kernel.container import init_container
+from kernel.pg import (
+    DB_ADS,
+    ENGINES,
+    close_pg,
+    create_pg_engine,
+    init_pg,
+    session_scope,
+)
+
+CATEGORIES = [category.value for category in QAdsCategory]
+ORDERINGS = [None, QAdsPriceFilter.BY_INCREASE, QAdsPriceFilter.BY_DECREASE]
+PRICE_RANGES = [(None, None), (1000, None), (None, 2000), (1000, 2000)]
+# Префиксы подсказок по засеянным заголовкам 'plan check <i>': один и два
+# символа (B-tree), избирательный префикс и опечатка (триграммы).
+SUGGEST_PREFIXES = ["p", "pl", "plan check 1234", "plan chek 1234"]
+
+SEED = text(
+    """
+    INSERT INTO "Ads" (account_id, title, description, ads_category, price, created_at)
+    SELECT CAST(:acc_id AS uuid), 'plan check ' || i, repeat('x', :description_size),
+        (CAST(:categories AS varchar[]))[1 + i % 3], (i * 7919) % 100000,
+        now() - make_interval(secs => i)
+    FROM generate_series(1, :count) AS i
+    """
+)
+RELTUPLES = text("""SELECT reltuples FROM pg_class WHERE oid = '"Ads"'::regclass""")
+HAS_TRGM = text("SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')")
+
+
+def _seq_scans(plan: dict) -> list[str]:
+    """Возвращает таблицы, читаемые последовательным сканированием."""
+    res = []
+    if plan.get("Node Type") == "Seq Scan":
+        res.append(plan.get("Relation Name"))
+    for child in plan.get("Plans", []):
+        res.extend(_seq_scans(child))
+    return res
+
+
+def _nodes(plan: dict) -> list[str]:
+    """Возвращает узлы плана со сканированием индексов."""
+    res = []
+    if "Index Name" in plan:
+        res.append(f"{plan['Node Type']} {plan['Index Name']}")
+    for child in plan.get("Plans", []):
+        res.extend(_nodes(child))
+    return res
+
+
+async def _explain(call: Callable[[AdsRepo], Awaitable]) -> list[dict]:
+    """Выполняет метод репозитория и снимает EXPLAIN каждого его запроса."""
+    statements = []
+
+    def _capture(_conn, _cursor, statement, parameters, *_):
+        statements.append((statement, parameters))
+
+    engine = ENGINES[DB_ADS].sync_engine
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        async with session_scope(DB_ADS) as session:
+            await call(AdsRepo(session))
+            conn = await session.connection()
+            plans = []
+            for statement, parameters in list(statements):
+                res = await conn.exec_driver_sql(
+                    "EXPLAIN (FORMAT JSON) " + statement, parameters
+                )
+                plans.append(res.scalar_one()[0]["Plan"])
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+    return plans
+
+
+def _check(report: dict, name: str, plans: list[dict]) -> bool:
+    """Добавляет вариант в отчёт; False, если "Ads" читается Seq Scan."""
+    seq = [t for plan in plans for t in _seq_scans(plan) if t == "Ads"]
+    report[name] = {
+        "ok": not seq,
+        "indexes": [node for plan in plans for node in _nodes(plan)],
+    }
+    return not seq
+
+
+async def _vacuum_analyze(url: str | None) -> bool:
+    """Обновляет статистику и карту видимости таблиц объявлений.
+
+    Returns:
+        bool: True, если статистика "Ads" собрана (VACUUM без прав владельца
+            пропускает таблицу с предупреждением).
+    """
+    engine = ENGINES[DB_ADS]
+    if url:
+        engine = create_pg_engine(
+            "maintenance",
+            url,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=30,
+            pre_ping=False,
+            recycle=-1,
+            echo=False,
+        )
+    try:
+        async with engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            await conn.execute(text('VACUUM ANALYZE "Ads"'))
+            await conn.execute(text('VACUUM ANALYZE "AdsStats"'))
+            res = await conn.execute(RELTUPLES)
+            return res.scalar_one() >= 0
+    finally:
+        if url:
+            await engine.dispose()
+
+
+async def main(args: argparse.Namespace) -> int:
+    """Проверяет планы всех вариантов и печатает отчёт в JSON."""
+    init_container()
+    init_pg()
+    acc_id = uuid4()
+    try:
+        async with session_scope(DB_ADS) as session:
+            await session.execute(
+                SEED,
+                {
+                    "acc_id": acc_id,
+                    "categories": CATEGORIES,
+                    "count": args.seed,
+                    "description_size": args.description_size,
+                },
+            )
+        if not await _vacuum_analyze(args.maintenance_url):
+            print(
+                'VACUUM ANALYZE "Ads" не выполнен: нужен владелец таблицы,'
+                " задайте --maintenance-url",
+                file=sys.stderr,
+            )
+            return 1
+
+        report = {}
+        failed = []
+        variants = itertools.product(
+            ORDERINGS, [None, QAdsCategory.SELLING], PRICE_RANGES, [False, True]
+        )
+        for price, category, (price_from, price_to), with_cursor in variants:
+            qfilter = QFilter(
+                limit=args.limit,
+                price=price,
+                ads_category=category,
+                price_from=price_from,
+                price_to=price_to,
+            )
+            if with_cursor:
+                async with session_scope(DB_ADS) as session:
+                    page = await AdsRepo(session).get_ads_all(qfilter)
+                qfilter.cursor = page.next_cursor
+
+            name = (
+                f"price={price.value if price else None} "
+                f"category={category.value if category else None} "
+                f"from={price_from} to={price_to} "
+                f"{'cursor' if with_cursor else 'offset'}"
+            )
+            plans = await _explain(lambda repo, q=qfilter: repo.get_ads_all(q))
+            if not _check(report, name, plans):
+                failed.append(name)
+
+        for price, with_cursor in itertools.product(ORDERINGS, [False, True]):
+            afilter = QAccountAdsFilter(limit=args.limit, price=price)
+            if with_cursor:
+                async with session_scope(DB_ADS) as session:
+                    page = await AdsRepo(session).get_ads_by_account_id(acc_id, afilter)
+                afilter.cursor = page.next_cursor
+
+            name = (
+                f"author price={price.value if price else None} "
+                f"{'cursor' if with_cursor else 'first'}"
+            )
+            plans = await _explain(
+                lambda repo, q=afilter: repo.get_ads_by_account_id(acc_id, q)
+            )
+            if not _check(report, name, plans):
+                failed.append(name)
+
+        async with session_scope(DB_ADS) as session:
+            has_trgm = await session.scalar(HAS_TRGM)
+        for prefix in SUGGEST_PREFIXES:
+            name = f"suggest prefix={prefix!r}"
+            if len(prefix) >= SUGGEST_TRGM_MIN_LEN and not has_trgm:
+                report[name] = {"ok": False, "error": "pg_trgm не установлен"}
+                failed.append(name)
+                continue
+            plans = await _explain(
+                lambda repo, p=prefix: repo.suggest_ads(p, args.limit)
+            )
+            if not _check(report, name, plans):
+                failed.append(name)
+
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        if failed:
+            print(f"Seq Scan по Ads в {len(failed)} вариантах:", file=sys.stderr)
+            for name in failed:
+                print(f"  {name}", file=sys.stderr)
+            return 1
+        print(f"Все {len(report)} вариантов идут по индексам", file=sys.stderr)
+        return 0
+    finally:
+        if not args.keep:
+            async with session_scope(DB_ADS) as session:
+                await session.execute(
+                    text('DELETE FROM "Ads" WHERE account_id = :acc_id'),
+                    {"acc_id": acc_id},
+                )
+        await close_pg(0)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seed", type=int, default=20000)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--description-size", type=int, default=500)
+    parser.add_argument("--maintenance-url", help="URL владельца таблиц Ads")
+    parser.add_argument("--keep", action="store_true", help="не удалять засеянные")
+    sys.exit(asyncio.run(main(parser.parse_args())))
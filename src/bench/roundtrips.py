@@ -0,0 +1,142 @@
+"""Подсчёт обращений к БД на каждый эндпоинт.
+
+Поднимает приложение в процессе (TestClient), проходит сценарий по основным
+эндпоинтам и для каждого считает запросы, BEGIN, COMMIT и ROLLBACK по всем
+движкам. Нужен запущенный Postgres с применёнными миграциями и переменные
+окружения приложения; межсервисные вызовы идут внутри процесса:
+
+    cd src && SVC_TRANSPORT=local python -m bench.roundtrips
+"""
+
+import argparse
+import json
+import os
+from collections import Counter
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from kernel.endpoints import Endpoints as Enp
+from kernel.pg import ENGINES
+
+COUNTER: Counter = Counter()
+
+
+def _listen(engine) -> None:
+    """Подписывается на события движка и считает обращения к БД."""
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _on_execute(*_):
+        COUNTER["statements"] += 1
+
+    for name in ("begin", "commit", "rollback"):
+        event.listen(
+            engine.sync_engine,
+            name,
+            lambda *_, key=name: COUNTER.update({key: 1}),
+        )
+
+
+def _measure(client: TestClient, method: str, url: str, **kwargs) -> dict:
+    """Выполняет запрос и возвращает счётчики обращений к БД."""
+    COUNTER.clear()
+    resp = client.request(method, url, **kwargs)
+    res = {
+        "status": resp.status_code,
+        "statements": COUNTER["statements"],
+        "begin": COUNTER["begin"],
+        "commit": COUNTER["commit"],
+        "rollback": COUNTER["rollback"],
+    }
+    res["round_trips"] = (
+        res["statements"] + res["begin"] + res["commit"] + res["rollback"]
+    )
+    return res
+
+
+def main(args: argparse.Namespace) -> None:
+    """Проходит сценарий и печатает таблицу обращений к БД."""
+    os.environ.setdefault("SVC_TRANSPORT", "local")
+
+    import main as app_main  # pylint: disable=import-outside-toplevel
+
+    report = {}
+    with TestClient(app_main.create_app()) as client:
+        for engine in ENGINES.values():
+            _listen(engine)
+
+        signin = {"email": args.email, "password": args.password}
+        report["POST " + Enp.AUTH_SIGNIN_EMAIL] = _measure(
+            client, "POST", Enp.AUTH_SIGNIN_EMAIL, json=signin
+        )
+        token = client.post(Enp.AUTH_SIGNIN_EMAIL, json=signin).json()["payload"]
+        headers = {"Authorization": f"Bearer {token['access_token']}"}
+
+        ads = {"title": "bench", "description": "roundtrips", "price": 100}
+        resp = client.post(Enp.ADS_CREATE, json=ads, headers=headers)
+        ads_id = resp.json()["payload"]["id"]
+        acc_id = resp.json()["payload"]["account_id"]
+        comm = client.post(
+            Enp.ADS_ADD_COMMENTARY.format(ads_id=ads_id), json="c", headers=headers
+        ).json()["payload"]
+
+        ads_path = {"ads_id": ads_id}
+        comm_path = {"ads_id": ads_id, "comm_id": comm["id"]}
+        scenario = [
+            ("POST", Enp.ADS_CREATE, {}, {"json": ads, "headers": headers}),
+            ("GET", Enp.ADS_GET_ALL, {}, {}),
+            ("GET", Enp.ADS_GET_BY_ID, {}, {"params": {"ads_id": ads_id}}),
+            ("GET", Enp.ADS_GET_BY_ACCOUNT, {}, {"params": {"acc_id": acc_id}}),
+            ("GET", Enp.ADS_GET_BY_ME, {}, {"headers": headers}),
+            (
+                "GET",
+                Enp.ADS_GET_COUNT_ADS_BY_ACCOUNT,
+                {},
+                {"params": {"acc_id": acc_id}},
+            ),
+            (
+                "POST",
+                Enp.ADS_ADD_COMMENTARY,
+                ads_path,
+                {"json": "c", "headers": headers},
+            ),
+            ("GET", Enp.ADS_GET_COMMENTATIES, ads_path, {}),
+            ("GET", Enp.ADS_ACTION_COMMENTARY, comm_path, {}),
+            (
+                "PATCH",
+                Enp.ADS_ACTION_COMMENTARY,
+                comm_path,
+                {"json": "c2", "headers": headers},
+            ),
+            ("DELETE", Enp.ADS_ACTION_COMMENTARY, comm_path, {"headers": headers}),
+            ("GET", Enp.ACCOUNT_CURRENT, {}, {"headers": headers}),
+            ("GET", Enp.ACCOUNT_GET_BY_ID, {"acc_id": acc_id}, {}),
+            ("GET", Enp.ACCOUNT_GET_ALL, {}, {}),
+            ("GET", Enp.COMPL_GET_MY_COMPLAINTS, {}, {"headers": headers}),
+            ("DELETE", Enp.ADS_DELETE, ads_path, {"headers": headers}),
+        ]
+        for method, route, path, kwargs in scenario:
+            report[f"{method} {route}"] = _measure(
+                client, method, route.format(**path), **kwargs
+            )
+
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        return
+
+    print(
+        f"{'endpoint':<44} {'status':>6} {'stmt':>5} {'begin':>5} {'commit':>6} {'rt':>4}"
+    )
+    for name, row in report.items():
+        print(
+            f"{name:<44} {row['status']:>6} {row['statements']:>5} "
+            f"{row['begin']:>5} {row['commit']:>6} {row['round_trips']:>4}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--email", default="admin@ad.com")
+    parser.add_argument("--password", default="admin")
+    parser.add_argument("--json", action="store_true")
+    main(parser.parse_args())
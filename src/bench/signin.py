@@ -0,0 +1,72 @@
+"""Бенчмарк общего HTTP-клиента на пути /api/auth/signin/email.
+
+Сравнивает вызов AccService.get_account_by_email с новым httpx.AsyncClient
+на каждый запрос (прежнее поведение) и с общим keep-alive клиентом, а также
+замеряет сквозную задержку входа. Запускается против работающего сервиса:
+
+    cd src && python -m bench.signin --url http://127.0.0.1:8080 \\
+        --email admin@ad.com --password admin --requests 500 --concurrency 10
+"""
+
+import argparse
+import asyncio
+import json
+
+import httpx
+
+from account.external.svc import AccService
+from kernel.endpoints import Endpoints as Enp
+
+from .common import run_load
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Запускает сценарии бенчмарка и печатает отчёт в JSON."""
+    report = {}
+
+    async def per_call_client() -> bool:
+        async with httpx.AsyncClient() as client:
+            svc = AccService(args.url, client, args.timeout)
+            await svc.get_account_by_email(args.email)
+        return True
+
+    report["get_account_by_email/per_call_client"] = await run_load(
+        per_call_client, args.requests, args.concurrency
+    )
+
+    limits = httpx.Limits(max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(limits=limits) as client:
+        svc = AccService(args.url, client, args.timeout)
+
+        async def shared_client() -> bool:
+            await svc.get_account_by_email(args.email)
+            return True
+
+        report["get_account_by_email/shared_client"] = await run_load(
+            shared_client, args.requests, args.concurrency
+        )
+
+        async def signin() -> bool:
+            resp = await client.post(
+                args.url + Enp.AUTH_SIGNIN_EMAIL,
+                json={"email": args.email, "password": args.password},
+                timeout=args.timeout,
+            )
+            return resp.status_code == 200 and resp.json()["ok"]
+
+        report["signin_email/end_to_end"] = await run_load(
+            signin, args.requests, args.concurrency
+        )
+
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default="http://127.0.0.1:8080")
+    parser.add_argument("--email", default="admin@ad.com")
+    parser.add_argument("--password", default="admin")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--timeout", type=float, default=10.0)
+    asyncio.run(main(parser.parse_args()))
@@ -2,21 +2,30 @@ import httpx
 
 from kernel.endpoints import Endpoints as Enp
 from kernel.exception import ExpError
+from kernel.metrics import observe_call
+from kernel.pg import DB_COMPL, session_scope
 
 from ..domain.dto import QCreateCompl, ZCompl
+from ..infra.repo import ComplRepo
+from ..internal.uc import ComplUseCase
 
 
 class ComplService:
     """Сервис для работы с жалобами через внешнее API."""
 
-    def __init__(self, _base_url: str):
+    def __init__(self, _base_url: str, _client: httpx.AsyncClient, _timeout: float):
         """Инициализирует сервис жалоб с базовым URL API.
 
         Args:
             _base_url (str): Базовый URL API сервиса жалоб.
+            _client (httpx.AsyncClient): Общий HTTP-клиент процесса.
+            _timeout (float): Таймаут запросов к сервису, сек.
         """
         self.base_url = _base_url
+        self.client = _client
+        self.timeout = _timeout
 
+    @observe_call("compl", "http")
     async def create_compl(self, compl: QCreateCompl) -> ZCompl:
         """Создает новую жалобу через API.
 
@@ -34,10 +43,32 @@ class ComplService:
             ValueError: При неверном формате ответа API.
         """
         url = self.base_url + Enp.COMPL_ADD_COMPLAINT
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(url, json=compl.model_dump(mode="json"))
-            resp_js = resp.json()
-            if not resp_js["ok"]:
-                raise ExpError(code_msg=(resp_js["err"]["code"], resp_js["err"]["msg"]))
-            res = resp_js["payload"]
-            return res
+        resp = await self.client.post(
+            url, json=compl.model_dump(mode="json"), timeout=self.timeout
+        )
+        resp_js = resp.json()
+        if not resp_js["ok"]:
+            raise ExpError(code_msg=(resp_js["err"]["code"], resp_js["err"]["msg"]))
+        res = resp_js["payload"]
+        return res
+
+
+class ComplLocalService:
+    """Сервис для работы с жалобами внутри процесса.
+
+    Вызывает ComplUseCase напрямую, без HTTP-запроса к API. Используется, когда
+    сервис жалоб смонтирован в том же приложении (SVC_TRANSPORT=local).
+    """
+
+    @observe_call("compl", "local")
+    async def create_compl(self, compl: QCreateCompl) -> ZCompl:
+        """Создает новую жалобу.
+
+        Args:
+            compl (QCreateCompl): Данные для создания жалобы.
+
+        Returns:
+            ZCompl: Созданная жалоба с присвоенным идентификатором и статусом.
+        """
+        async with session_scope(DB_COMPL) as session:
+            return await ComplUseCase(ComplRepo(session)).create_compl(compl)
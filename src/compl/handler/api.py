@@ -3,7 +3,7 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, Body, Query, Path
 
 from kernel.endpoints import Endpoints as Enp
-from kernel.depends import get_compl_repo_session
+from kernel.depends import get_compl_repo_session, get_compl_repo_read_session
 from kernel.response import responses, SuccessResp
 from kernel.security import AJwt
 from kernel.exception import ExpError, ExpCode
@@ -44,7 +44,7 @@ async def create_compl(
 async def get_my_complaint(
     jwt: AJwt,
     compl_id: Annotated[UUID, Path()],
-    __repo_session: Annotated[AsyncSession, Depends(get_compl_repo_session)],
+    __repo_session: Annotated[AsyncSession, Depends(get_compl_repo_read_session)],
 ) -> SuccessResp[ZCompl]:
     """Обрабатывает HTTP-запрос на получение информации по жалобе пользователя."""
     uc = ComplUseCase(ComplRepo(__repo_session))
@@ -76,7 +76,7 @@ async def get_my_complaint(
 )
 async def get_my_complaints(
     jwt: AJwt,
-    __repo_session: Annotated[AsyncSession, Depends(get_compl_repo_session)],
+    __repo_session: Annotated[AsyncSession, Depends(get_compl_repo_read_session)],
     complaints_of: Annotated[Service | None, Query()] = None,
 ) -> SuccessResp[ZManyCompl]:
     """Обрабатывает HTTP-запрос на получение списка жалоб текущего пользователя."""
@@ -110,7 +110,7 @@ async def get_my_complaints(
 async def adm_get_complaints(
     jwt: AJwt,
     qfilter: Annotated[QFilter, Query()],
-    __repo_session: Annotated[AsyncSession, Depends(get_compl_repo_session)],
+    __repo_session: Annotated[AsyncSession, Depends(get_compl_repo_read_session)],
 ) -> SuccessResp[ZManyCompl]:
     """Обрабатывает HTTP-запрос администратора на получение списка жалоб."""
     uc = ComplUseCase(ComplRepo(__repo_session))
@@ -133,7 +133,7 @@ async def adm_get_complaints(
 async def adm_get_complaint(
     jwt: AJwt,
     compl_id: Annotated[UUID, Path()],
-    __repo_session: Annotated[AsyncSession, Depends(get_compl_repo_session)],
+    __repo_session: Annotated[AsyncSession, Depends(get_compl_repo_read_session)],
 ) -> SuccessResp[ZCompl]:
     """Обрабатывает HTTP-запрос администратора на получение жалобы по ID."""
     uc = ComplUseCase(ComplRepo(__repo_session))
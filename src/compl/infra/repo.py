@@ -21,6 +21,13 @@ class ComplRepo(IComplRepo):
     def __init__(self, _session: AsyncSession):
         self.session: AsyncSession = _session
 
+    async def warmup(self) -> None:
+        """Выполняет горячие запросы чтения для прогрева кешей запросов."""
+        try:
+            await self.get_my_complaint(UUID(int=0), UUID(int=0))
+        except KeyError:
+            pass
+
     async def create_compl(self, req: QCreateCompl) -> XCompl:
         """Создаёт новую жалобу в базе данных.
 
@@ -43,7 +50,6 @@ class ComplRepo(IComplRepo):
             .returning(Complaints)
         )
         res = await self.session.execute(req)
-        await self.session.commit()
         row = res.scalar_one()
         return XCompl(
             id=row.id,
@@ -73,7 +79,6 @@ class ComplRepo(IComplRepo):
             Complaints.id == compl_id, Complaints.author_id == acc_id
         )
         res = await self.session.execute(req)
-        await self.session.commit()
         row = res.scalar_one_or_none()
         if not row:
             raise KeyError("Жалоба в бд не найдена")
@@ -110,7 +115,6 @@ class ComplRepo(IComplRepo):
             )
         )
         count_res = await self.session.execute(count_compl_acc)
-        await self.session.commit()
         total_acc = count_res.scalar_one()
 
         count_compl_ads = (
@@ -121,7 +125,6 @@ class ComplRepo(IComplRepo):
             )
         )
         count_res = await self.session.execute(count_compl_ads)
-        await self.session.commit()
         total_ads = count_res.scalar_one()
 
         if complaints_of is Service.ACCOUNT:
@@ -130,7 +133,6 @@ class ComplRepo(IComplRepo):
                 Complaints.author_id == acc_id,
             )
             xres_acc = await self.session.execute(compl_acc_req)
-            await self.session.commit()
             res = []
             for row in xres_acc.scalars().all():
                 res.append(
@@ -152,7 +154,6 @@ class ComplRepo(IComplRepo):
                 Complaints.author_id == acc_id,
             )
             xres_ads = await self.session.execute(compl_ads_req)
-            await self.session.commit()
             res = []
             for row in xres_ads.scalars().all():
                 res.append(
@@ -171,7 +172,6 @@ class ComplRepo(IComplRepo):
         else:
             req = select(Complaints).where(Complaints.author_id == acc_id)
             xres = await self.session.execute(req)
-            await self.session.commit()
             res = []
             for row in xres.scalars().all():
                 res.append(
@@ -202,7 +202,6 @@ class ComplRepo(IComplRepo):
         """
         req = select(Complaints).where(Complaints.id == compl_id)
         res = await self.session.execute(req)
-        await self.session.commit()
         row = res.scalar_one_or_none()
         if not row:
             raise KeyError("Жалоба в бд не найдена")
@@ -233,7 +232,6 @@ class ComplRepo(IComplRepo):
             .where(Complaints.services == Service.ACCOUNT.value)
         )
         count_res = await self.session.execute(count_compl_acc)
-        await self.session.commit()
         total_acc = count_res.scalar_one()
 
         count_compl_ads = (
@@ -242,7 +240,6 @@ class ComplRepo(IComplRepo):
             .where(Complaints.services == Service.ADS.value)
         )
         count_res = await self.session.execute(count_compl_ads)
-        await self.session.commit()
         total_ads = count_res.scalar_one()
 
         req = select(Complaints).limit(qfilter.limit).offset(qfilter.offset)
@@ -263,7 +260,6 @@ class ComplRepo(IComplRepo):
             req = req.where(Complaints.is_resolved == qfilter.is_resolved)
 
         xres = await self.session.execute(req)
-        await self.session.commit()
         res = []
         for row in xres.scalars().all():
             res.append(
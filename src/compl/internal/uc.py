@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from kernel.configs import ComplConfig
+from kernel.container import get_container
 from kernel.exception import ExpCode, ExpError
 
 from ..domain.irepo import IComplRepo
@@ -24,7 +24,7 @@ class ComplUseCase:
     """
 
     def __init__(self, _repo: ComplRepo):
-        self.cfg = ComplConfig()
+        self.cfg = get_container().compl_cfg
         self.repo: IComplRepo = _repo
 
     async def create_compl(self, req: QCreateCompl) -> ZCompl:
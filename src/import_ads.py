@@ -0,0 +1,60 @@
+"""Импорт объявлений из файла NDJSON или CSV.
+
+Файл читается частями и пишется в "Ads" через COPY пачками по
+ADS_IMPORT_CHUNK_SIZE, поэтому размер файла не ограничен памятью. Каждая
+строка — объект с полями account_id, title, description, price и
+необязательным ads_category (selling | buying | providing services); у CSV
+первая строка — заголовок с именами полей. Нужны переменные окружения
+приложения:
+
+    cd src && python import_ads.py ads.ndjson
+    cd src && python import_ads.py ads.csv --format csv --chunk-size 10000
+"""
+
+import argparse
+import asyncio
+import sys
+from typing import AsyncIterator
+
+from ads.domain.dto import QAdsFileFormat
+from ads.internal.importer import AdsImporter
+from kernel.container import init_container
+from kernel.pg import init_pg, close_pg
+
+READ_SIZE = 1 << 16
+
+
+async def read_file(path: str) -> AsyncIterator[bytes]:
+    """Читает файл частями по READ_SIZE байт."""
+    with open(path, "rb") as f:
+        while chunk := f.read(READ_SIZE):
+            yield chunk
+
+
+async def main(args: argparse.Namespace) -> int:
+    """Импортирует файл и печатает отчёт в JSON."""
+    init_container()
+    init_pg()
+    try:
+        importer = AdsImporter(args.chunk_size, args.max_errors)
+        res = await importer.run(read_file(args.path), QAdsFileFormat(args.format))
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+    finally:
+        await close_pg(0)
+    print(res.model_dump_json(indent=2))
+    return 0 if not res.failed else 2
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("path", help="путь к файлу")
+    parser.add_argument(
+        "--format",
+        choices=[fmt.value for fmt in QAdsFileFormat],
+        default=QAdsFileFormat.NDJSON.value,
+    )
+    parser.add_argument("--chunk-size", type=int, help="строк в пачке COPY")
+    parser.add_argument("--max-errors", type=int, help="ошибок строк в отчёте")
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,75 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from pydantic import BaseModel
+
+from .endpoints import Endpoints as Enp
+from .exception import ExpError, ExpCode
+from .metrics import CONTENT_TYPE, render
+from .pg import get_pool_stats
+from .response import responses, SuccessResp
+from .security import ApiKey
+
+router = APIRouter(tags=["sys"])
+tags = {"name": "sys", "description": "Служебные эндпоинты сервиса"}
+
+
+class ZPoolStats(BaseModel):
+    """Состояние пула соединений одной базы данных."""
+
+    pool_size: int
+    max_overflow: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    wait_total_ms: float
+    wait_avg_ms: float
+    wait_max_ms: float
+
+
+class ZPoolsStats(BaseModel):
+    """Состояние всех пулов соединений процесса.
+
+    Attributes:
+        max_connections (int): Максимум соединений, которые может открыть процесс
+            (сумма pool_size + max_overflow по всем пулам). Умноженный на число
+            воркеров, должен укладываться в max_connections Postgres.
+        pools (dict[str, ZPoolStats]): Состояние пулов по имени базы данных.
+    """
+
+    max_connections: int
+    pools: dict[str, ZPoolStats]
+
+
+@router.get(
+    Enp.SYS_POOL_STATS,
+    summary="Состояние пулов соединений с БД",
+    status_code=200,
+    responses=responses(500, 503),
+)
+async def get_pools_stats(apikey: ApiKey) -> SuccessResp[ZPoolsStats]:
+    """Обрабатывает HTTP-запрос на получение статистики пулов соединений."""
+    if not apikey:
+        raise ExpError(ExpCode.SYS_UNAUTHORIZE)
+
+    pools = {name: ZPoolStats(**stats) for name, stats in get_pool_stats().items()}
+    max_connections = sum(p.pool_size + max(p.max_overflow, 0) for p in pools.values())
+    return SuccessResp[ZPoolsStats](
+        payload=ZPoolsStats(max_connections=max_connections, pools=pools)
+    )
+
+
+@router.get(
+    Enp.SYS_METRICS,
+    summary="Метрики процесса в формате Prometheus",
+    status_code=200,
+    response_class=PlainTextResponse,
+)
+async def get_metrics() -> PlainTextResponse:
+    """Обрабатывает HTTP-запрос Prometheus на получение метрик процесса.
+
+    Эндпоинт без авторизации, как принято для scrape; снаружи его нужно
+    закрывать на уровне ingress.
+    """
+    return PlainTextResponse(render(), media_type=CONTENT_TYPE)
@@ -0,0 +1,128 @@
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+from .metrics import Counter, Gauge
+
+CACHES: dict[str, "TTLCache"] = {}
+
+
+class TTLCache:
+    """LRU-кеш процесса с ограничением времени жизни записей.
+
+    При переполнении вытесняется давно не читавшаяся запись, устаревшие
+    записи удаляются при чтении. Кеш у каждого воркера свой, поэтому запись,
+    изменённая в другом процессе, видна после истечения ttl.
+
+    Attributes:
+        name (str): Имя кеша (метка cache в метриках).
+        maxsize (int): Максимальное количество записей.
+        ttl (float): Время жизни записи, сек (0 — кеш отключён).
+    """
+
+    def __init__(self, name: str, maxsize: int, ttl: float):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        CACHES[name] = self
+
+    def configure(self, maxsize: int, ttl: float) -> None:
+        """Меняет размер и время жизни записей, очищая кеш.
+
+        Args:
+            maxsize (int): Максимальное количество записей.
+            ttl (float): Время жизни записи, сек (0 — кеш отключён).
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.data.clear()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Возвращает значение по ключу.
+
+        Args:
+            key (Hashable): Ключ записи.
+
+        Returns:
+            Any | None: Значение или None, если записи нет или она устарела.
+        """
+        item = self.data.get(key)
+        if item is not None and item[0] > time.monotonic():
+            self.data.move_to_end(key)
+            CACHE_REQUESTS.inc(cache=self.name, result="hit")
+            return item[1]
+        if item is not None:
+            del self.data[key]
+        CACHE_REQUESTS.inc(cache=self.name, result="miss")
+        return None
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Сохраняет значение.
+
+        Args:
+            key (Hashable): Ключ записи.
+            value (Any): Значение (не должно изменяться после сохранения).
+        """
+        if self.ttl <= 0:
+            return
+        self.data[key] = (time.monotonic() + self.ttl, value)
+        self.data.move_to_end(key)
+        while len(self.data) > self.maxsize:
+            self.data.popitem(last=False)
+            CACHE_EVICTIONS.inc(cache=self.name)
+
+    def pop(self, key: Hashable) -> None:
+        """Удаляет запись, если она есть.
+
+        Args:
+            key (Hashable): Ключ записи.
+        """
+        self.data.pop(key, None)
+
+    def clear(self) -> None:
+        """Удаляет все записи."""
+        self.data.clear()
+
+
+class Generations:
+    """Счётчики поколений для инвалидации групп записей кеша.
+
+    Поколение группы входит в ключ записи; увеличение поколения делает все
+    записи группы недоступными, не перебирая кеш. Старые записи вытесняются
+    по LRU или ttl.
+    """
+
+    def __init__(self):
+        self.values: dict[Hashable, int] = {}
+
+    def get(self, group: Hashable) -> int:
+        """Возвращает текущее поколение группы."""
+        return self.values.get(group, 0)
+
+    def bump(self, *groups: Hashable) -> None:
+        """Увеличивает поколение групп."""
+        for group in groups:
+            self.values[group] = self.values.get(group, 0) + 1
+
+
+def _cache_size() -> dict[tuple[str, ...], float]:
+    return {(name,): len(cache.data) for name, cache in CACHES.items()}
+
+
+CACHE_REQUESTS = Counter(
+    "cache_requests_total",
+    "Количество чтений кеша процесса",
+    ("cache", "result"),
+)
+CACHE_EVICTIONS = Counter(
+    "cache_evictions_total",
+    "Количество записей, вытесненных из кеша по размеру",
+    ("cache",),
+)
+CACHE_SIZE = Gauge(
+    "cache_entries",
+    "Количество записей в кеше процесса",
+    ("cache",),
+    collect=_cache_size,
+)
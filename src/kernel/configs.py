@@ -1,12 +1,42 @@
+from typing import Literal
+
+from pydantic import Field
 from pydantic_settings import BaseSettings
 
 
+class AppConfig(BaseSettings):
+    """Конфиг процесса приложения."""
+
+    APP_ENV: str
+    SVC_TRANSPORT: Literal["http", "local"] = "http"
+    DB_DRAIN_TIMEOUT: float = 10.0
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 500
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    HTTP_TIMEOUT: float = 10.0
+    HTTP_HTTP2: bool = False
+    COUNTERS_RECONCILE_INTERVAL: float = 60 * 60
+    # Не больше 1000: пачка аккаунтов уходит одним запросом QAccountIds.
+    COUNTERS_RECONCILE_CHUNK_SIZE: int = Field(default=1_000, ge=1, le=1_000)
+    COUNTERS_RECONCILE_PAUSE: float = 0.05
+
+
 class AccountConfig(BaseSettings):
     """Конфиг Account сервиса."""
 
     APP_ENV: str
     API_URL: str
+    ACCOUNT_API_TIMEOUT: float = 5.0
     ACCOUNT_DB_URL: str
+    ACCOUNT_DB_REPLICA_URL: str | None = None
+    ACCOUNT_DB_POOL_SIZE: int = 10
+    ACCOUNT_DB_MAX_OVERFLOW: int = 10
+    ACCOUNT_DB_POOL_TIMEOUT: float = 10.0
+    ACCOUNT_DB_POOL_PRE_PING: bool = True
+    ACCOUNT_DB_POOL_RECYCLE: int = 30 * 60
+    ACCOUNT_DB_ECHO: bool = False
+    ACCOUNT_DB_WARMUP_CONNECTIONS: int = 2
 
 
 class AuthConfig(BaseSettings):
@@ -16,6 +46,13 @@ class AuthConfig(BaseSettings):
     API_URL: str
     API_KEY: str
     AUTH_DB_URL: str
+    AUTH_DB_POOL_SIZE: int = 10
+    AUTH_DB_MAX_OVERFLOW: int = 10
+    AUTH_DB_POOL_TIMEOUT: float = 10.0
+    AUTH_DB_POOL_PRE_PING: bool = True
+    AUTH_DB_POOL_RECYCLE: int = 30 * 60
+    AUTH_DB_ECHO: bool = False
+    AUTH_DB_WARMUP_CONNECTIONS: int = 2
     JWT_PUBLIC_KEY: str
     JWT_PRIVATE_KEY: str
     AUTH_JWT_TOKEN_EXPIRE: int = 60 * 24
@@ -26,7 +63,30 @@ class AdsConfig(BaseSettings):
 
     APP_ENV: str
     API_URL: str
+    ADS_API_TIMEOUT: float = 5.0
     ADS_DB_URL: str
+    ADS_DB_REPLICA_URL: str | None = None
+    ADS_DB_POOL_SIZE: int = 10
+    ADS_DB_MAX_OVERFLOW: int = 10
+    ADS_DB_POOL_TIMEOUT: float = 10.0
+    ADS_DB_POOL_PRE_PING: bool = True
+    ADS_DB_POOL_RECYCLE: int = 30 * 60
+    ADS_DB_ECHO: bool = False
+    ADS_DB_WARMUP_CONNECTIONS: int = 2
+    ADS_DB_EXPORT_URL: str | None = None
+    ADS_DB_EXPORT_POOL_SIZE: int = 2
+    ADS_DB_EXPORT_POOL_TIMEOUT: float = 1.0
+    ADS_EXPORT_CHUNK_SIZE: int = 1_000
+    ADS_VIEWS_FLUSH_INTERVAL: float = 5.0
+    ADS_VIEWS_BUFFER_SIZE: int = 10_000
+    ADS_CACHE_TTL: float = 10.0
+    ADS_CACHE_SIZE: int = 10_000
+    ADS_CACHE_PAGES_SIZE: int = 1_000
+    ADS_SUGGEST_CACHE_TTL: float = 60.0
+    ADS_SUGGEST_CACHE_SIZE: int = 5_000
+    ADS_SUGGEST_CACHE_PREFIX_LEN: int = 3
+    ADS_IMPORT_CHUNK_SIZE: int = 5_000
+    ADS_IMPORT_MAX_ERRORS: int = 100
 
 
 class ComplConfig(BaseSettings):
@@ -34,7 +94,16 @@ class ComplConfig(BaseSettings):
 
     APP_ENV: str
     API_URL: str
+    COMPL_API_TIMEOUT: float = 5.0
     COMPL_DB_URL: str
+    COMPL_DB_REPLICA_URL: str | None = None
+    COMPL_DB_POOL_SIZE: int = 10
+    COMPL_DB_MAX_OVERFLOW: int = 10
+    COMPL_DB_POOL_TIMEOUT: float = 10.0
+    COMPL_DB_POOL_PRE_PING: bool = True
+    COMPL_DB_POOL_RECYCLE: int = 30 * 60
+    COMPL_DB_ECHO: bool = False
+    COMPL_DB_WARMUP_CONNECTIONS: int = 2
 
 
 class TgConfig(BaseSettings):
@@ -42,3 +111,5 @@ class TgConfig(BaseSettings):
 
     TGBOT_TOKEN: str
     TGBOT_CHATID: str
+    TGBOT_TIMEOUT: float = 10.0
+    TGBOT_API_URL: str = "https://api.telegram.org"
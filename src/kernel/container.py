@@ -0,0 +1,151 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from .configs import (
+    AppConfig,
+    AccountConfig,
+    AuthConfig,
+    AdsConfig,
+    ComplConfig,
+    TgConfig,
+)
+from .http import get_http_client
+
+if TYPE_CHECKING:
+    from account.external.svc import AccService, AccLocalService
+    from ads.external.svc import AdsService, AdsLocalService
+    from compl.external.svc import ComplService, ComplLocalService
+    from notice.external.tg.client import TgClient
+
+# pylint: disable=import-outside-toplevel
+# Клиенты сервисов импортируются внутри провайдеров: модули external.svc
+# импортируют use case, которые сами обращаются к контейнеру.
+
+
+class Container:
+    """Контейнер зависимостей процесса.
+
+    Конфиги и клиенты сервисов создаются один раз при первом обращении и живут
+    до остановки приложения. Эндпоинты, которым клиент не нужен, его не создают.
+    """
+
+    @cached_property
+    def app_cfg(self) -> AppConfig:
+        """Конфиг процесса приложения."""
+        return AppConfig()
+
+    @cached_property
+    def acc_cfg(self) -> AccountConfig:
+        """Конфиг Account сервиса."""
+        return AccountConfig()
+
+    @cached_property
+    def auth_cfg(self) -> AuthConfig:
+        """Конфиг Auth сервиса."""
+        return AuthConfig()
+
+    @cached_property
+    def ads_cfg(self) -> AdsConfig:
+        """Конфиг Ads сервиса."""
+        return AdsConfig()
+
+    @cached_property
+    def compl_cfg(self) -> ComplConfig:
+        """Конфиг Compl сервиса."""
+        return ComplConfig()
+
+    @cached_property
+    def tg_cfg(self) -> TgConfig:
+        """Конфиг Telegram бота."""
+        return TgConfig()
+
+    @property
+    def is_local_transport(self) -> bool:
+        """Вызываются ли сервисы внутри процесса (SVC_TRANSPORT=local)."""
+        return self.app_cfg.SVC_TRANSPORT == "local"
+
+    @cached_property
+    def acc_svc(self) -> "AccService | AccLocalService":
+        """Сервис аккаунтов: HTTP-клиент или вызов AccUseCase внутри процесса."""
+        from account.external.svc import AccService, AccLocalService
+
+        if self.is_local_transport:
+            return AccLocalService()
+        return AccService(
+            self.acc_cfg.API_URL, get_http_client(), self.acc_cfg.ACCOUNT_API_TIMEOUT
+        )
+
+    @cached_property
+    def ads_svc(self) -> "AdsService | AdsLocalService":
+        """Сервис объявлений: HTTP-клиент или вызов AdsUseCase внутри процесса."""
+        from ads.external.svc import AdsService, AdsLocalService
+
+        if self.is_local_transport:
+            return AdsLocalService()
+        return AdsService(
+            self.ads_cfg.API_URL, get_http_client(), self.ads_cfg.ADS_API_TIMEOUT
+        )
+
+    @cached_property
+    def compl_svc(self) -> "ComplService | ComplLocalService":
+        """Сервис жалоб: HTTP-клиент или вызов ComplUseCase внутри процесса."""
+        from compl.external.svc import ComplService, ComplLocalService
+
+        if self.is_local_transport:
+            return ComplLocalService()
+        return ComplService(
+            self.compl_cfg.API_URL, get_http_client(), self.compl_cfg.COMPL_API_TIMEOUT
+        )
+
+    @cached_property
+    def tg_bot(self) -> "TgClient":
+        """Клиент Telegram бота."""
+        from notice.external.tg.client import TgClient
+
+        return TgClient(
+            self.tg_cfg.TGBOT_TOKEN,
+            self.tg_cfg.TGBOT_CHATID,
+            get_http_client(),
+            self.tg_cfg.TGBOT_TIMEOUT,
+            self.tg_cfg.TGBOT_API_URL,
+        )
+
+
+CONTAINERS: dict[str, Container] = {}
+CONTAINER_DEFAULT = "default"
+
+
+def init_container() -> Container:
+    """Создаёт контейнер зависимостей процесса.
+
+    Вызывается из lifespan приложения первым, до init_pg() и init_http():
+    они читают конфиги из контейнера. HTTP-клиент провайдеры берут при первом
+    обращении, когда init_http() уже выполнен.
+
+    Returns:
+        Container: Контейнер зависимостей.
+    """
+    CONTAINERS[CONTAINER_DEFAULT] = Container()
+    return CONTAINERS[CONTAINER_DEFAULT]
+
+
+def get_container() -> Container:
+    """Возвращает контейнер зависимостей процесса.
+
+    Returns:
+        Container: Контейнер зависимостей.
+
+    Raises:
+        RuntimeError: Если контейнер ещё не создан (lifespan не запущен).
+    """
+    try:
+        return CONTAINERS[CONTAINER_DEFAULT]
+    except KeyError as e:
+        raise RuntimeError(
+            "Контейнер не инициализирован, вызовите init_container()"
+        ) from e
+
+
+def close_container() -> None:
+    """Удаляет контейнер зависимостей процесса."""
+    CONTAINERS.clear()
@@ -0,0 +1,38 @@
+import base64
+
+import orjson
+
+
+def encode_cursor(payload: dict) -> str:
+    """Кодирует позицию keyset-пагинации в непрозрачный курсор.
+
+    Args:
+        payload (dict): Сортировка и значения ключа последней записи страницы.
+            Значения должны сериализоваться в JSON.
+
+    Returns:
+        str: Курсор в base64url без выравнивания.
+    """
+    return base64.urlsafe_b64encode(orjson.dumps(payload)).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> dict:
+    """Декодирует курсор keyset-пагинации.
+
+    Args:
+        cursor (str): Курсор, полученный из encode_cursor.
+
+    Returns:
+        dict: Позиция последней записи предыдущей страницы.
+
+    Raises:
+        ValueError: Если курсор повреждён.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = orjson.loads(raw)
+    except ValueError as e:
+        raise ValueError("Неверный курсор") from e
+    if not isinstance(payload, dict):
+        raise ValueError("Неверный курсор")
+    return payload
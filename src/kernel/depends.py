@@ -1,15 +1,22 @@
-from account.external.svc import AccService
-from ads.external.svc import AdsService
-from compl.external.svc import ComplService
+from typing import Annotated
+
+from fastapi import Header
+
+from account.external.svc import AccService, AccLocalService
+from ads.external.svc import AdsService, AdsLocalService
+from compl.external.svc import ComplService, ComplLocalService
 from notice.external.tg.client import TgClient
 
-from .pg import (
-    AsyncAccRepoSession,
-    AsyncAdsRepoSession,
-    AsyncAuthRepoSession,
-    AsyncComplRepoSession,
-)
-from .configs import AccountConfig, AdsConfig, ComplConfig, TgConfig
+from .container import get_container
+from .pg import DB_ACC, DB_ADS, DB_AUTH, DB_COMPL, session_scope
+
+ReadPrimary = Annotated[
+    bool,
+    Header(
+        alias="X-Read-Primary",
+        description="Читать с основной БД, а не с реплики (read-your-writes)",
+    ),
+]
 
 
 async def get_account_repo_session():
@@ -18,7 +25,7 @@ async def get_account_repo_session():
     Yields:
         AsyncSession: Асинхронная сессия для работы с аккаунтами.
     """
-    async with AsyncAccRepoSession() as session:
+    async with session_scope(DB_ACC) as session:
         yield session
 
 
@@ -28,7 +35,7 @@ async def get_auth_repo_session():
     Yields:
         AsyncSession: Асинхронная сессия для работы с аутентификацией.
     """
-    async with AsyncAuthRepoSession() as session:
+    async with session_scope(DB_AUTH) as session:
         yield session
 
 
@@ -38,7 +45,7 @@ async def get_ads_repo_session():
     Yields:
         AsyncSession: Асинхронная сессия для работы с объявлениями.
     """
-    async with AsyncAdsRepoSession() as session:
+    async with session_scope(DB_ADS) as session:
         yield session
 
 
@@ -48,45 +55,98 @@ async def get_compl_repo_session():
     Yields:
         AsyncSession: Асинхронная сессия для работы с жалобами.
     """
-    async with AsyncComplRepoSession() as session:
+    async with session_scope(DB_COMPL) as session:
+        yield session
+
+
+async def get_ads_repo_read_session(read_primary: ReadPrimary = False):
+    """Получает сессию репозитория объявлений только для чтения.
+
+    Используется эндпоинтами, которые ничего не пишут в БД. Запросы идут на
+    реплику, если она настроена, кроме запросов с заголовком X-Read-Primary.
+
+    Args:
+        read_primary (bool): Читать с основной БД (read-your-writes).
+
+    Yields:
+        AsyncSession: Асинхронная сессия с транзакцией только для чтения.
+    """
+    async with session_scope(
+        DB_ADS, readonly=True, replica=not read_primary
+    ) as session:
+        yield session
+
+
+async def get_account_repo_read_session(read_primary: ReadPrimary = False):
+    """Получает сессию репозитория аккаунтов только для чтения.
+
+    Используется эндпоинтами, которые ничего не пишут в БД. Запросы идут на
+    реплику, если она настроена, кроме запросов с заголовком X-Read-Primary.
+
+    Args:
+        read_primary (bool): Читать с основной БД (read-your-writes).
+
+    Yields:
+        AsyncSession: Асинхронная сессия с транзакцией только для чтения.
+    """
+    async with session_scope(
+        DB_ACC, readonly=True, replica=not read_primary
+    ) as session:
+        yield session
+
+
+async def get_compl_repo_read_session(read_primary: ReadPrimary = False):
+    """Получает сессию репозитория жалоб только для чтения.
+
+    Используется эндпоинтами, которые ничего не пишут в БД. Запросы идут на
+    реплику, если она настроена, кроме запросов с заголовком X-Read-Primary.
+
+    Args:
+        read_primary (bool): Читать с основной БД (read-your-writes).
+
+    Yields:
+        AsyncSession: Асинхронная сессия с транзакцией только для чтения.
+    """
+    async with session_scope(
+        DB_COMPL, readonly=True, replica=not read_primary
+    ) as session:
         yield session
 
 
-def get_account_serivce() -> AccService:
-    """Создаёт и возвращает сервис для работы с аккаунтами.
+def get_account_serivce() -> AccService | AccLocalService:
+    """Возвращает сервис для работы с аккаунтами.
 
     Returns:
-        AccService: Сервис для взаимодействия с аккаунтами.
+        AccService | AccLocalService: Сервис для взаимодействия с аккаунтами,
+            HTTP-клиент или вызов AccUseCase внутри процесса.
     """
-    cfg = AccountConfig()
-    return AccService(cfg.API_URL)
+    return get_container().acc_svc
 
 
-def get_ads_serivce() -> AdsService:
-    """Создаёт и возвращает сервис для работы с объявлениями.
+def get_ads_serivce() -> AdsService | AdsLocalService:
+    """Возвращает сервис для работы с объявлениями.
 
     Returns:
-        AdsService: Сервис для взаимодействия с объявлениями.
+        AdsService | AdsLocalService: Сервис для взаимодействия с объявлениями,
+            HTTP-клиент или вызов AdsUseCase внутри процесса.
     """
-    cfg = AdsConfig()
-    return AdsService(cfg.API_URL)
+    return get_container().ads_svc
 
 
-def get_compl_serivce() -> ComplService:
-    """Создаёт и возвращает сервис для работы с жалобами.
+def get_compl_serivce() -> ComplService | ComplLocalService:
+    """Возвращает сервис для работы с жалобами.
 
     Returns:
-        ComplService: Сервис для взаимодействия с жалобами.
+        ComplService | ComplLocalService: Сервис для взаимодействия с жалобами,
+            HTTP-клиент или вызов ComplUseCase внутри процесса.
     """
-    cfg = ComplConfig()
-    return ComplService(cfg.API_URL)
+    return get_container().compl_svc
 
 
 def get_tg_bot() -> TgClient:
-    """Создаёт и возвращает клиент Telegram бота.
+    """Возвращает клиент Telegram бота.
 
     Returns:
         TgClient: Клиент для взаимодействия с Telegram ботом.
     """
-    cfg = TgConfig()
-    return TgClient(cfg.TGBOT_TOKEN, cfg.TGBOT_CHATID)
+    return get_container().tg_bot
@@ -32,14 +32,18 @@ class _EndpointsADS:
 
     # --- Действия с объявлениями
     ADS_CREATE = "/api/ads/create"
+    ADS_CREATE_BULK = "/api/ads/create/bulk"
     ADS_CHANGE = "/api/ads/{ads_id}/change"
     ADS_CHANGE_CATEGORY = "/api/ads/{ads_id}/change/category"
     ADS_DELETE = "/api/ads/delete/{ads_id}"
     ADS_GET_ALL = "/api/ads"
+    ADS_SEARCH = "/api/ads/search"
+    ADS_SUGGEST = "/api/ads/suggest"
     ADS_GET_BY_ME = "/api/ads/me"
     ADS_GET_BY_ID = "/api/ads/ads"
     ADS_GET_BY_ACCOUNT = "/api/ads/author"
     ADS_GET_COUNT_ADS_BY_ACCOUNT = "/api/ads/count/author"
+    ADS_GET_COUNT_ADS_BY_ACCOUNTS = "/api/ads/count/authors"
     ADS_SEND_COMPLAINT = "/api/ads/{ads_id}/complaint"
 
     # --- Действия с комментариями
@@ -67,6 +71,8 @@ class _EndpointsADM:
     # --- ADS
     ADM_DELETE_ADS = "/api/adm/delete/ads/{ads_id}"
     ADM_DELETE_COMMENTARY = "/api/adm/delete/commentary/{comm_id}"
+    ADM_IMPORT_ADS = "/api/adm/import/ads"
+    ADM_EXPORT_ADS = "/api/adm/export/ads"
 
     # --- Account
     ADM_SET_ROLE_ACCOUNT = "/api/adm/account/{acc_id}/set/role"
@@ -78,7 +84,15 @@ class _EndpointsADM:
     ADM_GET_COMPLAINT_BY_ID = "/api/adm/complaint/{compl_id}"
 
 
+class _EndpointsSYS:
+    """Служебные эндпоинты."""
+
+    SYS_POOL_STATS = "/api/sys/pool"
+    SYS_METRICS = "/api/sys/metrics"
+
+
 class Endpoints(
+    _EndpointsSYS,
     _EndpointsAUTH,
     _EndpointsACCOUNT,
     _EndpointsADS,
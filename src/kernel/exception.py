@@ -42,6 +42,9 @@ class _AdsExpCode:
     """Класс с кодами ошибок объявлений и их описаниями."""
 
     ADS_FILTER_ERR = "400", "Неверный фильтр записей"
+    ADS_INVALID_CURSOR = "400", "Неверный курсор пагинации"
+    ADS_INVALID_IMPORT_FILE = "400", "Неверный файл импорта"
+    ADS_EXPORT_BUSY = "503", "Все выгрузки заняты, повторите позже"
     ADS_NOT_FOUND = "404", "Объявление не найдено"
     ADS_COMMENTARY_NOT_FOUND = "404", "Комментарий не найден"
     ADS_INCORRECT_ROLE = "400", "Нет прав доступа"
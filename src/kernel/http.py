@@ -0,0 +1,63 @@
+import importlib.util
+
+import httpx
+
+CLIENTS: dict[str, httpx.AsyncClient] = {}
+HTTP_DEFAULT = "default"
+
+
+def init_http() -> httpx.AsyncClient:
+    """Создаёт общий HTTP-клиент процесса с keep-alive пулом соединений.
+
+    HTTP/2 включается только при установленном пакете h2, иначе клиент
+    остаётся на HTTP/1.1. Вызывается из lifespan приложения после
+    init_container().
+
+    Returns:
+        httpx.AsyncClient: Общий HTTP-клиент.
+    """
+    # Контейнер сам импортирует этот модуль, поэтому импорт здесь, а не в
+    # начале модуля.
+    from .container import get_container  # pylint: disable=import-outside-toplevel
+
+    cfg = get_container().app_cfg
+
+    http2 = cfg.HTTP_HTTP2
+    if http2 and importlib.util.find_spec("h2") is None:
+        print("HTTP_HTTP2 включён, но пакет h2 не установлен: используется HTTP/1.1")
+        http2 = False
+
+    CLIENTS[HTTP_DEFAULT] = httpx.AsyncClient(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=cfg.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=cfg.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=cfg.HTTP_KEEPALIVE_EXPIRY,
+        ),
+        timeout=cfg.HTTP_TIMEOUT,
+    )
+    return CLIENTS[HTTP_DEFAULT]
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Возвращает общий HTTP-клиент процесса.
+
+    Returns:
+        httpx.AsyncClient: Общий HTTP-клиент.
+
+    Raises:
+        RuntimeError: Если клиент ещё не создан (lifespan не запущен).
+    """
+    try:
+        return CLIENTS[HTTP_DEFAULT]
+    except KeyError as e:
+        raise RuntimeError(
+            "HTTP-клиент не инициализирован, вызовите init_http()"
+        ) from e
+
+
+async def close_http() -> None:
+    """Закрывает общий HTTP-клиент и его соединения."""
+    for client in CLIENTS.values():
+        await client.aclose()
+    CLIENTS.clear()
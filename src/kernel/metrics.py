@@ -0,0 +1,324 @@
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from functools import wraps
+from typing import Callable, Iterator
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from .exception import ExpError
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DB_LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5, 1.0)
+STATEMENT_BUCKETS = (0, 1, 2, 3, 4, 5, 8, 10, 15, 20, 30, 50)
+
+REGISTRY: dict[str, "_Metric"] = {}
+
+# Счётчики обращений к БД текущего HTTP-запроса: {"statements": int, "seconds": float}.
+# Сессии и обработчики событий движка выполняются в контексте запроса, поэтому
+# изменения словаря видны middleware.
+REQUEST_DB: ContextVar[dict | None] = ContextVar("request_db", default=None)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    """Метрика процесса в формате Prometheus.
+
+    Значения хранятся по кортежу значений меток. Метрика регистрируется в
+    REGISTRY при создании и отдаётся эндпоинтом /api/sys/metrics. При запуске
+    нескольких воркеров у каждого процесса свои значения.
+
+    Attributes:
+        name (str): Имя метрики.
+        doc (str): Описание для строки # HELP.
+        labelnames (tuple[str, ...]): Имена меток.
+        collect (Callable | None): Функция, считывающая значения при каждом
+            запросе метрик (например, состояние пулов), вместо inc/set.
+    """
+
+    kind = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        doc: str,
+        labelnames: tuple[str, ...] = (),
+        collect: Callable[[], dict[tuple[str, ...], float]] | None = None,
+    ):
+        self.name = name
+        self.doc = doc
+        self.labelnames = labelnames
+        self.collect = collect
+        self.values: dict[tuple[str, ...], float] = {}
+        REGISTRY[name] = self
+
+    def _key(self, labels: dict) -> tuple[str, ...]:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> Iterator[str]:
+        """Возвращает строки значений метрики."""
+        if self.collect is not None:
+            self.values = self.collect()
+        for key, value in self.values.items():
+            yield f"{self.name}{_labels(self.labelnames, key)} {value}"
+
+    def render(self) -> str:
+        """Возвращает метрику в текстовом формате Prometheus."""
+        lines = [f"# HELP {self.name} {self.doc}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self.samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """Монотонно растущий счётчик."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        """Увеличивает счётчик.
+
+        Args:
+            amount (float): Величина увеличения.
+            **labels: Значения меток.
+        """
+        key = self._key(labels)
+        self.values[key] = self.values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    """Текущее значение величины."""
+
+    kind = "gauge"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        """Увеличивает значение."""
+        key = self._key(labels)
+        self.values[key] = self.values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        """Уменьшает значение."""
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels) -> None:
+        """Устанавливает значение."""
+        self.values[self._key(labels)] = value
+
+
+class Histogram(_Metric):
+    """Гистограмма распределения значений по корзинам.
+
+    Attributes:
+        buckets (tuple[float, ...]): Верхние границы корзин по возрастанию.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        doc: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, doc, labelnames)
+        self.buckets = buckets
+        # key -> [счётчики корзин..., +Inf, сумма]
+        self.series: dict[tuple[str, ...], list[float]] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        """Добавляет наблюдение.
+
+        Args:
+            value (float): Наблюдаемое значение.
+            **labels: Значения меток.
+        """
+        key = self._key(labels)
+        series = self.series.get(key)
+        if series is None:
+            series = self.series[key] = [0] * (len(self.buckets) + 2)
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def samples(self) -> Iterator[str]:
+        for key, series in self.series.items():
+            total = 0
+            for bound, count in zip((*self.buckets, "+Inf"), series):
+                total += count
+                le = _labels(self.labelnames, key, f'le="{bound}"')
+                yield f"{self.name}_bucket{le} {total}"
+            labels = _labels(self.labelnames, key)
+            yield f"{self.name}_sum{labels} {series[-1]}"
+            yield f"{self.name}_count{labels} {total}"
+
+
+def render() -> str:
+    """Возвращает все метрики процесса в текстовом формате Prometheus.
+
+    Returns:
+        str: Тело ответа для Prometheus.
+    """
+    return "\n".join(metric.render() for metric in REGISTRY.values()) + "\n"
+
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "Количество HTTP-запросов",
+    ("method", "route", "status"),
+)
+HTTP_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Время обработки HTTP-запроса",
+    ("method", "route"),
+)
+HTTP_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "Количество HTTP-запросов в обработке",
+    ("method",),
+)
+HTTP_DB_STATEMENTS = Histogram(
+    "http_request_db_statements",
+    "Количество SQL-запросов на HTTP-запрос",
+    ("method", "route"),
+    STATEMENT_BUCKETS,
+)
+HTTP_DB_SECONDS = Histogram(
+    "http_request_db_seconds",
+    "Время выполнения SQL-запросов на HTTP-запрос",
+    ("method", "route"),
+)
+DB_QUERY_SECONDS = Histogram(
+    "db_query_duration_seconds",
+    "Время выполнения SQL-запроса",
+    ("db",),
+    DB_LATENCY_BUCKETS,
+)
+DB_POOL_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Время ожидания соединения из пула",
+    ("db",),
+    DB_LATENCY_BUCKETS,
+)
+OUTBOUND_LATENCY = Histogram(
+    "outbound_call_duration_seconds",
+    "Время вызова внешнего сервиса",
+    ("target", "transport", "call", "outcome"),
+)
+
+
+class MetricsMiddleware:
+    """ASGI middleware, собирающее метрики HTTP-запросов.
+
+    Маршрут берётся из шаблона пути (Endpoints) после маршрутизации, поэтому
+    идентификаторы в пути не раздувают количество рядов. Запросы на
+    несуществующие пути попадают в route="unmatched".
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+        stats = {"statements": 0, "seconds": 0.0}
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        token = REQUEST_DB.set(stats)
+        HTTP_IN_PROGRESS.inc(method=method)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            HTTP_IN_PROGRESS.dec(method=method)
+            REQUEST_DB.reset(token)
+
+            route = getattr(scope.get("route"), "path", "unmatched")
+            HTTP_REQUESTS.inc(method=method, route=route, status=status)
+            HTTP_LATENCY.observe(elapsed, method=method, route=route)
+            HTTP_DB_STATEMENTS.observe(stats["statements"], method=method, route=route)
+            HTTP_DB_SECONDS.observe(stats["seconds"], method=method, route=route)
+
+
+def instrument_engine(name: str, engine: AsyncEngine) -> None:
+    """Подписывается на события движка и учитывает время SQL-запросов.
+
+    Время каждого запроса попадает в db_query_duration_seconds, а также в
+    счётчики текущего HTTP-запроса (REQUEST_DB).
+
+    Args:
+        name (str): Имя базы данных (метка db).
+        engine (AsyncEngine): Движок базы данных.
+    """
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _before(conn, *_):
+        conn.info["query_start"] = time.perf_counter()
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def _after(conn, *_):
+        elapsed = time.perf_counter() - conn.info.pop("query_start")
+        DB_QUERY_SECONDS.observe(elapsed, db=name)
+        stats = REQUEST_DB.get()
+        if stats is not None:
+            stats["statements"] += 1
+            stats["seconds"] += elapsed
+
+
+def observe_call(target: str, transport: str):
+    """Декоратор, замеряющий время вызова метода клиента внешнего сервиса.
+
+    Исход вызова: ok, exp_error (сервис вернул бизнес-ошибку) или error.
+
+    Args:
+        target (str): Вызываемый сервис (account | ads | compl | tg).
+        transport (str): Транспорт вызова (http | local).
+
+    Returns:
+        Callable: Декоратор асинхронного метода.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            outcome = "error"
+            start = time.perf_counter()
+            try:
+                res = await func(*args, **kwargs)
+                outcome = "ok"
+                return res
+            except ExpError:
+                outcome = "exp_error"
+                raise
+            finally:
+                OUTBOUND_LATENCY.observe(
+                    time.perf_counter() - start,
+                    target=target,
+                    transport=transport,
+                    call=func.__name__,
+                    outcome=outcome,
+                )
+
+        return wrapper
+
+    return decorator
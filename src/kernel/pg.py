@@ -1,32 +1,465 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import (
+    create_async_engine,
+    AsyncConnection,
+    AsyncEngine,
+    AsyncSession,
+)
 from sqlalchemy.orm import sessionmaker
-from .configs import AdsConfig, AccountConfig, AuthConfig, ComplConfig
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 
-AUTH_URL = AuthConfig().AUTH_DB_URL
-ACC_URL = AccountConfig().ACCOUNT_DB_URL
-ADS_URL = AdsConfig().ADS_DB_URL
-COMPL_URL = ComplConfig().COMPL_DB_URL
+from .container import get_container
+from .exception import ExpError
+from .metrics import DB_POOL_WAIT, Counter, Gauge, instrument_engine
 
-AsyncAuthRepoSession = sessionmaker(
-    bind=create_async_engine(AUTH_URL, echo=True),
-    expire_on_commit=False,
-    class_=AsyncSession,
-)
+DB_AUTH = "auth"
+DB_ACC = "acc"
+DB_ADS = "ads"
+DB_COMPL = "compl"
+# Отдельный пул для потоковой выгрузки объявлений.
+DB_ADS_EXPORT = "ads_export"
+REPLICA_SUFFIX = "_replica"
 
-AsyncAccRepoSession = sessionmaker(
-    bind=create_async_engine(ACC_URL, echo=True),
-    expire_on_commit=False,
-    class_=AsyncSession,
-)
 
-AsyncAdsRepoSession = sessionmaker(
-    bind=create_async_engine(ADS_URL, echo=True),
-    expire_on_commit=False,
-    class_=AsyncSession,
-)
+def replica_of(name: str) -> str:
+    """Возвращает имя движка реплики для базы данных.
+
+    Args:
+        name (str): Имя базы данных (DB_ACC | DB_ADS | DB_COMPL).
+
+    Returns:
+        str: Имя движка реплики.
+    """
+    return name + REPLICA_SUFFIX
+
+
+class StatsQueuePool(AsyncAdaptedQueuePool):
+    """Асинхронный пул соединений с учётом времени ожидания выдачи соединения.
+
+    Время ожидания также попадает в метрику db_pool_checkout_wait_seconds с
+    меткой db, равной logging_name пула (имени движка).
+
+    Attributes:
+        checkouts (int): Количество выданных соединений.
+        timeouts (int): Количество выдач, завершившихся таймаутом пула.
+        wait_total (float): Суммарное время ожидания выдачи, сек.
+        wait_max (float): Максимальное время ожидания выдачи, сек.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def connect(self) -> PoolProxiedConnection:
+        """Выдаёт соединение из пула, замеряя время ожидания.
+
+        Returns:
+            PoolProxiedConnection: Соединение из пула.
+
+        Raises:
+            TimeoutError: Если соединение не освободилось за pool_timeout.
+        """
+        start = time.perf_counter()
+        try:
+            conn = super().connect()
+        except PoolTimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            self.wait_total += elapsed
+            self.wait_max = max(self.wait_max, elapsed)
+            DB_POOL_WAIT.observe(elapsed, db=self.logging_name)
+        self.checkouts += 1
+        return conn
+
+
+def create_pg_engine(
+    name: str,
+    url: str,
+    pool_size: int,
+    max_overflow: int,
+    pool_timeout: float,
+    pre_ping: bool,
+    recycle: int,
+    echo: bool,
+    prepared_statement_cache_size: int = 500,
+) -> AsyncEngine:
+    """Создаёт асинхронный движок БД с настроенным пулом соединений.
+
+    Args:
+        name (str): Имя движка (DB_AUTH | DB_ACC | DB_ADS | DB_COMPL или имя
+            реплики), используется как метка db в метриках.
+        url (str): URL подключения к базе данных.
+        pool_size (int): Количество постоянно удерживаемых соединений.
+        max_overflow (int): Количество соединений сверх pool_size.
+        pool_timeout (float): Время ожидания свободного соединения, сек.
+        pre_ping (bool): Проверять соединение перед выдачей из пула.
+        recycle (int): Время жизни соединения, сек (-1 — без ограничения).
+        echo (bool): Логировать SQL-запросы.
+        prepared_statement_cache_size (int): Размер кеша подготовленных выражений
+            asyncpg на соединение (0 — отключить, нужно за pgbouncer в режиме
+            transaction).
+
+    Returns:
+        AsyncEngine: Асинхронный движок SQLAlchemy.
+    """
+    return create_async_engine(
+        url,
+        poolclass=StatsQueuePool,
+        pool_logging_name=name,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
+        pool_pre_ping=pre_ping,
+        pool_recycle=recycle,
+        echo=echo,
+        connect_args={"prepared_statement_cache_size": prepared_statement_cache_size},
+    )
+
+
+ENGINES: dict[str, AsyncEngine] = {}
+SESSIONS: dict[str, sessionmaker] = {}
+WARMUP_CONNECTIONS: dict[str, int] = {}
+
+
+def init_pg() -> None:
+    """Создаёт движки и фабрики сессий всех баз данных.
+
+    Для баз с заданным <DB>_DB_REPLICA_URL дополнительно создаётся движок реплики
+    с теми же настройками пула. Для выгрузки объявлений создаётся отдельный
+    движок DB_ADS_EXPORT. Вызывается из lifespan приложения после
+    init_container(), а не при импорте модуля.
+    """
+    container = get_container()
+    app_cfg = container.app_cfg
+    auth_cfg = container.auth_cfg
+    acc_cfg = container.acc_cfg
+    ads_cfg = container.ads_cfg
+    compl_cfg = container.compl_cfg
+
+    ENGINES[DB_AUTH] = create_pg_engine(
+        DB_AUTH,
+        auth_cfg.AUTH_DB_URL,
+        pool_size=auth_cfg.AUTH_DB_POOL_SIZE,
+        max_overflow=auth_cfg.AUTH_DB_MAX_OVERFLOW,
+        pool_timeout=auth_cfg.AUTH_DB_POOL_TIMEOUT,
+        pre_ping=auth_cfg.AUTH_DB_POOL_PRE_PING,
+        recycle=auth_cfg.AUTH_DB_POOL_RECYCLE,
+        echo=auth_cfg.AUTH_DB_ECHO,
+        prepared_statement_cache_size=app_cfg.DB_PREPARED_STATEMENT_CACHE_SIZE,
+    )
+    WARMUP_CONNECTIONS[DB_AUTH] = auth_cfg.AUTH_DB_WARMUP_CONNECTIONS
+
+    ENGINES[DB_ACC] = create_pg_engine(
+        DB_ACC,
+        acc_cfg.ACCOUNT_DB_URL,
+        pool_size=acc_cfg.ACCOUNT_DB_POOL_SIZE,
+        max_overflow=acc_cfg.ACCOUNT_DB_MAX_OVERFLOW,
+        pool_timeout=acc_cfg.ACCOUNT_DB_POOL_TIMEOUT,
+        pre_ping=acc_cfg.ACCOUNT_DB_POOL_PRE_PING,
+        recycle=acc_cfg.ACCOUNT_DB_POOL_RECYCLE,
+        echo=acc_cfg.ACCOUNT_DB_ECHO,
+        prepared_statement_cache_size=app_cfg.DB_PREPARED_STATEMENT_CACHE_SIZE,
+    )
+    WARMUP_CONNECTIONS[DB_ACC] = acc_cfg.ACCOUNT_DB_WARMUP_CONNECTIONS
+    if acc_cfg.ACCOUNT_DB_REPLICA_URL:
+        ENGINES[replica_of(DB_ACC)] = create_pg_engine(
+            replica_of(DB_ACC),
+            acc_cfg.ACCOUNT_DB_REPLICA_URL,
+            pool_size=acc_cfg.ACCOUNT_DB_POOL_SIZE,
+            max_overflow=acc_cfg.ACCOUNT_DB_MAX_OVERFLOW,
+            pool_timeout=acc_cfg.ACCOUNT_DB_POOL_TIMEOUT,
+            pre_ping=acc_cfg.ACCOUNT_DB_POOL_PRE_PING,
+            recycle=acc_cfg.ACCOUNT_DB_POOL_RECYCLE,
+            echo=acc_cfg.ACCOUNT_DB_ECHO,
+            prepared_statement_cache_size=app_cfg.DB_PREPARED_STATEMENT_CACHE_SIZE,
+        )
+        WARMUP_CONNECTIONS[replica_of(DB_ACC)] = acc_cfg.ACCOUNT_DB_WARMUP_CONNECTIONS
+
+    ENGINES[DB_ADS] = create_pg_engine(
+        DB_ADS,
+        ads_cfg.ADS_DB_URL,
+        pool_size=ads_cfg.ADS_DB_POOL_SIZE,
+        max_overflow=ads_cfg.ADS_DB_MAX_OVERFLOW,
+        pool_timeout=ads_cfg.ADS_DB_POOL_TIMEOUT,
+        pre_ping=ads_cfg.ADS_DB_POOL_PRE_PING,
+        recycle=ads_cfg.ADS_DB_POOL_RECYCLE,
+        echo=ads_cfg.ADS_DB_ECHO,
+        prepared_statement_cache_size=app_cfg.DB_PREPARED_STATEMENT_CACHE_SIZE,
+    )
+    WARMUP_CONNECTIONS[DB_ADS] = ads_cfg.ADS_DB_WARMUP_CONNECTIONS
+    if ads_cfg.ADS_DB_REPLICA_URL:
+        ENGINES[replica_of(DB_ADS)] = create_pg_engine(
+            replica_of(DB_ADS),
+            ads_cfg.ADS_DB_REPLICA_URL,
+            pool_size=ads_cfg.ADS_DB_POOL_SIZE,
+            max_overflow=ads_cfg.ADS_DB_MAX_OVERFLOW,
+            pool_timeout=ads_cfg.ADS_DB_POOL_TIMEOUT,
+            pre_ping=ads_cfg.ADS_DB_POOL_PRE_PING,
+            recycle=ads_cfg.ADS_DB_POOL_RECYCLE,
+            echo=ads_cfg.ADS_DB_ECHO,
+            prepared_statement_cache_size=app_cfg.DB_PREPARED_STATEMENT_CACHE_SIZE,
+        )
+        WARMUP_CONNECTIONS[replica_of(DB_ADS)] = ads_cfg.ADS_DB_WARMUP_CONNECTIONS
+    # Без переполнения: лишние выгрузки ждут pool_timeout и получают отказ, а
+    # не открывают новые соединения.
+    ENGINES[DB_ADS_EXPORT] = create_pg_engine(
+        DB_ADS_EXPORT,
+        ads_cfg.ADS_DB_EXPORT_URL or ads_cfg.ADS_DB_REPLICA_URL or ads_cfg.ADS_DB_URL,
+        pool_size=ads_cfg.ADS_DB_EXPORT_POOL_SIZE,
+        max_overflow=0,
+        pool_timeout=ads_cfg.ADS_DB_EXPORT_POOL_TIMEOUT,
+        pre_ping=ads_cfg.ADS_DB_POOL_PRE_PING,
+        recycle=ads_cfg.ADS_DB_POOL_RECYCLE,
+        echo=ads_cfg.ADS_DB_ECHO,
+        prepared_statement_cache_size=app_cfg.DB_PREPARED_STATEMENT_CACHE_SIZE,
+    )
+
+    ENGINES[DB_COMPL] = create_pg_engine(
+        DB_COMPL,
+        compl_cfg.COMPL_DB_URL,
+        pool_size=compl_cfg.COMPL_DB_POOL_SIZE,
+        max_overflow=compl_cfg.COMPL_DB_MAX_OVERFLOW,
+        pool_timeout=compl_cfg.COMPL_DB_POOL_TIMEOUT,
+        pre_ping=compl_cfg.COMPL_DB_POOL_PRE_PING,
+        recycle=compl_cfg.COMPL_DB_POOL_RECYCLE,
+        echo=compl_cfg.COMPL_DB_ECHO,
+        prepared_statement_cache_size=app_cfg.DB_PREPARED_STATEMENT_CACHE_SIZE,
+    )
+    WARMUP_CONNECTIONS[DB_COMPL] = compl_cfg.COMPL_DB_WARMUP_CONNECTIONS
+    if compl_cfg.COMPL_DB_REPLICA_URL:
+        ENGINES[replica_of(DB_COMPL)] = create_pg_engine(
+            replica_of(DB_COMPL),
+            compl_cfg.COMPL_DB_REPLICA_URL,
+            pool_size=compl_cfg.COMPL_DB_POOL_SIZE,
+            max_overflow=compl_cfg.COMPL_DB_MAX_OVERFLOW,
+            pool_timeout=compl_cfg.COMPL_DB_POOL_TIMEOUT,
+            pre_ping=compl_cfg.COMPL_DB_POOL_PRE_PING,
+            recycle=compl_cfg.COMPL_DB_POOL_RECYCLE,
+            echo=compl_cfg.COMPL_DB_ECHO,
+            prepared_statement_cache_size=app_cfg.DB_PREPARED_STATEMENT_CACHE_SIZE,
+        )
+        WARMUP_CONNECTIONS[replica_of(DB_COMPL)] = compl_cfg.COMPL_DB_WARMUP_CONNECTIONS
+
+    for name, engine in ENGINES.items():
+        instrument_engine(name, engine)
+        SESSIONS[name] = sessionmaker(
+            bind=engine,
+            expire_on_commit=False,
+            class_=AsyncSession,
+        )
+
+
+def get_sessionmaker(name: str) -> sessionmaker:
+    """Возвращает фабрику сессий базы данных.
+
+    Args:
+        name (str): Имя базы данных (DB_AUTH | DB_ACC | DB_ADS | DB_COMPL).
 
-AsyncComplRepoSession = sessionmaker(
-    bind=create_async_engine(COMPL_URL, echo=True),
-    expire_on_commit=False,
-    class_=AsyncSession,
+    Returns:
+        sessionmaker: Фабрика асинхронных сессий.
+
+    Raises:
+        RuntimeError: Если движки ещё не созданы (lifespan не запущен).
+    """
+    try:
+        return SESSIONS[name]
+    except KeyError as e:
+        raise RuntimeError(f"БД {name} не инициализирована, вызовите init_pg()") from e
+
+
+@asynccontextmanager
+async def session_scope(
+    name: str, readonly: bool = False, replica: bool = False
+) -> AsyncIterator[AsyncSession]:
+    """Открывает сессию с одной транзакцией на единицу работы (запрос).
+
+    Репозитории не фиксируют транзакцию сами: фиксация выполняется один раз при
+    выходе из блока. Бизнес-ошибка ExpError тоже фиксирует транзакцию, чтобы
+    сохранить записи, сделанные до неё (например, счётчик неверных попыток
+    ввода кода). Любое другое исключение откатывает транзакцию.
+
+    Args:
+        name (str): Имя базы данных (DB_AUTH | DB_ACC | DB_ADS | DB_COMPL).
+        readonly (bool): Открыть транзакцию только для чтения.
+        replica (bool): Читать с реплики, если она настроена. Учитывается
+            только вместе с readonly.
+
+    Yields:
+        AsyncSession: Асинхронная сессия базы данных.
+    """
+    if readonly and replica and replica_of(name) in SESSIONS:
+        name = replica_of(name)
+    async with get_sessionmaker(name)() as session:
+        if readonly:
+            await session.connection(execution_options={"postgresql_readonly": True})
+        try:
+            yield session
+        except ExpError:
+            await session.commit()
+            raise
+        except BaseException:
+            await session.rollback()
+            raise
+        await session.commit()
+
+
+async def _warmup_engine(
+    engine: AsyncEngine,
+    count: int,
+    hook: Callable[[AsyncSession], Awaitable[None]] | None,
+) -> None:
+    """Открывает соединения пула и прогревает на них горячие запросы.
+
+    Args:
+        engine (AsyncEngine): Движок базы данных.
+        count (int): Количество открываемых соединений.
+        hook (Callable | None): Корутина, выполняющая горячие запросы в сессии.
+    """
+    count = min(count, engine.pool.size())
+    if count <= 0:
+        return
+
+    results = await asyncio.gather(
+        *(engine.connect() for _ in range(count)), return_exceptions=True
+    )
+    conns: list[AsyncConnection] = [
+        r for r in results if isinstance(r, AsyncConnection)
+    ]
+    try:
+        for err in results:
+            if isinstance(err, BaseException):
+                raise err
+        for conn in conns:
+            if hook is None:
+                await conn.execute(text("SELECT 1"))
+                continue
+            async with AsyncSession(bind=conn) as session:
+                await hook(session)
+            await conn.rollback()
+    finally:
+        for conn in conns:
+            await conn.close()
+
+
+async def warmup_pg(
+    hooks: dict[str, Callable[[AsyncSession], Awaitable[None]]] | None = None,
+) -> None:
+    """Прогревает пулы всех баз данных.
+
+    Соединения открываются заранее и возвращаются в пул, поэтому первые запросы
+    после деплоя не платят за установку соединения и аутентификацию. Хуки
+    выполняют горячие запросы на каждом соединении, заполняя кеш скомпилированных
+    запросов SQLAlchemy и кеш подготовленных выражений asyncpg.
+
+    Ошибки прогрева не прерывают запуск: недоступная БД будет подключена лениво.
+
+    Реплики прогреваются хуком своей основной базы.
+
+    Args:
+        hooks (dict | None): Корутины прогрева горячих запросов по имени БД.
+    """
+    hooks = hooks or {}
+    results = await asyncio.gather(
+        *(
+            _warmup_engine(
+                engine,
+                WARMUP_CONNECTIONS.get(name, 0),
+                hooks.get(name.removesuffix(REPLICA_SUFFIX)),
+            )
+            for name, engine in ENGINES.items()
+        ),
+        return_exceptions=True,
+    )
+    for name, res in zip(ENGINES, results):
+        if isinstance(res, BaseException):
+            print(f"pg warmup {name}: {res!r}")
+
+
+async def close_pg(drain_timeout: float) -> None:
+    """Дожидается возврата соединений в пулы и закрывает движки.
+
+    Args:
+        drain_timeout (float): Максимальное время ожидания незавершённых запросов, сек.
+    """
+    deadline = time.monotonic() + drain_timeout
+    while time.monotonic() < deadline:
+        if all(engine.pool.checkedout() == 0 for engine in ENGINES.values()):
+            break
+        await asyncio.sleep(0.05)
+
+    for engine in ENGINES.values():
+        await engine.dispose()
+    ENGINES.clear()
+    SESSIONS.clear()
+    WARMUP_CONNECTIONS.clear()
+
+
+def get_pool_stats() -> dict[str, dict]:
+    """Возвращает текущее состояние пулов соединений всех движков.
+
+    Returns:
+        dict[str, dict]: Статистика пула по имени базы данных.
+    """
+    res = {}
+    for name, engine in ENGINES.items():
+        pool: StatsQueuePool = engine.pool
+        res[name] = {
+            "pool_size": pool.size(),
+            "max_overflow": pool._max_overflow,  # pylint: disable=protected-access
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": max(pool.overflow(), 0),
+            "checkouts": pool.checkouts,
+            "timeouts": pool.timeouts,
+            "wait_total_ms": round(pool.wait_total * 1000, 3),
+            "wait_avg_ms": round(pool.wait_total * 1000 / pool.checkouts, 3)
+            if pool.checkouts
+            else 0.0,
+            "wait_max_ms": round(pool.wait_max * 1000, 3),
+        }
+    return res
+
+
+def _pool_metric(key: str) -> Callable[[], dict[tuple[str, ...], float]]:
+    """Возвращает функцию чтения одного поля get_pool_stats() по всем пулам."""
+    return lambda: {(name,): stats[key] for name, stats in get_pool_stats().items()}
+
+
+DB_POOL_SIZE = Gauge(
+    "db_pool_size", "Размер пула соединений", ("db",), _pool_metric("pool_size")
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "Выданные из пула соединения",
+    ("db",),
+    _pool_metric("checked_out"),
+)
+DB_POOL_CHECKED_IN = Gauge(
+    "db_pool_checked_in",
+    "Свободные соединения в пуле",
+    ("db",),
+    _pool_metric("checked_in"),
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow",
+    "Соединения сверх pool_size",
+    ("db",),
+    _pool_metric("overflow"),
+)
+DB_POOL_TIMEOUTS = Counter(
+    "db_pool_timeouts_total",
+    "Выдачи соединения, завершившиеся таймаутом пула",
+    ("db",),
+    _pool_metric("timeouts"),
 )
@@ -0,0 +1,75 @@
+import asyncio
+import time
+from typing import Awaitable, Callable
+from uuid import UUID
+
+from sqlalchemy import func, select
+
+from .container import get_container
+from .metrics import Counter
+from .pg import ENGINES
+
+# Шаг сверки: (ключ, после которого начинается пачка; размер пачки) ->
+# (последний ключ пачки; проверено строк; исправлено строк).
+ReconcileStep = Callable[[UUID, int], Awaitable[tuple[UUID | None, int, int]]]
+
+RECONCILE_ROWS = Counter(
+    "counter_reconcile_rows_total",
+    "Строки, проверенные сверкой денормализованных счётчиков",
+    ("counter", "result"),
+)
+
+
+async def reconcile(name: str, db: str, step: ReconcileStep) -> int | None:
+    """Сверяет денормализованный счётчик по всей таблице пачками по ключу.
+
+    Пачки идут по возрастанию ключа, каждая — в своей короткой транзакции
+    шага, с паузой COUNTERS_RECONCILE_PAUSE между ними, поэтому нагрузка на БД
+    ограничена размером пачки. Сверку одного счётчика выполняет один процесс:
+    на время прохода берётся сессионная advisory-блокировка в БД db, процессы,
+    не получившие её, пропускают запуск. При обрыве соединения блокировка
+    снимается сервером.
+
+    Args:
+        name (str): Имя счётчика (ключ блокировки и метка метрик).
+        db (str): Имя БД, в которой берётся блокировка.
+        step (ReconcileStep): Сверяет одну пачку и исправляет расхождения.
+
+    Returns:
+        int | None: Количество исправленных строк или None, если сверку
+            сейчас выполняет другой процесс.
+    """
+    lock_key = func.hashtext(name)
+    async with ENGINES[db].connect() as conn:
+        locked = await conn.scalar(select(func.pg_try_advisory_lock(lock_key)))
+        await conn.commit()
+        if not locked:
+            return None
+        try:
+            return await _run(name, step)
+        finally:
+            await conn.scalar(select(func.pg_advisory_unlock(lock_key)))
+            await conn.commit()
+
+
+async def _run(name: str, step: ReconcileStep) -> int:
+    cfg = get_container().app_cfg
+    start = time.perf_counter()
+    after, checked, fixed = UUID(int=0), 0, 0
+    while True:
+        last, chunk_checked, chunk_fixed = await step(
+            after, cfg.COUNTERS_RECONCILE_CHUNK_SIZE
+        )
+        checked += chunk_checked
+        fixed += chunk_fixed
+        RECONCILE_ROWS.inc(chunk_checked - chunk_fixed, counter=name, result="ok")
+        RECONCILE_ROWS.inc(chunk_fixed, counter=name, result="fixed")
+        if last is None or chunk_checked < cfg.COUNTERS_RECONCILE_CHUNK_SIZE:
+            break
+        after = last
+        await asyncio.sleep(cfg.COUNTERS_RECONCILE_PAUSE)
+    print(
+        f"Сверка счётчика {name}: проверено {checked}, исправлено {fixed}, "
+        f"{time.perf_counter() - start:.1f} с"
+    )
+    return fixed
@@ -0,0 +1,109 @@
+import asyncio
+from typing import Awaitable, Callable
+
+TASKS: dict[str, "PeriodicTask"] = {}
+
+
+class PeriodicTask:
+    """Фоновая задача процесса, выполняемая с заданным интервалом.
+
+    Запуск может быть выполнен раньше срока через wake() (например, при
+    переполнении буфера). При остановке задача по умолчанию выполняется
+    последний раз, чтобы сбросить накопленные данные.
+
+    Attributes:
+        name (str): Имя задачи.
+        interval (float): Интервал между запусками, сек.
+        func (Callable[[], Awaitable]): Выполняемая корутина.
+        run_on_stop (bool): Выполнить задачу при остановке.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        interval: float,
+        func: Callable[[], Awaitable],
+        run_on_stop: bool = True,
+    ):
+        self.name = name
+        self.interval = interval
+        self.func = func
+        self.run_on_stop = run_on_stop
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Запускает цикл задачи в текущем цикле событий."""
+        self._task = asyncio.create_task(self._loop(), name=self.name)
+
+    def wake(self) -> None:
+        """Запрашивает внеочередной запуск задачи."""
+        self._wakeup.set()
+
+    async def _run(self) -> None:
+        try:
+            await self.func()
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            print(f"Фоновая задача {self.name} завершилась с ошибкой: {e!r}")
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self._run()
+
+    async def stop(self) -> None:
+        """Останавливает цикл и, если задано run_on_stop, выполняет задачу."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self.run_on_stop:
+            await self._run()
+
+
+def start_task(
+    name: str,
+    interval: float,
+    func: Callable[[], Awaitable],
+    run_on_stop: bool = True,
+) -> PeriodicTask:
+    """Создаёт и запускает фоновую задачу процесса.
+
+    Args:
+        name (str): Имя задачи.
+        interval (float): Интервал между запусками, сек.
+        func (Callable[[], Awaitable]): Выполняемая корутина.
+        run_on_stop (bool): Выполнить задачу при остановке процесса.
+
+    Returns:
+        PeriodicTask: Запущенная задача.
+    """
+    task = TASKS[name] = PeriodicTask(name, interval, func, run_on_stop)
+    task.start()
+    return task
+
+
+def get_task(name: str) -> PeriodicTask | None:
+    """Возвращает запущенную фоновую задачу по имени.
+
+    Args:
+        name (str): Имя задачи.
+
+    Returns:
+        PeriodicTask | None: Задача или None, если она не запущена.
+    """
+    return TASKS.get(name)
+
+
+async def stop_tasks() -> None:
+    """Останавливает все фоновые задачи, выполняя последний раз задачи с run_on_stop."""
+    for task in list(TASKS.values()):
+        await task.stop()
+    TASKS.clear()
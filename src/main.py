@@ -3,9 +3,32 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, APIRouter, Request
 from fastapi.responses import ORJSONResponse
+from kernel.container import init_container, close_container
 from kernel.exception import ExpError
+from kernel.http import init_http, close_http
+from kernel.metrics import MetricsMiddleware
+from kernel.tasks import stop_tasks
+from kernel.pg import (
+    DB_ACC,
+    DB_ADS,
+    DB_AUTH,
+    DB_COMPL,
+    init_pg,
+    warmup_pg,
+    close_pg,
+)
+
+from account.infra.repo import AccRepo
+from account.internal.reconcile import init_count_ads
+from ads.infra.repo import AdsRepo
+from ads.infra.views import init_views
+from ads.internal.cache import init_ads_cache
+from ads.internal.reconcile import init_comment_counters
+from auth.infra.repo import AuthRepo
+from compl.infra.repo import ComplRepo
 
 services = {
+    "sys.api": ("kernel.api", True),
     "auth.api": ("auth.handler.api", True),
     "acc.api": ("account.handler.api", True),
     "ads.api": ("ads.handler.api", True),
@@ -17,13 +40,40 @@ services = {
 async def lifespan(__app: FastAPI):  # pragma: no cover
     """Обрабатывает события жизненного цикла FastAPI-приложения.
 
+    При запуске создаёт контейнер зависимостей, движки БД, прогревает пулы
+    соединений, создаёт общий HTTP-клиент и запускает фоновые задачи (сброс
+    просмотров, сверку счётчиков), при остановке сбрасывает буферы фоновых задач,
+    дожидается завершения запросов и закрывает соединения.
+
     Args:
         __app (FastAPI): Экземпляр приложения FastAPI.
 
     Yields:
         None: Управление возвращается FastAPI во время работы приложения.
     """
-    yield
+    cfg = init_container().app_cfg
+
+    init_pg()
+    init_http()
+    await warmup_pg(
+        {
+            DB_AUTH: lambda session: AuthRepo(session).warmup(),
+            DB_ACC: lambda session: AccRepo(session).warmup(),
+            DB_ADS: lambda session: AdsRepo(session).warmup(),
+            DB_COMPL: lambda session: ComplRepo(session).warmup(),
+        }
+    )
+    init_views()
+    init_ads_cache()
+    init_comment_counters()
+    init_count_ads()
+    try:
+        yield
+    finally:
+        await stop_tasks()
+        await close_pg(cfg.DB_DRAIN_TIMEOUT)
+        await close_http()
+        close_container()
 
 
 def get_services() -> tuple[list[APIRouter], list[dict]]:  # pragma: no cover
@@ -72,6 +122,8 @@ def create_app() -> FastAPI:  # pragma: no cover
     for router in all_routers:
         __app.include_router(router)
 
+    __app.add_middleware(MetricsMiddleware)
+
     @__app.exception_handler(ExpError)
     async def error_exception_handler(_: Request, exc: ExpError):  # pragma: no cover
         """Обрабатывает HTTP-запрос на перехват пользовательских исключений ExpError."""
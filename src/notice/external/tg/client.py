@@ -1,21 +1,37 @@
 from json import JSONDecodeError
 import httpx
 
+from kernel.metrics import observe_call
+
 
 class TgClient:
     """Клиент для взаимодействия с Telegram Bot API."""
 
-    def __init__(self, token, chat_id: str | int):
+    def __init__(
+        self,
+        token,
+        chat_id: str | int,
+        _client: httpx.AsyncClient,
+        _timeout: float,
+        api_url: str = "https://api.telegram.org",
+    ):
         """Инициализирует клиент Telegram бота.
 
         Args:
             token (str): Токен бота, полученный от @BotFather.
             chat_id (str | int): ID чата/канала для отправки сообщений.
                               Может быть числовым ID или username (для публичных чатов).
+            _client (httpx.AsyncClient): Общий HTTP-клиент процесса.
+            _timeout (float): Таймаут запросов к Telegram API, сек.
+            api_url (str): Базовый URL Telegram Bot API.
         """
         self.token = token
         self.chat_id = chat_id
+        self.client = _client
+        self.timeout = _timeout
+        self.api_url = api_url.rstrip("/")
 
+    @observe_call("tg", "http")
     async def send_message(self, message: str) -> dict:
         """Отправляет форматированное сообщение в Telegram чат.
 
@@ -32,14 +48,13 @@ class TgClient:
                       - API вернуло статус ошибки
             httpx.RequestError: Если произошла сетевая ошибка при запросе.
         """
-        url = f"https://api.telegram.org/bot{self.token}/sendMessage"
+        url = f"{self.api_url}/bot{self.token}/sendMessage"
         params = {
             "chat_id": self.chat_id,
             "text": message.replace("<br />", ""),
             "parse_mode": "HTML",
         }
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=params)
+        response = await self.client.post(url, json=params, timeout=self.timeout)
 
         try:
             res = response.json()
@@ -0,0 +1,51 @@
+"""Разовая сверка денормализованных счётчиков.
+
+Выполняет тот же проход, что и фоновые задачи приложения: AdsStats.count_comments
+по AdsComment и Account.count_ads по объявлениям аккаунта, пачками по
+COUNTERS_RECONCILE_CHUNK_SIZE. Печатает количество исправленных счётчиков в
+JSON; если сверку сейчас выполняет воркер приложения, счётчик пропускается
+(null). Нужны переменные окружения приложения:
+
+    cd src && python reconcile_counters.py
+    cd src && python reconcile_counters.py --only ads_count_comments
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+
+from account.internal.reconcile import COUNT_ADS, reconcile_count_ads
+from ads.internal.reconcile import COMMENT_COUNTERS, reconcile_comment_counters
+from kernel.container import init_container, close_container
+from kernel.http import init_http, close_http
+from kernel.pg import init_pg, close_pg
+
+COUNTERS = {
+    COMMENT_COUNTERS: reconcile_comment_counters,
+    COUNT_ADS: reconcile_count_ads,
+}
+
+
+async def main(args: argparse.Namespace) -> int:
+    """Сверяет выбранные счётчики и печатает отчёт."""
+    init_container()
+    init_pg()
+    init_http()
+    try:
+        report = {}
+        for name, func in COUNTERS.items():
+            if args.only in (None, name):
+                report[name] = await func()
+    finally:
+        await close_pg(0)
+        await close_http()
+        close_container()
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--only", choices=list(COUNTERS), help="один счётчик")
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,103 @@
+import asyncio
+from typing import AsyncIterator
+
+import pytest
+
+from ads.internal import importer
+from ads.internal.importer import _csv_rows, iter_lines
+
+
+async def _chunks(data: list[bytes]) -> AsyncIterator[bytes]:
+    for chunk in data:
+        yield chunk
+
+
+def _lines(*data: bytes) -> list[str]:
+    async def collect():
+        return [line async for line in iter_lines(_chunks(list(data)))]
+
+    return asyncio.run(collect())
+
+
+def _rows(*data: bytes) -> list[tuple[int, dict]]:
+    async def collect():
+        return [row async for row in _csv_rows(iter_lines(_chunks(list(data))))]
+
+    return asyncio.run(collect())
+
+
+def test_iter_lines_joins_chunks():
+    assert _lines(b"ab", b"c\nd", b"e\n\nf") == ["abc\n", "de\n", "\n", "f"]
+
+
+def test_iter_lines_splits_multibyte_char():
+    data = "привет\nмир\n".encode()
+    assert _lines(data[:3], data[3:]) == ["привет\n", "мир\n"]
+
+
+def test_iter_lines_strips_bom():
+    assert _lines(b"\xef\xbb", b"\xbftitle\n") == ["title\n"]
+
+
+def test_iter_lines_rejects_invalid_utf8():
+    with pytest.raises(ValueError):
+        _lines(b"\xff\n")
+
+
+def test_iter_lines_rejects_long_line(monkeypatch):
+    monkeypatch.setattr(importer, "MAX_LINE_SIZE", 8)
+    with pytest.raises(ValueError):
+        _lines(b"x" * 5, b"x" * 5)
+
+
+def test_csv_rows_stray_quote_in_unquoted_field():
+    data = b'title,price\nTV 27" screen,100\nRadio,5\n'
+    assert _rows(data) == [
+        (2, {"title": 'TV 27" screen', "price": "100"}),
+        (3, {"title": "Radio", "price": "5"}),
+    ]
+
+
+def test_csv_rows_multiline_quoted_field():
+    data = b'title,description\n"A","one\ntwo, ""three""\n"\nB,x\n'
+    assert _rows(data) == [
+        (2, {"title": "A", "description": 'one\ntwo, "three"\n'}),
+        (5, {"title": "B", "description": "x"}),
+    ]
+
+
+def test_csv_rows_quote_after_closed_quoted_field():
+    data = b'title,price\n"TV"27" screen,100\n'
+    assert _rows(data) == [(2, {"title": 'TV27" screen', "price": "100"})]
+
+
+def test_csv_rows_bom_header():
+    assert _rows(b"\xef\xbb\xbftitle,price\r\nA,1\r\n") == [
+        (2, {"title": "A", "price": "1"})
+    ]
+
+
+def test_csv_rows_without_trailing_newline():
+    assert _rows(b"title,price\nA,1\nB,2") == [
+        (2, {"title": "A", "price": "1"}),
+        (3, {"title": "B", "price": "2"}),
+    ]
+
+
+def test_csv_rows_empty_fields_and_lines():
+    data = b'title,ads_category,price\n\nA,,5\nB,"",\n'
+    assert _rows(data) == [
+        (3, {"title": "A", "price": "5"}),
+        (4, {"title": "B"}),
+    ]
+
+
+def test_csv_rows_unclosed_quote():
+    with pytest.raises(ValueError, match="строки 2"):
+        _rows(b'title\n"A\nB\n')
+
+
+def test_csv_rows_long_record(monkeypatch):
+    monkeypatch.setattr(importer, "MAX_LINE_SIZE", 16)
+    with pytest.raises(ValueError, match="строки 2"):
+        _rows(b'title\n"' + b"x\n" * 10)